@@ -2,50 +2,51 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
-import sqlite3
-
 import geopandas
 import pandas as pd
 
-from utils import collection_utils, time_utils
+from input_database import InputDatabase
+from utils import sql_utils, time_utils
 
 
 # pylint: disable=too-many-instance-attributes
 class DataInterface:
-    def __init__(self, id_scenario, scenario_options, id_region):
+    # pylint: disable=too-many-arguments
+    def __init__(self, id_scenario, scenario_options, id_region, reference_data, tables=None, input_database=None):
         self.id_scenario = id_scenario
         self._scenario_options = scenario_options
         self.id_region = id_region
 
-        connection = sqlite3.connect('./input/input.sqlite')
-        with connection:
-            self.energy_carrier_data = self._read_energy_carrier_data(connection)
-
-            id_product_filter = self._scenario_options['id_product_filter']
-            self.site_data = self._read_site_data(connection)
-            site_ids = self._get_site_ids()
-
-            self.production_unit_mapping = self._read_production_unit_mapping_and_delete_unused_sites(
-                site_ids, connection, id_product_filter
-            )
-
-            self.product_process_mapping = self._read_product_process_mapping(connection, id_product_filter)
-
-            self.process_energy_carrier_mapping = self._read_process_energy_carrier_mapping(
-                connection, id_product_filter
-            )
-
-            self.process_steam_mapping = self._read_process_steam_mapping(connection, id_product_filter)
-
-            self.process_feedstock_mapping = self._read_process_feedstock_mapping(connection, id_product_filter)
-
-            self.energy_carrier_cost_mapping = self._read_energy_carrier_cost_mapping(connection)
-            self.energy_carrier_emission_mapping = self._read_energy_carrier_emission_mapping(connection)
-            self.region_energy_carrier_availability_mapping = self._read_region_energy_carrier_availability_mapping(
-                connection
-            )
-            self.region_energy_carrier_subsidies = self._read_region_energy_carrier_subsidies(connection)
-            self.region_energy_carrier_taxes = self._read_region_energy_carrier_taxes(connection)
+        # The global tables are shared by all regions; see reference_data.py
+        self.energy_carrier_data = reference_data.energy_carrier_data
+        self.product_process_mapping = reference_data.product_process_mapping
+        self.process_energy_carrier_mapping = reference_data.process_energy_carrier_mapping
+        self.process_steam_mapping = reference_data.process_steam_mapping
+        self.process_feedstock_mapping = reference_data.process_feedstock_mapping
+        self.energy_carrier_cost_mapping = reference_data.energy_carrier_cost_mapping
+        self.energy_carrier_emission_mapping = reference_data.energy_carrier_emission_mapping
+        self.region_energy_carrier_availability_mapping = reference_data.region_energy_carrier_availability_mapping
+        self.region_energy_carrier_subsidies = reference_data.region_energy_carrier_subsidies
+        self.region_energy_carrier_taxes = reference_data.region_energy_carrier_taxes
+
+        if tables is None:
+            if input_database is None:
+                input_database = InputDatabase(scenario_options)
+            tables = self._read_tables(input_database)
+
+        self.site_data = tables['site_data']
+        self.production_unit_mapping = tables['production_unit_mapping']
+
+    @property
+    def tables(self):
+        # The region specific tables; the global tables are provided by reference_data
+        return {
+            'site_data': self.site_data,
+            'production_unit_mapping': self.production_unit_mapping,
+        }
+
+    def number_of_production_units(self):
+        return sum(len(production_unit_df) for production_unit_df in self.production_unit_mapping.values())
 
     def co2_cost_in_euro_per_ton_co2(self, year):
         return time_utils.interpolate(
@@ -55,125 +56,59 @@ class DataInterface:
         )
 
     @staticmethod
-    def _read_energy_carrier_data(connection):
-        query = 'SELECT * from id_energy_carrier'
-        df = pd.read_sql_query(query, connection)
-        return df
-
-    def _read_site_data(self, connection):
-        query = 'SELECT * from site WHERE id_region = ?'
-        df = pd.read_sql_query(query, connection, index_col=['id'], params=(self.id_region,))
-
-        df['geometry'] = geopandas.points_from_xy(df['longitude'], df['latitude'])
-        geo_df = geopandas.GeoDataFrame(df, geometry='geometry')
-
-        return geo_df
-
-    def _get_site_ids(self):
-        return list(self.site_data.apply(lambda row: row.name, axis=1))
-
-    def _read_production_unit_mapping_and_delete_unused_sites(self, site_ids, connection, id_product_filter):
-        is_filtering_products = len(id_product_filter) > 0
-        product_ids = collection_utils.join_with_comma(id_product_filter)
-
-        site_map = {}
-        for id_site in site_ids:
-            query = 'SELECT * from production_unit WHERE id_site = ?'
-
-            if is_filtering_products:
-                query += ' AND id_product IN (' + product_ids + ')'
-
-            df = pd.read_sql_query(query, connection, params=(id_site,))
-            if len(df) > 0:
-                site_map[id_site] = df
-            else:
-                self.site_data = self.site_data.drop(id_site)
-
-        return site_map
+    def site_query():
+        # The sites are ordered by id, so that they are visited in the same order with any product filter
+        return 'SELECT * from site WHERE id_region = ? ORDER BY id'
 
     @staticmethod
-    def _read_product_process_mapping(connection, id_product_filter):
-        is_filtering_products = len(id_product_filter) > 0
-        product_ids = collection_utils.join_with_comma(id_product_filter)
-
-        query = 'SELECT * from product_process_mapping_jrc'
-        if is_filtering_products:
-            query += ' WHERE id_product IN (' + product_ids + ')'
-
-        df = pd.read_sql_query(query, connection, index_col=['id_product', 'id_process'])
-        df = df.sort_index()
-        return df
+    def production_unit_query(id_product_filter):
+        query = (
+            'SELECT production_unit.* from production_unit'
+            ' INNER JOIN site ON production_unit.id_site = site.id'
+            ' WHERE site.id_region = ?'
+        )
 
-    @staticmethod
-    def _read_process_energy_carrier_mapping(connection, id_product_filter):
         is_filtering_products = len(id_product_filter) > 0
-        product_ids = collection_utils.join_with_comma(id_product_filter)
-
-        query = 'SELECT * from process_energy_carrier_mapping_jrc'
         if is_filtering_products:
-            query += ' WHERE id_product IN (' + product_ids + ')'
+            query += ' AND production_unit.id_product IN (' + sql_utils.placeholders(id_product_filter) + ')'
 
-        df = pd.read_sql_query(query, connection, index_col=['id_product', 'id_process'])
-        df = df.sort_index()
-        return df
+        query += ' ORDER BY production_unit.id'
+        return query
 
-    @staticmethod
-    def _read_process_feedstock_mapping(connection, id_product_filter):
-        is_filtering_products = len(id_product_filter) > 0
-        product_ids = collection_utils.join_with_comma(id_product_filter)
-
-        query = 'SELECT * from process_feedstock_mapping_jrc'
-        if is_filtering_products:
-            query += ' WHERE id_product IN (' + product_ids + ')'
+    def _read_tables(self, input_database):
+        connection = input_database.connect()
+        with connection:
+            id_product_filter = self._scenario_options['id_product_filter']
+            self.site_data = self._read_site_data(connection)
 
-        df = pd.read_sql_query(query, connection, index_col=['id_product', 'id_process'])
-        df = df.sort_index()
-        return df
+            production_unit_mapping = self._read_production_unit_mapping_and_delete_unused_sites(
+                connection, id_product_filter
+            )
+        return {
+            'site_data': self.site_data,
+            'production_unit_mapping': production_unit_mapping,
+        }
 
-    @staticmethod
-    def _read_process_steam_mapping(connection, id_product_filter):
-        is_filtering_products = len(id_product_filter) > 0
-        product_ids = collection_utils.join_with_comma(id_product_filter)
+    def _read_site_data(self, connection):
+        query = self.site_query()
+        df = pd.read_sql_query(query, connection, index_col=['id'], params=(self.id_region,))
 
-        query = 'SELECT * from process_steam_mapping_jrc'
-        if is_filtering_products:
-            query += ' WHERE id_product IN (' + product_ids + ')'
+        df['geometry'] = geopandas.points_from_xy(df['longitude'], df['latitude'])
+        geo_df = geopandas.GeoDataFrame(df, geometry='geometry')
 
-        df = pd.read_sql_query(query, connection, index_col=['id_product', 'id_process'])
-        df = df.sort_index()
-        return df
+        return geo_df
 
-    @staticmethod
-    def _read_energy_carrier_cost_mapping(connection):
-        query = 'SELECT * from energy_carrier_cost'
-        df = pd.read_sql_query(query, connection, index_col=['id_scenario', 'id_region', 'id_energy_carrier'])
-        df = df.sort_index()
-        return df
+    def _read_production_unit_mapping_and_delete_unused_sites(self, connection, id_product_filter):
+        # Reads the production units of all sites of the region with a single query
+        # and removes the sites without (filtered) production units
+        query = self.production_unit_query(id_product_filter)
+        params = [self.id_region, *id_product_filter]
 
-    @staticmethod
-    def _read_energy_carrier_emission_mapping(connection):
-        query = 'SELECT * from energy_carrier_emission'
-        df = pd.read_sql_query(query, connection, index_col=['id_scenario', 'id_region', 'id_energy_carrier'])
-        df = df.sort_index()
-        return df
+        df = pd.read_sql_query(query, connection, params=params)
 
-    @staticmethod
-    def _read_region_energy_carrier_availability_mapping(connection):
-        query = 'SELECT * from region_energy_carrier_availability_mapping'
-        df = pd.read_sql_query(query, connection, index_col=['id_scenario', 'id_region', 'id_energy_carrier'])
-        df = df.sort_index()
-        return df
+        site_map = {id_site: site_df.reset_index(drop=True) for id_site, site_df in df.groupby('id_site', sort=False)}
 
-    @staticmethod
-    def _read_region_energy_carrier_subsidies(connection):
-        query = 'SELECT * from energy_carrier_subsidies'
-        df = pd.read_sql_query(query, connection, index_col=['id_scenario', 'id_region', 'id_energy_carrier'])
-        df = df.sort_index()
-        return df
+        is_used_site = self.site_data.index.isin(list(site_map.keys()))
+        self.site_data = self.site_data[is_used_site]
 
-    @staticmethod
-    def _read_region_energy_carrier_taxes(connection):
-        query = 'SELECT * from energy_carrier_taxes'
-        df = pd.read_sql_query(query, connection, index_col=['id_scenario', 'id_region', 'id_energy_carrier'])
-        df = df.sort_index()
-        return df
+        return site_map
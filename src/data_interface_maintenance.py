@@ -0,0 +1,186 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import argparse
+import logging
+import sqlite3
+import time
+
+from data_interface import DataInterface
+from reference_data import ReferenceData
+from utils.logging_utils import initialize_logging
+
+# This module is a maintenance entry point for the input database. It inspects the
+# queries that are issued by DataInterface and ReferenceData at startup, creates
+# the indices they need, runs ANALYZE and reports the query plans and timings
+# before and after the migration. Usage (from the project root):
+#
+# python src/data_interface_maintenance.py --database ./input/input.sqlite
+
+
+class IndexAdvisor:
+    def __init__(self, connection, number_of_repetitions=5):
+        self._connection = connection
+        self._number_of_repetitions = number_of_repetitions
+
+    def recommended_indices(self):
+        # Covering indices for the filter columns of the startup queries; the integer primary key
+        # (rowid) of production_unit is part of every index implicitly
+        production_unit_columns = [
+            'id_site',
+            'id_product',
+            'id_process',
+            'production_in_tons',
+            'year_of_last_reinvestment',
+        ]
+        indices = {
+            'index_site_id_region': ('site', ['id_region']),
+            'index_production_unit_id_site': ('production_unit', production_unit_columns),
+            'index_production_unit_id_product': ('production_unit', ['id_product', 'id_site']),
+        }
+        for table_name, column_names in ReferenceData.SCENARIO_REGION_TABLE_COLUMNS.items():
+            index_name = 'index_' + table_name + '_id_scenario_id_region'
+            indices[index_name] = (table_name, ReferenceData.SCENARIO_REGION_INDEX_COLUMNS + column_names)
+        return indices
+
+    def query_shapes(self):
+        # Returns the startup queries together with representative parameters
+        id_region = self._region_with_most_sites()
+        id_product = self._product_with_most_production_units()
+        id_scenario = self._first_scenario()
+
+        shapes = {
+            'site': (DataInterface.site_query(), [id_region]),
+            'production_unit': (DataInterface.production_unit_query([]), [id_region]),
+            'production_unit_by_product': (
+                DataInterface.production_unit_query([id_product]),
+                [id_region, id_product],
+            ),
+        }
+        for table_name in ReferenceData.SCENARIO_REGION_TABLE_COLUMNS:
+            query = ReferenceData.scenario_region_query(table_name, [id_region])
+            shapes[table_name] = (query, [id_scenario, id_region])
+        return shapes
+
+    def missing_indices(self):
+        return {
+            index_name: (table_name, column_names)
+            for index_name, (table_name, column_names) in self.recommended_indices().items()
+            if not self._has_index(table_name, column_names)
+        }
+
+    def create_missing_indices(self):
+        missing_indices = self.missing_indices()
+        with self._connection:
+            for index_name, (table_name, column_names) in missing_indices.items():
+                logging.info('Creating index %s on %s(%s)', index_name, table_name, ', '.join(column_names))
+                query = 'CREATE INDEX IF NOT EXISTS ' + index_name + ' ON ' + table_name
+                query += ' (' + ', '.join(column_names) + ')'
+                self._connection.execute(query)
+            self._connection.execute('ANALYZE')
+        return missing_indices
+
+    def query_report(self):
+        report = {}
+        for name, (query, params) in self.query_shapes().items():
+            report[name] = {
+                'plan': self.query_plan(query, params),
+                'time_in_ms': self.query_time_in_ms(query, params),
+            }
+        return report
+
+    def query_plan(self, query, params):
+        rows = self._connection.execute('EXPLAIN QUERY PLAN ' + query, params).fetchall()
+        return [row[-1] for row in rows]
+
+    def query_time_in_ms(self, query, params):
+        # Returns the fastest of several repetitions to reduce the influence of caching and noise
+        times = []
+        for _ in range(self._number_of_repetitions):
+            start = time.perf_counter()
+            self._connection.execute(query, params).fetchall()
+            times.append((time.perf_counter() - start) * 1000)
+        return min(times)
+
+    def report(self):
+        # Logs the missing indices and the current query plans without changing the database
+        missing_indices = self.missing_indices()
+        for index_name, (table_name, column_names) in missing_indices.items():
+            logging.info('Missing index %s on %s(%s)', index_name, table_name, ', '.join(column_names))
+
+        query_report = self.query_report()
+        for name, entry in query_report.items():
+            logging.info('%s: %.3f ms', name, entry['time_in_ms'])
+            logging.info('  plan: %s', ' | '.join(entry['plan']))
+        return missing_indices, query_report
+
+    def migrate(self):
+        report_before = self.query_report()
+        created_indices = self.create_missing_indices()
+        report_after = self.query_report()
+        self._log_report(report_before, report_after)
+        return created_indices, report_before, report_after
+
+    def _has_index(self, table_name, column_names):
+        # An existing index is sufficient if its columns start with the recommended columns
+        index_list = self._connection.execute('PRAGMA index_list(' + table_name + ')').fetchall()
+        for index_entry in index_list:
+            index_name = index_entry[1]
+            index_info = self._connection.execute('PRAGMA index_info(' + index_name + ')').fetchall()
+            index_column_names = [entry[2] for entry in index_info]
+            if index_column_names[: len(column_names)] == column_names:
+                return True
+        return False
+
+    def _region_with_most_sites(self):
+        query = 'SELECT id_region from site GROUP BY id_region ORDER BY count(*) DESC, id_region LIMIT 1'
+        return self._first_value(query)
+
+    def _product_with_most_production_units(self):
+        query = 'SELECT id_product from production_unit GROUP BY id_product ORDER BY count(*) DESC, id_product LIMIT 1'
+        return self._first_value(query)
+
+    def _first_scenario(self):
+        return self._first_value('SELECT min(id) from id_scenario')
+
+    def _first_value(self, query):
+        row = self._connection.execute(query).fetchone()
+        if row is None:
+            return None
+        return row[0]
+
+    @staticmethod
+    def _log_report(report_before, report_after):
+        for name, entry_before in report_before.items():
+            entry_after = report_after[name]
+            logging.info(
+                '%s: %.3f ms => %.3f ms',
+                name,
+                entry_before['time_in_ms'],
+                entry_after['time_in_ms'],
+            )
+            logging.info('  plan before: %s', ' | '.join(entry_before['plan']))
+            logging.info('  plan after:  %s', ' | '.join(entry_after['plan']))
+
+
+def main(arguments=None):
+    initialize_logging()
+    parser = argparse.ArgumentParser(description='Creates the indices required by the startup queries.')
+    parser.add_argument('--database', default='./input/input.sqlite')
+    parser.add_argument('--dry-run', action='store_true', help='only report the missing indices and query plans')
+    parsed_arguments = parser.parse_args(arguments)
+
+    connection = sqlite3.connect(parsed_arguments.database)
+    try:
+        index_advisor = IndexAdvisor(connection)
+        if parsed_arguments.dry_run:
+            index_advisor.report()
+        else:
+            index_advisor.migrate()
+    finally:
+        connection.close()
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -6,7 +6,7 @@ from utils.time_utils import exponential_decrease, interpolate, interpolate_cost
 
 
 class EnergyCarrier:
-    def __init__(self, id_energy_carrier, name, data):
+    def __init__(self, id_energy_carrier, name, data, curves=None):
         self.id = id_energy_carrier
         self._name = name
         self._cost_2015_in_euro_per_gj = data['cost_2015_in_euro_per_gj']
@@ -22,7 +22,22 @@ class EnergyCarrier:
         self._taxes_2015_in_euro_per_gj = data['taxes_2015_in_euro_per_gj']
         self._taxes_2050_in_euro_per_gj = data['taxes_2050_in_euro_per_gj']
 
+        # Precomputed values for the years of the time span (see EnergyCarrierCurves); other years
+        # are calculated on demand
+        self._year_positions = {}
+        if curves is not None:
+            self._year_positions = curves.year_positions
+            energy_carrier_curves = curves.curves_of_energy_carrier(id_energy_carrier)
+            self._cost_curve = energy_carrier_curves['cost_in_euro_per_gj']
+            self._emission_curve = energy_carrier_curves['emission_in_ton_per_gj']
+            self._availability_curve = energy_carrier_curves['availability_in_gj']
+            self._subsidies_curve = energy_carrier_curves['subsidies_in_euro_per_gj']
+            self._taxes_curve = energy_carrier_curves['taxes_in_euro_per_gj']
+
     def cost_in_euro_per_gj(self, year):
+        position = self._year_positions.get(year)
+        if position is not None:
+            return self._cost_curve[position]
         return exponential_decrease(
             year,
             self._cost_2015_in_euro_per_gj,
@@ -31,12 +46,21 @@ class EnergyCarrier:
         )
 
     def emission_in_ton_per_gj(self, year):
+        position = self._year_positions.get(year)
+        if position is not None:
+            return self._emission_curve[position]
         return interpolate(year, self._emission_2015_in_ton_per_gj, self._emission_2050_in_ton_per_gj)
 
     def availability_in_gj(self, year):
+        position = self._year_positions.get(year)
+        if position is not None:
+            return self._availability_curve[position]
         return interpolate(year, self._availability_2015_in_gj, self._availability_2050_in_gj)
 
     def subsidies_in_euro_per_gj(self, year):
+        position = self._year_positions.get(year)
+        if position is not None:
+            return self._subsidies_curve[position]
         return interpolate_cost(
             year,
             self._subsidies_2015_in_euro_per_gj,
@@ -45,4 +69,7 @@ class EnergyCarrier:
         )
 
     def taxes_in_euro_per_gj(self, year):
+        position = self._year_positions.get(year)
+        if position is not None:
+            return self._taxes_curve[position]
         return interpolate(year, self._taxes_2015_in_euro_per_gj, self._taxes_2050_in_euro_per_gj)
@@ -0,0 +1,87 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import numpy as np
+
+from utils.time_utils import exponential_decrease_years, interpolate_cost_years, interpolate_years
+
+
+class EnergyCarrierCurves:
+    # Cost, emission, availability, subsidies and taxes of all energy carriers of a region for the
+    # years of the time span. Each curve is a matrix with one row per energy carrier (in the order of
+    # the EnergyCarrierTable) and one column per year. The values are evaluated once with the year
+    # kernels of time_utils, so that they are identical to the values calculated on demand.
+
+    CURVE_NAMES = [
+        'cost_in_euro_per_gj',
+        'emission_in_ton_per_gj',
+        'availability_in_gj',
+        'subsidies_in_euro_per_gj',
+        'taxes_in_euro_per_gj',
+    ]
+
+    def __init__(self, energy_carrier_table, time_span):
+        self._energy_carrier_table = energy_carrier_table
+        self.years = np.asarray(time_span, dtype=np.int64)
+        self.year_positions = {year: position for position, year in enumerate(self.years.tolist())}
+        self._matrices = self._evaluate_curves()
+
+    def matrix(self, curve_name):
+        return self._matrices[curve_name]
+
+    def curves_of_energy_carrier(self, id_energy_carrier):
+        position = self._energy_carrier_table.position(id_energy_carrier)
+        return {curve_name: matrix[position] for curve_name, matrix in self._matrices.items()}
+
+    def _evaluate_curves(self):
+        years = self.years
+        column = self._energy_carrier_table.column
+
+        # Curves that are not defined for some carriers (e.g. zero costs in 2015) contain nan,
+        # like the values calculated on demand
+        with np.errstate(divide='ignore', invalid='ignore'):
+            matrices = {
+                'cost_in_euro_per_gj': self._evaluate(
+                    exponential_decrease_years,
+                    years,
+                    column('cost_2015_in_euro_per_gj'),
+                    column('cost_2030_in_euro_per_gj'),
+                    column('cost_2050_in_euro_per_gj'),
+                ),
+                'emission_in_ton_per_gj': self._evaluate(
+                    interpolate_years,
+                    years,
+                    column('emission_2015_in_ton_per_gj'),
+                    column('emission_2050_in_ton_per_gj'),
+                ),
+                'availability_in_gj': self._evaluate(
+                    interpolate_years,
+                    years,
+                    column('availability_2015_in_gj'),
+                    column('availability_2050_in_gj'),
+                ),
+                'subsidies_in_euro_per_gj': self._evaluate(
+                    interpolate_cost_years,
+                    years,
+                    column('subsidies_2015_in_euro_per_gj'),
+                    column('subsidies_2030_in_euro_per_gj'),
+                    column('subsidies_2050_in_euro_per_gj'),
+                ),
+                'taxes_in_euro_per_gj': self._evaluate(
+                    interpolate_years,
+                    years,
+                    column('taxes_2015_in_euro_per_gj'),
+                    column('taxes_2050_in_euro_per_gj'),
+                ),
+            }
+        return matrices
+
+    @staticmethod
+    def _evaluate(curve_kernel, years, *columns):
+        number_of_energy_carriers = len(columns[0])
+        matrix = np.empty((number_of_energy_carriers, len(years)), dtype=np.float64)
+        for position in range(number_of_energy_carriers):
+            values = [column[position] for column in columns]
+            matrix[position] = curve_kernel(years, *values)
+        return matrix
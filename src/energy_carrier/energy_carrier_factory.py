@@ -2,7 +2,11 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import pandas as pd
+
 from energy_carrier.energy_carrier import EnergyCarrier
+from energy_carrier.energy_carrier_curves import EnergyCarrierCurves
+from energy_carrier.energy_carrier_table import EnergyCarrierTable
 
 
 class EnergyCarrierFactory:
@@ -16,64 +20,59 @@ class EnergyCarrierFactory:
         self._region_energy_carrier_subsidies_mapping = data_interface.region_energy_carrier_subsidies
         self._region_energy_carrier_taxes_mapping = data_interface.region_energy_carrier_taxes
 
-    def create_energy_carrier_map(self):
+    def create_energy_carrier_map(self, energy_carrier_table=None, energy_carrier_curves=None):
+        if energy_carrier_table is None:
+            energy_carrier_table = self.create_energy_carrier_table()
+
         energy_carrier_map = {}
-        for _, row in self._energy_carrier_data.iterrows():
-            id_energy_carrier = row['id']
-            name = row['name']
-            energy_carrier_map[id_energy_carrier] = self._create_energy_carrier(id_energy_carrier, name)
+        for id_energy_carrier, name in zip(
+            energy_carrier_table.energy_carrier_ids.tolist(),
+            energy_carrier_table.names,
+            strict=True,
+        ):
+            data = energy_carrier_table.data(id_energy_carrier)
+            energy_carrier_map[id_energy_carrier] = self._create_energy_carrier(
+                id_energy_carrier,
+                name,
+                data,
+                energy_carrier_curves,
+            )
         return energy_carrier_map
 
-    def _create_energy_carrier(self, id_energy_carrier, name):
-        row_cost = self._energy_carrier_cost_mapping.loc[self._id_scenario, self._id_region, id_energy_carrier]
-
-        row_emission = self._energy_carrier_emission_mapping.loc[self._id_scenario, self._id_region, id_energy_carrier]
-
-        row_availability = self._region_energy_carrier_availability_mapping.loc[
-            self._id_scenario,
-            self._id_region,
-            id_energy_carrier,
+    def create_energy_carrier_table(self):
+        # Joins the region specific rows of the five energy carrier tables on id_energy_carrier once;
+        # raises a KeyError if an energy carrier has no entry in one of the tables
+        scenario_and_region = (self._id_scenario, self._id_region)
+        mappings = [
+            self._energy_carrier_cost_mapping,
+            self._energy_carrier_emission_mapping,
+            self._region_energy_carrier_availability_mapping,
+            self._region_energy_carrier_subsidies_mapping,
+            self._region_energy_carrier_taxes_mapping,
         ]
-
-        row_subsidies = self._region_energy_carrier_subsidies_mapping.loc[
-            self._id_scenario,
-            self._id_region,
-            id_energy_carrier,
-        ]
-
-        row_taxes = self._region_energy_carrier_taxes_mapping.loc[self._id_scenario, self._id_region, id_energy_carrier]
-
-        cost_2015_in_euro_per_gj = row_cost['cost_2015_in_euro_per_gj']
-        cost_2030_in_euro_per_gj = row_cost['cost_2030_in_euro_per_gj']
-        cost_2050_in_euro_per_gj = row_cost['cost_2050_in_euro_per_gj']
-
-        emission_2015_in_ton_per_gj = row_emission['emission_2015_in_ton_per_gj']
-        emission_2050_in_ton_per_gj = row_emission['emission_2050_in_ton_per_gj']
-
-        availability_2015_in_gj = row_availability['availability_2015_in_gj']
-        availability_2050_in_gj = row_availability['availability_2050_in_gj']
-
-        subsidies_2015_in_euro_per_gj = row_subsidies['subsidies_2015_in_euro_per_gj']
-        subsidies_2030_in_euro_per_gj = row_subsidies['subsidies_2030_in_euro_per_gj']
-        subsidies_2050_in_euro_per_gj = row_subsidies['subsidies_2050_in_euro_per_gj']
-
-        taxes_2015_in_euro_per_gj = row_taxes['taxes_2015_in_euro_per_gj']
-        taxes_2050_in_euro_per_gj = row_taxes['taxes_2050_in_euro_per_gj']
-
-        data = {
-            'cost_2015_in_euro_per_gj': cost_2015_in_euro_per_gj,
-            'cost_2030_in_euro_per_gj': cost_2030_in_euro_per_gj,
-            'cost_2050_in_euro_per_gj': cost_2050_in_euro_per_gj,
-            'emission_2015_in_ton_per_gj': emission_2015_in_ton_per_gj,
-            'emission_2050_in_ton_per_gj': emission_2050_in_ton_per_gj,
-            'availability_2015_in_gj': availability_2015_in_gj,
-            'availability_2050_in_gj': availability_2050_in_gj,
-            'subsidies_2015_in_euro_per_gj': subsidies_2015_in_euro_per_gj,
-            'subsidies_2030_in_euro_per_gj': subsidies_2030_in_euro_per_gj,
-            'subsidies_2050_in_euro_per_gj': subsidies_2050_in_euro_per_gj,
-            'taxes_2015_in_euro_per_gj': taxes_2015_in_euro_per_gj,
-            'taxes_2050_in_euro_per_gj': taxes_2050_in_euro_per_gj,
-        }
-
-        energy_carrier = EnergyCarrier(id_energy_carrier, name, data)
+        region_mapping_dfs = [mapping.loc[scenario_and_region] for mapping in mappings]
+
+        energy_carrier_ids = list(self._energy_carrier_data['id'])
+        self._check_energy_carrier_entries(energy_carrier_ids, region_mapping_dfs)
+        region_df = pd.concat(region_mapping_dfs, axis=1, join='inner').loc[energy_carrier_ids]
+
+        columns = {column_name: region_df[column_name].to_numpy() for column_name in EnergyCarrierTable.COLUMN_NAMES}
+        energy_carrier_table = EnergyCarrierTable(energy_carrier_ids, self._energy_carrier_data['name'], columns)
+        return energy_carrier_table
+
+    def _check_energy_carrier_entries(self, energy_carrier_ids, region_mapping_dfs):
+        # The concatenation would fill missing entries with nan
+        for id_energy_carrier in energy_carrier_ids:
+            for region_mapping_df in region_mapping_dfs:
+                if id_energy_carrier not in region_mapping_df.index:
+                    raise KeyError((self._id_scenario, self._id_region, id_energy_carrier))
+
+    @staticmethod
+    def create_energy_carrier_curves(energy_carrier_table, time_span):
+        energy_carrier_curves = EnergyCarrierCurves(energy_carrier_table, time_span)
+        return energy_carrier_curves
+
+    @staticmethod
+    def _create_energy_carrier(id_energy_carrier, name, data, energy_carrier_curves=None):
+        energy_carrier = EnergyCarrier(id_energy_carrier, name, data, energy_carrier_curves)
         return energy_carrier
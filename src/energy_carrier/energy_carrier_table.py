@@ -0,0 +1,50 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import numpy as np
+
+
+class EnergyCarrierTable:
+    # Column oriented input data of the energy carriers of a region. Each column is a float array in
+    # the order of energy_carrier_ids, so that vectorized consumers can evaluate all carriers at once.
+
+    COLUMN_NAMES = [
+        'cost_2015_in_euro_per_gj',
+        'cost_2030_in_euro_per_gj',
+        'cost_2050_in_euro_per_gj',
+        'emission_2015_in_ton_per_gj',
+        'emission_2050_in_ton_per_gj',
+        'availability_2015_in_gj',
+        'availability_2050_in_gj',
+        'subsidies_2015_in_euro_per_gj',
+        'subsidies_2030_in_euro_per_gj',
+        'subsidies_2050_in_euro_per_gj',
+        'taxes_2015_in_euro_per_gj',
+        'taxes_2050_in_euro_per_gj',
+    ]
+
+    def __init__(self, energy_carrier_ids, names, columns):
+        self.energy_carrier_ids = np.asarray(energy_carrier_ids, dtype=np.int64)
+        self.names = list(names)
+        self._columns = {
+            column_name: np.asarray(columns[column_name], dtype=np.float64)
+            for column_name in EnergyCarrierTable.COLUMN_NAMES
+        }
+        self._positions = {
+            id_energy_carrier: position for position, id_energy_carrier in enumerate(self.energy_carrier_ids.tolist())
+        }
+
+    def __len__(self):
+        return len(self.energy_carrier_ids)
+
+    def column(self, column_name):
+        return self._columns[column_name]
+
+    def position(self, id_energy_carrier):
+        return self._positions[id_energy_carrier]
+
+    def data(self, id_energy_carrier):
+        # Returns the input data of a single energy carrier, as expected by EnergyCarrier
+        position = self.position(id_energy_carrier)
+        return {column_name: column[position] for column_name, column in self._columns.items()}
@@ -3,11 +3,12 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 from energy_demand.energy_demand import EnergyDemand
+from utils import share_utils
 
 
 class EnergyDemandFactory:
     def __init__(self, data_interface, energy_carriers):
-        self._process_energy_carrier_mapping = data_interface.process_energy_carrier_mapping
+        self._fuel_shares = share_utils.group_shares(data_interface.process_energy_carrier_mapping, 'fuel_share')
         self._energy_carriers = energy_carriers
 
         id_electricity = 1
@@ -23,27 +24,20 @@ class EnergyDemandFactory:
         energy_demands = [EnergyDemand(self.electricity, electricity_demand_in_gj_per_ton)]
 
         if fuel_demand_in_gj_per_ton > 0:
-            try:
-                query = 'id_product==' + str(id_product) + '&id_process==' + str(id_process)
-                fuel_share_entries = self._process_energy_carrier_mapping.query(query)
-            except KeyError as error:
-                message = (
-                    'No feedstock shares for id_product | id_process: ' + str(id_product) + ' | ' + str(id_process)
-                )
-                raise ValueError(message) from error
-
-            for _, row in fuel_share_entries.iterrows():
-                energy_demand = self._create_energy_demand(row, fuel_demand_in_gj_per_ton)
+            energy_carrier_ids, fuel_shares = share_utils.shares_of_process(
+                self._fuel_shares,
+                id_product,
+                id_process,
+            )
+            demands_in_gj_per_ton = fuel_demand_in_gj_per_ton * fuel_shares
+            demand_entries = zip(energy_carrier_ids.tolist(), demands_in_gj_per_ton, strict=True)
+            for id_energy_carrier, demand_in_gj_per_ton in demand_entries:
+                energy_demand = self._create_energy_demand(id_energy_carrier, demand_in_gj_per_ton)
                 energy_demands.append(energy_demand)
 
         return energy_demands
 
-    def _create_energy_demand(self, row, fuel_demand_in_gj_per_ton):
-        id_energy_carrier = row['id_energy_carrier']
+    def _create_energy_demand(self, id_energy_carrier, demand_in_gj_per_ton):
         energy_carrier = self._energy_carriers[id_energy_carrier]
-
-        fuel_share = row['fuel_share']
-        demand_in_gj_per_ton = fuel_demand_in_gj_per_ton * fuel_share
-
         energy_demand = EnergyDemand(energy_carrier, demand_in_gj_per_ton)
         return energy_demand
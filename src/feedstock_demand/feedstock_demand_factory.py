@@ -3,11 +3,12 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 from feedstock_demand.feedstock_demand import FeedstockDemand
+from utils import share_utils
 
 
 class FeedstockDemandFactory:
     def __init__(self, data_interface, energy_carriers):
-        self._process_feedstock_mapping = data_interface.process_feedstock_mapping
+        self._feedstock_shares = share_utils.group_shares(data_interface.process_feedstock_mapping, 'feedstock_share')
         self._energy_carriers = energy_carriers
 
     def create_feedstock_demands(
@@ -19,24 +20,19 @@ class FeedstockDemandFactory:
         feedstock_demands = []
 
         if feedstock_demand_in_gj_per_ton > 0:
-            try:
-                query = 'id_product==' + str(id_product) + '&id_process==' + str(id_process)
-                feedstock_share_entries = self._process_feedstock_mapping.query(query)
-            except KeyError as error:
-                message = 'No fuel shares for id_product | id_process: ' + str(id_product) + ' | ' + str(id_process)
-                raise ValueError(message) from error
-
-            for _, row in feedstock_share_entries.iterrows():
-                feedstock_demand = self._create_feedstock_demand(row, feedstock_demand_in_gj_per_ton)
+            energy_carrier_ids, feedstock_shares = share_utils.shares_of_process(
+                self._feedstock_shares,
+                id_product,
+                id_process,
+            )
+            demands_in_gj_per_ton = feedstock_demand_in_gj_per_ton * feedstock_shares
+            demand_entries = zip(energy_carrier_ids.tolist(), demands_in_gj_per_ton, strict=True)
+            for id_energy_carrier, demand_in_gj_per_ton in demand_entries:
+                feedstock_demand = self._create_feedstock_demand(id_energy_carrier, demand_in_gj_per_ton)
                 feedstock_demands.append(feedstock_demand)
         return feedstock_demands
 
-    def _create_feedstock_demand(self, row, feedstock_demand_in_gj_per_ton):
-        id_energy_carrier = row['id_energy_carrier']
+    def _create_feedstock_demand(self, id_energy_carrier, demand_in_gj_per_ton):
         energy_carrier = self._energy_carriers[id_energy_carrier]
-
-        feedstock_share = row['feedstock_share']
-        feed_demand_in_gj_per_ton = feedstock_demand_in_gj_per_ton * feedstock_share
-
-        feedstock_demand = FeedstockDemand(energy_carrier, feed_demand_in_gj_per_ton)
+        feedstock_demand = FeedstockDemand(energy_carrier, demand_in_gj_per_ton)
         return feedstock_demand
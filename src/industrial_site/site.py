@@ -22,14 +22,32 @@ class Site(Entity):
         pipeline_cost_scaling,
         distance_to_closest_h2_pipeline,
     ):
-        distance_threshold = 50
+        self.process_production_units(
+            self.production_units,
+            year,
+            simulation_mode,
+            co2_cost_in_euro_per_ton_co2,
+            pipeline_cost_scaling,
+            distance_to_closest_h2_pipeline,
+        )
 
-        if distance_to_closest_h2_pipeline is not None:
-            pipelines_are_close = distance_to_closest_h2_pipeline < distance_threshold
-            if pipelines_are_close:
-                pipeline_cost_scaling = 1
+    # pylint: disable=too-many-arguments
+    def process_production_units(
+        self,
+        production_units,
+        year,
+        simulation_mode,
+        co2_cost_in_euro_per_ton_co2,
+        pipeline_cost_scaling,
+        distance_to_closest_h2_pipeline,
+    ):
+        # Processes the given production units of the site, e.g. the units that are due in the year
+        pipeline_cost_scaling = self.pipeline_cost_scaling_of_site(
+            pipeline_cost_scaling,
+            distance_to_closest_h2_pipeline,
+        )
 
-        for production_unit in self.production_units:
+        for production_unit in production_units:
             self._process_production_unit(
                 production_unit,
                 year,
@@ -50,6 +68,31 @@ class Site(Entity):
             number_of_usages += production_units.number_of_process_usages(process)
         return number_of_usages
 
+    def number_of_skipped_wait_evaluations(self):
+        number_of_skipped_evaluations = 0
+        for production_unit in self.production_units:
+            number_of_skipped_evaluations += production_unit.number_of_skipped_wait_evaluations()
+        return number_of_skipped_evaluations
+
+    @staticmethod
+    def pipeline_cost_scaling_of_site(pipeline_cost_scaling, distance_to_closest_h2_pipeline):
+        distance_threshold = 50
+
+        if distance_to_closest_h2_pipeline is not None:
+            pipelines_are_close = distance_to_closest_h2_pipeline < distance_threshold
+            if pipelines_are_close:
+                return 1
+        return pipeline_cost_scaling
+
+    @staticmethod
+    def probability_limit(simulation_mode):
+        if simulation_mode == SimulationMode.MONTE_CARLO:
+            return randint(0, 1)
+        if simulation_mode == SimulationMode.DETERMINISTIC:
+            return 1
+        message = 'Unknown simulation mode'
+        raise ValueError(message)
+
     @staticmethod
     def _process_production_unit(
         production_unit,
@@ -59,27 +102,14 @@ class Site(Entity):
         pipeline_cost_scaling,
         distance_to_closest_h2_pipeline,
     ):
-        if simulation_mode == SimulationMode.MONTE_CARLO:
-            probability_limit = randint(0, 1)
-            production_unit.optimize_process(
-                year,
-                co2_cost_in_euro_per_ton_co2,
-                pipeline_cost_scaling,
-                distance_to_closest_h2_pipeline,
-                probability_limit,
-            )
-        elif simulation_mode == SimulationMode.DETERMINISTIC:
-            probability_limit = 1
-            production_unit.optimize_process(
-                year,
-                co2_cost_in_euro_per_ton_co2,
-                pipeline_cost_scaling,
-                distance_to_closest_h2_pipeline,
-                probability_limit,
-            )
-        else:
-            message = 'Unknown simulation mode'
-            raise ValueError(message)
+        probability_limit = Site.probability_limit(simulation_mode)
+        production_unit.optimize_process(
+            year,
+            co2_cost_in_euro_per_ton_co2,
+            pipeline_cost_scaling,
+            distance_to_closest_h2_pipeline,
+            probability_limit,
+        )
 
     @property
     def process_ids(self):
@@ -18,6 +18,16 @@ class SiteFactory:
         sites = list(self._site_data.apply(self._create_site, axis=1))
         return sites
 
+    def create_process_cost_tensor(self, time_span, energy_carrier_table=None, energy_carrier_curves=None):
+        return self._production_unit_factory.create_process_cost_tensor(
+            time_span,
+            energy_carrier_table,
+            energy_carrier_curves,
+        )
+
+    def create_process_cost_cache(self, maximum_size):
+        return self._production_unit_factory.create_process_cost_cache(maximum_size)
+
     def _create_site(self, row):
         id_site = row.name
         geometry = row['geometry']
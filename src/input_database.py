@@ -0,0 +1,66 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import itertools
+import logging
+import sqlite3
+from pathlib import Path
+
+
+class InputDatabase:
+    # Provides read-only connections to the input database. The file is opened as immutable,
+    # so that sqlite does not need any locks or journal and several loaders can share the
+    # memory mapped pages of the operating system cache.
+    #
+    # Optionally, the whole database is copied into a shared in-memory database once; all
+    # further connections then read from memory.
+    #
+    # Supported scenario options:
+    # 'input_database_path': path of the input database, default './input/input.sqlite'
+    # 'is_copying_input_into_memory': copy the database into memory, default False
+
+    DEFAULT_PATH = './input/input.sqlite'
+    MMAP_SIZE_IN_BYTES = 256 * 1024 * 1024
+    CACHE_SIZE_IN_KIBIBYTES = 64 * 1024
+
+    _memory_database_counter = itertools.count()
+
+    def __init__(self, scenario_options):
+        self.path = scenario_options.get('input_database_path', InputDatabase.DEFAULT_PATH)
+        self._is_copying_into_memory = scenario_options.get('is_copying_input_into_memory', False)
+        self._memory_uri = None
+        self._memory_connection = None
+
+    def connect(self):
+        if self._is_copying_into_memory:
+            return self._connect_to_memory_copy()
+        return self._connect_to_file()
+
+    def _connect_to_file(self):
+        uri = Path(self.path).resolve().as_uri() + '?mode=ro&immutable=1'
+        connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        connection.execute('PRAGMA mmap_size = ' + str(InputDatabase.MMAP_SIZE_IN_BYTES))
+        connection.execute('PRAGMA cache_size = -' + str(InputDatabase.CACHE_SIZE_IN_KIBIBYTES))
+        return connection
+
+    def _connect_to_memory_copy(self):
+        if self._memory_connection is None:
+            self._copy_into_memory()
+        connection = sqlite3.connect(self._memory_uri, uri=True, check_same_thread=False)
+        connection.execute('PRAGMA query_only = 1')
+        return connection
+
+    def _copy_into_memory(self):
+        # The shared in-memory database exists as long as at least one connection to it is open;
+        # the memory connection is kept for that purpose
+        logging.info('Copying input database %s into memory', self.path)
+        number = next(InputDatabase._memory_database_counter)
+        self._memory_uri = 'file:forecast_sites_input_' + str(number) + '?mode=memory&cache=shared'
+        self._memory_connection = sqlite3.connect(self._memory_uri, uri=True, check_same_thread=False)
+
+        file_connection = self._connect_to_file()
+        try:
+            file_connection.backup(self._memory_connection)
+        finally:
+            file_connection.close()
@@ -2,8 +2,11 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
-from mesa_wrapper.mesa_server import MesaServer
+from mesa_wrapper.mesa_batch_runner import MesaBatchRunner
 from region.region_factory import RegionFactory
+from simulation.decision_mode import DecisionMode
+from simulation.execution_mode import ExecutionMode
+from simulation.product_partitioned_simulation import ProductPartitionedSimulation
 from simulation.simulation import Simulation
 from simulation.simulation_mode import SimulationMode
 from utils.logging_utils import initialize_logging
@@ -54,6 +57,15 @@ def main():
         ],
         'simulation_mode': SimulationMode.DETERMINISTIC,
         'is_using_mesa': True,
+        'is_using_mesa_server': True,  # False: headless batch run of the mesa simulation without web UI
+        'agent_execution_mode': ExecutionMode.SEQUENTIAL,  # PROCESS_POOL: step site agents in parallel (batch runs)
+        'is_using_snapshot_cache': True,  # reuses the prepared input tables if input.sqlite and filters are unchanged
+        'region_execution_mode': ExecutionMode.SEQUENTIAL,  # THREAD_POOL or PROCESS_POOL to create regions in parallel
+        'is_using_demand_matrices': False,  # faster process costs from matrix products, may differ in the last digits
+        'decision_mode': DecisionMode.OBJECT,  # VECTORIZED: decisions per product, SCHEDULED: only units that are due
+        'process_cost_cache_size': None,  # maximum number of cached process cost figures, None: no cache
+        'simulation_execution_mode': ExecutionMode.SEQUENTIAL,  # PROCESS_POOL: simulate regions in parallel (no mesa)
+        'is_partitioning_products': False,  # True: simulate each product as parallel partition and merge (no mesa)
     }
 
     start_year = 2022
@@ -65,19 +77,63 @@ def main():
 
 
 def simulate(id_scenario, time_span, scenario_options):
-    region_factory = RegionFactory(id_scenario, scenario_options)
+    if scenario_options.get('is_partitioning_products', False):
+        simulate_product_partitions(id_scenario, time_span, scenario_options)
+        return
+
+    region_factory = RegionFactory(id_scenario, scenario_options, time_span)
     regions = region_factory.create_regions()
 
     visitors = [TabularResultVisitor(), ShapeFileVisitor()]
 
     simulation_mode = scenario_options['simulation_mode']
     if scenario_options['is_using_mesa']:
-        mesa_server = MesaServer(simulation_mode, time_span, regions, visitors)
-        mesa_server.run()
+        if scenario_options.get('is_using_mesa_server', True):
+            # The server is only imported if it is used, so that batch runs do not require mesa_viz_tornado
+            from mesa_wrapper.mesa_server import MesaServer  # noqa: PLC0415
+
+            mesa_server = MesaServer(simulation_mode, time_span, regions, visitors)
+            mesa_server.run()
+        else:
+            mesa_batch_runner = MesaBatchRunner(
+                simulation_mode,
+                time_span,
+                regions,
+                visitors,
+                agent_execution_mode=scenario_options.get('agent_execution_mode', ExecutionMode.SEQUENTIAL),
+                number_of_agent_workers=scenario_options.get('number_of_agent_workers'),
+            )
+            mesa_batch_runner.run()
     else:
-        simulation = Simulation(simulation_mode, time_span, regions, visitors)
+        simulation = Simulation(
+            simulation_mode,
+            time_span,
+            regions,
+            visitors,
+            execution_mode=scenario_options.get('simulation_execution_mode', ExecutionMode.SEQUENTIAL),
+            number_of_workers=scenario_options.get('number_of_simulation_workers'),
+        )
         simulation.run()
 
 
+def simulate_product_partitions(id_scenario, time_span, scenario_options):
+    # The regions are created by the partitions, see ProductPartitionedSimulation
+    if scenario_options['is_using_mesa']:
+        message = 'Product partitions can only be simulated without mesa'
+        raise ValueError(message)
+
+    visitors = [TabularResultVisitor(), ShapeFileVisitor()]
+
+    simulation = ProductPartitionedSimulation(
+        id_scenario,
+        scenario_options,
+        time_span,
+        visitors,
+        execution_mode=scenario_options.get('product_execution_mode', ExecutionMode.PROCESS_POOL),
+        number_of_workers=scenario_options.get('number_of_product_workers'),
+    )
+    simulation.run()
+
+
 if __name__ == '__main__':
     main()  # pragma: no cover
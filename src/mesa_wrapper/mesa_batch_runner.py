@@ -0,0 +1,36 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from mesa_wrapper.mesa_simulation import MesaSimulation
+from simulation.execution_mode import ExecutionMode
+
+
+class MesaBatchRunner:
+    # Runs the MesaSimulation without the visualization server, e.g. for batch jobs on a cluster.
+    # The simulation is stepped like by the server, including the pipelines, the data collector and
+    # the visitors, but mesa_viz_tornado is not imported and no socket is opened.
+
+    def __init__(
+        self,
+        simulation_mode,
+        time_span,
+        regions,
+        visitors,
+        *,
+        agent_execution_mode=ExecutionMode.SEQUENTIAL,
+        number_of_agent_workers=None,
+    ):
+        self.simulation = MesaSimulation(
+            simulation_mode,
+            time_span,
+            regions,
+            visitors,
+            agent_execution_mode=agent_execution_mode,
+            number_of_agent_workers=number_of_agent_workers,
+        )
+
+    def run(self):
+        while self.simulation.running:
+            self.simulation.step()
+        return self.simulation.datacollector
@@ -4,7 +4,6 @@
 
 import pandas as pd
 import random
-from math import asin, cos, pi, sqrt
 from mesa import Model
 from mesa.datacollection import DataCollector
 from mesa_geo import AgentCreator, GeoSpace
@@ -12,7 +11,9 @@ from mesa_geo import AgentCreator, GeoSpace
 from mesa_wrapper.site_agent import SiteAgent
 from mesa_wrapper.time_schedule import TimeSchedule
 from pipelines.pipelines import Pipelines
+from simulation.execution_mode import ExecutionMode
 from simulation.simulation import Simulation
+from utils import geo_utils
 
 
 class MesaSimulation(Simulation, Model):
@@ -24,6 +25,9 @@ class MesaSimulation(Simulation, Model):
         time_span,
         regions,
         visitors,
+        *,
+        agent_execution_mode=ExecutionMode.SEQUENTIAL,
+        number_of_agent_workers=None,
     ):
         Simulation.__init__(
             self,
@@ -36,7 +40,12 @@ class MesaSimulation(Simulation, Model):
 
         # do not rename following model properties; they are required by mesa server
         self.random = random.Random()
-        self.schedule = TimeSchedule(self, time_span)
+        self.schedule = TimeSchedule(
+            self,
+            time_span,
+            execution_mode=agent_execution_mode,
+            number_of_workers=number_of_agent_workers,
+        )
         self.grid = GeoSpace(MesaSimulation.COORDINATE_REFERENCE_SYSTEM)
         self.datacollector = self._create_data_collector()
         self.running = True
@@ -73,6 +82,8 @@ class MesaSimulation(Simulation, Model):
         if not self.running:
             for visitor in self._visitors:
                 visitor.finalize()
+            self._log_skipped_wait_evaluations()
+            self._log_process_cost_cache_statistics()
 
     @property
     def year(self):
@@ -126,39 +137,34 @@ class MesaSimulation(Simulation, Model):
                     relation['distance'] = distance
                     self.pipeline_site_relations.loc[(site.id, pipeline_id)] = relation
 
-    def calculate_km_distance(self, site, line):
-        p = site.geometry
-
-        np = line.interpolate(line.project(p))
-
-        p_coord = p.coords
-        lat1 = p_coord[0][0]
-        lon1 = p_coord[0][1]
-
-        np_coord = np.coords
-        lat2 = np_coord[0][0]
-        lon2 = np_coord[0][1]
-        haversine_d = self.haversine_distance(lat1, lon1, lat2, lon2)
-        return haversine_d
+    @staticmethod
+    def calculate_km_distance(site, line):
+        # Distance between the site and the closest point of the line
+        coordinates, line_offsets = geo_utils.line_coordinates([line])
+        site_coordinates = site.geometry.coords[0]
+        return geo_utils.min_distance_to_lines_in_km(
+            site_coordinates[0],
+            site_coordinates[1],
+            coordinates,
+            line_offsets,
+        )
 
     @staticmethod
     def haversine_distance(lat1, lon1, lat2, lon2):
-        p = pi / 180
-        a = 0.5 - cos((lat2 - lat1) * p) / 2 + cos(lat1 * p) * cos(lat2 * p) * (1 - cos((lon2 - lon1) * p)) / 2
-        return 12742 * asin(sqrt(a))
+        return geo_utils.haversine_distance(lat1, lon1, lat2, lon2)
 
-    def calculate_pipeline_site_distance(self, site, pipeline):
-        line_distances = []
-        line_distances_km = []
+    @staticmethod
+    def calculate_pipeline_site_distance(site, pipeline):
+        # Minimum distance between the site and the lines of the pipeline in km
         geometry = pipeline[1]['geometry']
-
-        for line in geometry.geoms:
-            distance = site.geometry.distance(line)
-            line_distances.append(distance)
-            distance_km = self.calculate_km_distance(site, line)
-            line_distances_km.append(distance_km)
-        min_line_distance_km = min(line_distances_km)
-        return min_line_distance_km
+        coordinates, line_offsets = geo_utils.line_coordinates(list(geometry.geoms))
+        site_coordinates = site.geometry.coords[0]
+        return geo_utils.min_distance_to_lines_in_km(
+            site_coordinates[0],
+            site_coordinates[1],
+            coordinates,
+            line_offsets,
+        )
 
     def update_pipelines(self):
         self.pipelines.update_mode(self.schedule.time)
@@ -22,17 +22,27 @@ class SiteAgent(GeoAgent):
         self.site = site
         self.unique_id = site.id
 
+    def is_due(self):
+        # In SCHEDULED decision mode, this advances the reinvestment scheduler of the region to the year
+        simulation = self.model
+        region = simulation.regions[self.region_id]
+        return region.is_site_due(self.site, simulation.year, simulation.simulation_mode)
+
     def step(self):
         simulation = self.model
         year = simulation.year
         simulation_mode = simulation.simulation_mode
-        co2_cost_in_euro_per_ton_co2 = simulation.regions[self.region_id].co2_cost_in_euro_per_ton_c02(year)
+        region = simulation.regions[self.region_id]
+        if not self.is_due():
+            return
+        co2_cost_in_euro_per_ton_co2 = region.co2_cost_in_euro_per_ton_c02(year)
         if simulation.recognize_pipelines:
             distance_to_closest_h2_pipeline = self.get_distance_to_closest_h2_pipeline()
         else:
             distance_to_closest_h2_pipeline = 0
         pipeline_cost_scaling = self.pipeline_cost_scaling(distance_to_closest_h2_pipeline)
-        self.site.process_year(
+        region.process_site(
+            self.site,
             year,
             simulation_mode,
             co2_cost_in_euro_per_ton_co2,
@@ -40,6 +50,17 @@ class SiteAgent(GeoAgent):
             distance_to_closest_h2_pipeline,
         )
 
+    def decision_state(self):
+        return [production_unit.decision_state() for production_unit in self.site.production_units]
+
+    def apply_decision_state(self, decision_state):
+        # Applies the decisions of a step in another process (see TimeSchedule)
+        for production_unit, production_unit_state in zip(self.site.production_units, decision_state, strict=True):
+            production_unit.apply_decision_state(production_unit_state)
+        simulation = self.model
+        region = simulation.regions[self.region_id]
+        region.reschedule_site(self.site, simulation.year, simulation.simulation_mode)
+
     def pipeline_cost_scaling(self, distance_to_closest_h2_pipeline):
         simulation = self.model
         if simulation.recognize_pipelines:
@@ -2,10 +2,14 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import os
 import random
 
 from mesa.time import SimultaneousActivation
 
+from simulation.execution_mode import ExecutionMode
+from utils import executor_utils
+
 
 class TimeSchedule(SimultaneousActivation):
     """
@@ -17,10 +21,20 @@ class TimeSchedule(SimultaneousActivation):
 
     The time follows the passed time_span list
 
+    With the PROCESS_POOL execution mode, the due agents are stepped in chunks by forked worker
+    processes. The workers return the decision states of the agents, which are applied to the
+    agents of the main process before they advance.
+
     """
 
-    def __init__(self, model, time_span):
+    def __init__(self, model, time_span, *, execution_mode=ExecutionMode.SEQUENTIAL, number_of_workers=None):
         super().__init__(model)
+        if execution_mode not in (ExecutionMode.SEQUENTIAL, ExecutionMode.PROCESS_POOL):
+            message = 'Unsupported execution mode for agent steps: ' + str(execution_mode)
+            raise ValueError(message)
+        executor_utils.check_forked_execution_mode(execution_mode)
+        self._execution_mode = execution_mode
+        self._number_of_workers = number_of_workers
         self._time_span = time_span
         self.random = random.Random()
         if len(time_span) < 1:
@@ -37,8 +51,11 @@ class TimeSchedule(SimultaneousActivation):
             message = 'Next step is not available. End of time span already reached'
             raise StopIteration(message)
 
-        for agent in self._agents:
-            agent.step()
+        if self._execution_mode == ExecutionMode.SEQUENTIAL:
+            for agent in self._agents:
+                agent.step()
+        else:
+            self._step_agents_in_parallel()
 
         for agent in self._agents:
             agent.advance()
@@ -50,3 +67,25 @@ class TimeSchedule(SimultaneousActivation):
             self.time = self._time_span[self.steps]
         else:
             self.model.running = False
+
+    def _step_agents_in_parallel(self):
+        # The due agents are determined in the main process, so that the workers inherit the state of
+        # the year; the chunks keep the order of the agents
+        agents = [agent for agent in self._agents if agent.is_due()]
+        number_of_workers = self._number_of_workers or os.cpu_count()
+        chunks = executor_utils.balanced_shards(list(range(len(agents))), lambda _position: 1, number_of_workers)
+        if len(chunks) == 0:
+            return
+
+        chunk_states = executor_utils.map_in_forked_workers(TimeSchedule._step_chunk, chunks, agents)
+
+        for chunk, decision_states in zip(chunks, chunk_states, strict=True):
+            for position, decision_state in zip(chunk, decision_states, strict=True):
+                agents[position].apply_decision_state(decision_state)
+
+    @staticmethod
+    def _step_chunk(due_agents, positions):
+        agents = [due_agents[position] for position in positions]
+        for agent in agents:
+            agent.step()
+        return [agent.decision_state() for agent in agents]
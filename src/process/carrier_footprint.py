@@ -0,0 +1,67 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from types import MappingProxyType
+
+import numpy as np
+
+
+class CarrierFootprint:
+    # Energy carriers used by a process, evaluated once from its energy, steam and feedstock demands.
+    #
+    # The availability check covers the energy carriers of the energy demands. The demand of such a
+    # carrier includes the steam and feedstock demands of the same carrier (see
+    # ProductionUnit.check_energy_availability); carriers that are only used for steam or feedstock
+    # are not checked.
+
+    def __init__(self, energy_demands, feedstock_demands, steam_demands):
+        energy_carriers = []
+        demands = []
+        for energy_demand in energy_demands:
+            energy_carrier = energy_demand.energy_carrier
+            demand = energy_demand.demand_in_gj_per_ton
+
+            for feedstock_demand in feedstock_demands:
+                if energy_carrier == feedstock_demand.energy_carrier:
+                    demand += feedstock_demand.feedstock_demand_in_gj_per_ton
+
+            for steam_demand in steam_demands:
+                if energy_carrier == steam_demand.energy_carrier:
+                    demand += steam_demand.steam_demand_in_gj_per_ton
+
+            energy_carriers.append(energy_carrier)
+            demands.append(demand)
+
+        self.energy_carriers = tuple(energy_carriers)
+        self.demands_in_gj_per_ton = np.array(demands, dtype=np.float64)
+        self.demands_in_gj_per_ton.flags.writeable = False
+        self._demand_in_gj_per_ton_by_energy_carrier = dict(zip(energy_carriers, demands, strict=True))
+        self.energy_carrier_ids = frozenset(
+            demand.get_energy_carrier_id() for demand in [*energy_demands, *steam_demands, *feedstock_demands]
+        )
+
+        # The availabilities of the carriers only depend on the year
+        self._availabilities_by_year = {}
+
+    @property
+    def demand_in_gj_per_ton_by_energy_carrier(self):
+        return MappingProxyType(self._demand_in_gj_per_ton_by_energy_carrier)
+
+    def is_using(self, id_energy_carrier):
+        return id_energy_carrier in self.energy_carrier_ids
+
+    def availabilities_in_gj(self, year):
+        availabilities = self._availabilities_by_year.get(year)
+        if availabilities is None:
+            availabilities = np.array(
+                [energy_carrier.availability_in_gj(year) for energy_carrier in self.energy_carriers],
+                dtype=np.float64,
+            )
+            availabilities.flags.writeable = False
+            self._availabilities_by_year[year] = availabilities
+        return availabilities
+
+    def is_available(self, year, production_in_tons):
+        # The energy is not available if the availability of a carrier does not exceed the demand
+        return not (self.availabilities_in_gj(year) <= self.demands_in_gj_per_ton * production_in_tons).any()
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 from entity import Entity
+from process.carrier_footprint import CarrierFootprint
 from utils.collection_utils import object_sum
 from utils.time_utils import interpolate
 
@@ -30,10 +31,37 @@ class Process(Entity):
         self._investment_funding_2050 = data['investment_funding_2050']
         self._investment_flexibility_2015 = data['investment_flexibility_2015']
         self._investment_flexibility_2050 = data['investment_flexibility_2050']
+        self.carrier_footprint = CarrierFootprint(self.energy_demands, self.feedstock_demands, self.steam_demands)
+
+        # Precomputed values for the years of the time span (see ProcessCostTensor); other years
+        # are calculated on demand
+        self._year_positions = {}
+        self._cost_rows = {}
+        # Optional ProcessCostCache shared by the processes of the region
+        self._cost_cache = None
 
     def accept(self, visitor, year):
         visitor.visit_process(self, year)
 
+    def cost_tensor_rows(self, years):
+        # Returns the values of the quantities of ProcessCostTensor.QUANTITY_NAMES for the given years
+        quantity_functions = [
+            self.annuity_on_investment_per_ton,
+            self.opex_in_euro_per_ton,
+            self.energy_carrier_cost_in_euro_per_ton,
+            self._energy_carrier_subsidies_in_euro_per_ton,
+            self._energy_carrier_taxes_in_euro_per_ton,
+            self.energy_emissions_in_ton_co2_per_ton,
+        ]
+        return [[quantity_function(year) for year in years] for quantity_function in quantity_functions]
+
+    def use_cost_tensor(self, cost_tensor, process_position):
+        self._cost_rows = cost_tensor.rows_of_process(process_position)
+        self._year_positions = cost_tensor.year_positions
+
+    def use_cost_cache(self, cost_cache):
+        self._cost_cache = cost_cache
+
     def production_cost_in_euro(
         self,
         year,
@@ -41,17 +69,36 @@ class Process(Entity):
         co2_cost_in_euro_per_ton_c02,
         pipeline_cost_scaling,
     ):
+        base_cost, pipeline_cost = self.production_cost_parts_in_euro(
+            year,
+            production_in_tons,
+            co2_cost_in_euro_per_ton_c02,
+            pipeline_cost_scaling,
+        )
+        return pipeline_cost + base_cost
+
+    def production_cost_parts_in_euro(
+        self,
+        year,
+        production_in_tons,
+        co2_cost_in_euro_per_ton_c02,
+        pipeline_cost_scaling,
+    ):
+        # Returns the pipeline independent part of the production cost and the pipeline cost. The
+        # pipeline cost is 1 for processes without hydrogen, so the production cost without pipelines
+        # is 1 + base cost.
         hydrogen = 15
-        if hydrogen in self.used_energy_carriers():
+        if self.carrier_footprint.is_using(hydrogen):
             pipeline_cost = pipeline_cost_scaling
         else:
             pipeline_cost = 1
 
-        return pipeline_cost + production_in_tons * (
+        base_cost = production_in_tons * (
             self.production_cost_in_euro_per_ton(year)
             + (self.process_emission_in_ton_co2_per_ton + self.energy_emissions_in_ton_co2_per_ton(year))
             * co2_cost_in_euro_per_ton_c02
         )
+        return base_cost, pipeline_cost
 
     def emission_cost_in_euro_per_ton(self, year, co2_cost_in_euro_per_ton_c02):
         return (
@@ -59,11 +106,7 @@ class Process(Entity):
         ) * co2_cost_in_euro_per_ton_c02
 
     def used_energy_carriers(self):
-        energy = [demand.get_energy_carrier_id() for demand in self.energy_demands]
-        steam = [demand.get_energy_carrier_id() for demand in self.steam_demands]
-        feedstock = [demand.get_energy_carrier_id() for demand in self.feedstock_demands]
-        total = energy + steam + feedstock
-        return total
+        return self.carrier_footprint.energy_carrier_ids
 
     def process_emission_in_tons(self, production_in_tons):
         return production_in_tons * self.process_emission_in_ton_co2_per_ton
@@ -78,6 +121,9 @@ class Process(Entity):
         return self.lifetime_in_years + year_of_last_reinvestment
 
     def energy_emissions_in_ton_co2_per_ton(self, year):
+        position = self._year_positions.get(year)
+        if position is not None:
+            return self._cost_rows['energy_emissions_in_ton_co2_per_ton'][position]
         energy_emissions = object_sum(
             self.energy_demands,
             lambda demand: demand.energy_carrier_emission_in_ton_co2_per_ton(year),
@@ -86,6 +132,11 @@ class Process(Entity):
         return energy_emissions + steam_emissions
 
     def production_cost_in_euro_per_ton(self, year):
+        if self._cost_cache is not None:
+            return self._cost_cache.evaluate(self._production_cost_in_euro_per_ton, self, year)
+        return self._production_cost_in_euro_per_ton(year)
+
+    def _production_cost_in_euro_per_ton(self, year):
         return (
             self.annuity_on_investment_per_ton(year)
             + self.opex_in_euro_per_ton(year)
@@ -103,6 +154,11 @@ class Process(Entity):
         return self.feedstock_demands
 
     def energy_and_emission_cost(self, year, co2_cost_in_euro_per_ton_c02):
+        if self._cost_cache is not None:
+            return self._cost_cache.evaluate(self._energy_and_emission_cost, self, year, co2_cost_in_euro_per_ton_c02)
+        return self._energy_and_emission_cost(year, co2_cost_in_euro_per_ton_c02)
+
+    def _energy_and_emission_cost(self, year, co2_cost_in_euro_per_ton_c02):
         return self.energy_carrier_cost_in_euro_per_ton(year) + (
             (self.energy_emissions_in_ton_co2_per_ton(year) + self.process_emission_in_ton_co2_per_ton)
             * co2_cost_in_euro_per_ton_c02
@@ -127,12 +183,21 @@ class Process(Entity):
             else:
                 new_energy_demands[energy_carrier] = demand
         self.energy_demands = new_energy_demands
+        self.carrier_footprint = CarrierFootprint(self.energy_demands, self.feedstock_demands, self.steam_demands)
+        if self._cost_cache is not None:
+            self._cost_cache.invalidate_process(self)
         return self.energy_demands
 
     def annuity_on_investment_per_ton(self, year):
+        position = self._year_positions.get(year)
+        if position is not None:
+            return self._cost_rows['annuity_on_investment_per_ton'][position]
         return self._annuity_factor() * (self._capex_in_euro_per_ton(year) - self._investment_funding(year))
 
     def energy_carrier_cost_in_euro_per_ton(self, year):
+        position = self._year_positions.get(year)
+        if position is not None:
+            return self._cost_rows['energy_carrier_cost_in_euro_per_ton'][position]
         energy_cost = object_sum(self.energy_demands, lambda demand: demand.energy_carrier_cost_in_euro_per_ton(year))
         steam_cost = object_sum(self.steam_demands, lambda demand: demand.steam_cost_in_euro_per_ton(year))
         feedstock_cost = object_sum(self.feedstock_demands, lambda demand: demand.feedstock_cost_in_euro_per_ton(year))
@@ -148,6 +213,9 @@ class Process(Entity):
         return self._annuity_factor() * pipeline_cost
 
     def _energy_carrier_subsidies_in_euro_per_ton(self, year):
+        position = self._year_positions.get(year)
+        if position is not None:
+            return self._cost_rows['energy_carrier_subsidies_in_euro_per_ton'][position]
         energy_subsidies = object_sum(
             self.energy_demands,
             lambda demand: demand.energy_carrier_subsidies_in_euro_per_ton(year),
@@ -161,6 +229,9 @@ class Process(Entity):
         return total_energy_carrier_subsides
 
     def _energy_carrier_taxes_in_euro_per_ton(self, year):
+        position = self._year_positions.get(year)
+        if position is not None:
+            return self._cost_rows['energy_carrier_taxes_in_euro_per_ton'][position]
         energy_taxes = object_sum(self.energy_demands, lambda demand: demand.energy_carrier_taxes_in_euro_per_ton(year))
         steam_taxes = object_sum(self.steam_demands, lambda demand: demand.steam_taxes_in_euro_per_ton(year))
         feedstock_taxes = object_sum(
@@ -174,6 +245,9 @@ class Process(Entity):
         return interpolate(year, self._capex_2015_in_euro_per_ton, self._capex_2050_in_euro_per_ton)
 
     def opex_in_euro_per_ton(self, year):
+        position = self._year_positions.get(year)
+        if position is not None:
+            return self._cost_rows['opex_in_euro_per_ton'][position]
         return interpolate(year, self._opex_2015_in_euro_per_ton, self._opex_2050_in_euro_per_ton)
 
     def _efficiency_improvement(self, year):
@@ -0,0 +1,27 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+
+class ProcessCatalog:
+    # Creates each (id_product, id_process) combination of a region only once and returns the
+    # same Process instance for all further requests. Processes do not hold any state of a
+    # production unit, so they can be shared by all production units and products of the region.
+    # The catalog provides the interface of the process factories and wraps one of them.
+
+    def __init__(self, process_factory):
+        self._process_factory = process_factory
+        self._processes = {}
+
+    def create_processes(self, id_product, process_ids):
+        processes = [self.create_process(id_product, id_process) for id_process in process_ids]
+        return processes
+
+    def create_process(self, id_product, id_process):
+        key = (id_product, id_process)
+        if key not in self._processes:
+            self._processes[key] = self._process_factory.create_process(id_product, id_process)
+        return self._processes[key]
+
+    def processes(self):
+        return list(self._processes.values())
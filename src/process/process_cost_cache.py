@@ -0,0 +1,75 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from collections import OrderedDict
+
+
+class ProcessCostCache:
+    # Shared memoization of process cost figures, keyed by process (identity), name of the figure,
+    # year and co2 cost. The cache holds at most maximum_size values and evicts the least recently
+    # used value first. When a figure of a later year is requested, the values of the earlier years
+    # are dropped, because the simulation does not return to them.
+
+    def __init__(self, maximum_size):
+        if maximum_size < 1:
+            message = 'The maximum size of the process cost cache must be positive'
+            raise ValueError(message)
+        self.maximum_size = maximum_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._year = None
+        self._values = OrderedDict()
+
+    def __len__(self):
+        return len(self._values)
+
+    def evaluate(self, value_function, process, year, *arguments):
+        # Returns the cached value of value_function(year, *arguments) for the process
+        key = (process, value_function.__name__, year, arguments)
+        value = self._values.get(key, self)
+        if value is not self:
+            self.hits += 1
+            self._values.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = value_function(year, *arguments)
+        self._advance(year)
+        self._values[key] = value
+        if len(self._values) > self.maximum_size:
+            self._values.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def invalidate_years_before(self, year):
+        outdated_keys = [key for key in self._values if key[2] < year]
+        for key in outdated_keys:
+            del self._values[key]
+
+    def invalidate_process(self, process):
+        outdated_keys = [key for key in self._values if key[0] is process]
+        for key in outdated_keys:
+            del self._values[key]
+
+    def clear(self):
+        self._values.clear()
+
+    def statistics(self):
+        number_of_requests = self.hits + self.misses
+        hit_rate = self.hits / number_of_requests if number_of_requests > 0 else 0
+        return {
+            'size': len(self._values),
+            'maximum_size': self.maximum_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': hit_rate,
+        }
+
+    def _advance(self, year):
+        if self._year is None or year > self._year:
+            if self._year is not None:
+                self.invalidate_years_before(year)
+            self._year = year
@@ -0,0 +1,68 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import numpy as np
+
+
+class ProcessCostTensor:
+    # Year dependent cost and emission figures of all processes of a region. The values are stored
+    # as tensor with the shape quantities x processes x years and are evaluated once with the methods
+    # of the processes, so that they are identical to the values calculated on demand.
+    #
+    # Optionally, the energy carrier dependent quantities are evaluated as matrix products of
+    # ProcessDemandMatrices and EnergyCarrierCurves, whose years have to match the time span.
+
+    QUANTITY_NAMES = [
+        'annuity_on_investment_per_ton',
+        'opex_in_euro_per_ton',
+        'energy_carrier_cost_in_euro_per_ton',
+        'energy_carrier_subsidies_in_euro_per_ton',
+        'energy_carrier_taxes_in_euro_per_ton',
+        'energy_emissions_in_ton_co2_per_ton',
+    ]
+
+    def __init__(self, processes, time_span, demand_matrices=None, energy_carrier_curves=None):
+        self.processes = list(processes)
+        self.years = np.asarray(time_span, dtype=np.int64)
+        self.year_positions = {year: position for position, year in enumerate(self.years.tolist())}
+        self.demand_matrices = demand_matrices
+        if demand_matrices is None:
+            self.data = self._evaluate()
+        else:
+            self.data = self._evaluate_with_demand_matrices(energy_carrier_curves)
+
+    def matrix(self, quantity_name):
+        # Returns the values of a quantity with one row per process and one column per year
+        quantity_position = ProcessCostTensor.QUANTITY_NAMES.index(quantity_name)
+        return self.data[quantity_position]
+
+    def rows_of_process(self, process_position):
+        return {
+            quantity_name: self.data[quantity_position, process_position]
+            for quantity_position, quantity_name in enumerate(ProcessCostTensor.QUANTITY_NAMES)
+        }
+
+    def attach_to_processes(self):
+        # Lets the processes read their values from the tensor instead of recalculating them
+        for process_position, process in enumerate(self.processes):
+            process.use_cost_tensor(self, process_position)
+
+    def _evaluate(self):
+        years = self.years.tolist()
+        data = np.empty((len(ProcessCostTensor.QUANTITY_NAMES), len(self.processes), len(years)), dtype=np.float64)
+        for process_position, process in enumerate(self.processes):
+            data[:, process_position] = process.cost_tensor_rows(years)
+        return data
+
+    def _evaluate_with_demand_matrices(self, energy_carrier_curves):
+        years = self.years.tolist()
+        data = np.empty((len(ProcessCostTensor.QUANTITY_NAMES), len(self.processes), len(years)), dtype=np.float64)
+        for process_position, process in enumerate(self.processes):
+            data[0, process_position] = [process.annuity_on_investment_per_ton(year) for year in years]
+            data[1, process_position] = [process.opex_in_euro_per_ton(year) for year in years]
+        data[2] = self.demand_matrices.energy_carrier_cost_in_euro_per_ton(energy_carrier_curves)
+        data[3] = self.demand_matrices.energy_carrier_subsidies_in_euro_per_ton(energy_carrier_curves)
+        data[4] = self.demand_matrices.energy_carrier_taxes_in_euro_per_ton(energy_carrier_curves)
+        data[5] = self.demand_matrices.energy_emissions_in_ton_co2_per_ton(energy_carrier_curves)
+        return data
@@ -0,0 +1,67 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import numpy as np
+
+
+class ProcessDemandMatrices:
+    # Dense demand matrices of the processes of a region with one row per process and one column per
+    # energy carrier (in the order of the EnergyCarrierTable), in GJ per ton. With the carrier x year
+    # matrices of EnergyCarrierCurves, the cost, subsidies, taxes and emissions of all processes and
+    # years are single matrix products.
+    #
+    # The matrix products add the carriers in a different order than the demand objects, so the
+    # results may differ from the values calculated on demand in the last digits.
+
+    def __init__(self, processes, energy_carrier_table):
+        shape = (len(processes), len(energy_carrier_table))
+        self.energy = np.zeros(shape, dtype=np.float64)
+        self.steam = np.zeros(shape, dtype=np.float64)
+        self.feedstock = np.zeros(shape, dtype=np.float64)
+
+        # Remembers which carriers a process has a demand for, even if the demand is zero
+        self._is_using_energy_or_steam = np.zeros(shape, dtype=bool)
+        self._is_using_feedstock = np.zeros(shape, dtype=bool)
+
+        for process_position, process in enumerate(processes):
+            for demand in process.energy_demands:
+                carrier_position = energy_carrier_table.position(demand.energy_carrier.id)
+                self.energy[process_position, carrier_position] += demand.demand_in_gj_per_ton
+                self._is_using_energy_or_steam[process_position, carrier_position] = True
+            for demand in process.steam_demands:
+                carrier_position = energy_carrier_table.position(demand.energy_carrier.id)
+                self.steam[process_position, carrier_position] += demand.steam_demand_in_gj_per_ton
+                self._is_using_energy_or_steam[process_position, carrier_position] = True
+            for demand in process.feedstock_demands:
+                carrier_position = energy_carrier_table.position(demand.energy_carrier.id)
+                self.feedstock[process_position, carrier_position] += demand.feedstock_demand_in_gj_per_ton
+                self._is_using_feedstock[process_position, carrier_position] = True
+
+        self._total = self.energy + self.steam + self.feedstock
+        self._is_using_carrier = self._is_using_energy_or_steam | self._is_using_feedstock
+
+    def energy_carrier_cost_in_euro_per_ton(self, energy_carrier_curves):
+        return self._product(self._total, self._is_using_carrier, energy_carrier_curves.matrix('cost_in_euro_per_gj'))
+
+    def energy_carrier_subsidies_in_euro_per_ton(self, energy_carrier_curves):
+        subsidies = energy_carrier_curves.matrix('subsidies_in_euro_per_gj')
+        return self._product(self._total, self._is_using_carrier, subsidies)
+
+    def energy_carrier_taxes_in_euro_per_ton(self, energy_carrier_curves):
+        return self._product(self._total, self._is_using_carrier, energy_carrier_curves.matrix('taxes_in_euro_per_gj'))
+
+    def energy_emissions_in_ton_co2_per_ton(self, energy_carrier_curves):
+        # Feedstock does not cause energy emissions
+        emissions = energy_carrier_curves.matrix('emission_in_ton_per_gj')
+        return self._product(self.energy + self.steam, self._is_using_energy_or_steam, emissions)
+
+    @staticmethod
+    def _product(demand_matrix, is_using_carrier, carrier_matrix):
+        # Undefined carrier values (nan) only affect the processes that use the carrier, like
+        # in the calculation on demand
+        is_undefined = np.isnan(carrier_matrix)
+        product = demand_matrix @ np.where(is_undefined, 0.0, carrier_matrix)
+        is_using_undefined_value = is_using_carrier @ is_undefined
+        product[is_using_undefined_value] = np.nan
+        return product
@@ -0,0 +1,62 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import numpy as np
+
+
+class ProcessFeasibility:
+    # Feasibility of the available processes of a product as boolean masks (one entry per process).
+    #
+    # The demands of the carrier footprints are stored in a matrix with one row per process; the
+    # availabilities of the carriers are evaluated once per year and shared by all production units
+    # of the product. The production volume and the distance to the closest H2 pipeline of a unit
+    # are applied as thresholds on these arrays, with the same comparisons as in
+    # ProductionUnit.check_energy_availability and ProductionUnit.check_h2_distance.
+
+    DISTANCE_THRESHOLD = 50
+    HYDROGEN = 15
+
+    def __init__(self, processes):
+        self.processes = list(processes)
+        footprints = [process.carrier_footprint for process in self.processes]
+
+        # Rows are padded with a demand of 0 and an infinite availability, which are always available
+        number_of_carriers = max([len(footprint.energy_carriers) for footprint in footprints], default=0)
+        self._demands_in_gj_per_ton = np.zeros((len(footprints), number_of_carriers), dtype=np.float64)
+        for position, footprint in enumerate(footprints):
+            self._demands_in_gj_per_ton[position, : len(footprint.energy_carriers)] = footprint.demands_in_gj_per_ton
+        self._footprints = footprints
+
+        self.is_using_hydrogen = np.array(
+            [footprint.is_using(ProcessFeasibility.HYDROGEN) for footprint in footprints],
+            dtype=bool,
+        )
+        self._availabilities_by_year = {}
+
+    def energy_mask(self, year, production_in_tons):
+        # True for the processes whose energy carriers are available for the production
+        total_demands = self._demands_in_gj_per_ton * production_in_tons
+        return ~(self._availabilities_in_gj(year) <= total_demands).any(axis=1)
+
+    def h2_distance_mask(self, distance_to_closest_h2_pipeline):
+        # True for the processes that are not excluded by a missing or distant H2 pipeline
+        if distance_to_closest_h2_pipeline is None:
+            is_too_far = True
+        else:
+            is_too_far = distance_to_closest_h2_pipeline > ProcessFeasibility.DISTANCE_THRESHOLD
+        if is_too_far:
+            return ~self.is_using_hydrogen
+        return np.ones(len(self.processes), dtype=bool)
+
+    def feasible_processes(self, mask):
+        return [process for process, is_feasible in zip(self.processes, mask.tolist(), strict=True) if is_feasible]
+
+    def _availabilities_in_gj(self, year):
+        availabilities = self._availabilities_by_year.get(year)
+        if availabilities is None:
+            availabilities = np.full(self._demands_in_gj_per_ton.shape, np.inf)
+            for position, footprint in enumerate(self._footprints):
+                availabilities[position, : len(footprint.energy_carriers)] = footprint.availabilities_in_gj(year)
+            self._availabilities_by_year[year] = availabilities
+        return availabilities
@@ -3,16 +3,25 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 from entity import Entity
+from product.process_feasibility import ProcessFeasibility
 
 
 class Product(Entity):
     def __init__(self, product_id, available_processes):
         self.id = product_id
         self.available_processes = available_processes
+        self._feasibility = None
 
     def accept(self, visitor, year):
         visitor.visit_product(self, year)
 
+    @property
+    def feasibility(self):
+        # Created on first use, when the carrier footprints of the processes are complete
+        if self._feasibility is None:
+            self._feasibility = ProcessFeasibility(self.available_processes)
+        return self._feasibility
+
     def virtual_production_cost_per_process_for_comparison(self, year):
         virtual_production_cost = {}
         for process in self.available_processes:
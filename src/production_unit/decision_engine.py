@@ -0,0 +1,107 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import numpy as np
+
+from industrial_site.site import Site
+from production_unit.decision_kernel import DecisionKernel
+
+
+class DecisionEngine:
+    # Processes the production units of several sites with one DecisionKernel per product instead
+    # of calling ProductionUnit.optimize_process unit by unit. The probability limits are drawn in
+    # the same order as in Site.process_year. Production units with children and units whose
+    # process is not available for their product keep using the object based decision.
+
+    def __init__(self):
+        self._kernels = {}
+
+    # pylint: disable=too-many-arguments
+    def process_sites(
+        self,
+        sites,
+        year,
+        simulation_mode,
+        co2_cost_in_euro_per_ton_co2,
+        pipeline_cost_scaling,
+        distance_to_closest_h2_pipeline,
+    ):
+        pipeline_cost_scaling = Site.pipeline_cost_scaling_of_site(
+            pipeline_cost_scaling,
+            distance_to_closest_h2_pipeline,
+        )
+
+        entries_by_product = {}
+        for site in sites:
+            for production_unit in site.production_units:
+                probability_limit = Site.probability_limit(simulation_mode)
+                kernel = self._kernel(production_unit.product, year, co2_cost_in_euro_per_ton_co2)
+                position = kernel.position(production_unit.process)
+                if production_unit.has_children or position is None:
+                    production_unit.optimize_process(
+                        year,
+                        co2_cost_in_euro_per_ton_co2,
+                        pipeline_cost_scaling,
+                        distance_to_closest_h2_pipeline,
+                        probability_limit,
+                    )
+                else:
+                    entries = entries_by_product.setdefault(production_unit.product, [])
+                    entries.append((production_unit, position, probability_limit))
+
+        for product, entries in entries_by_product.items():
+            kernel = self._kernel(product, year, co2_cost_in_euro_per_ton_co2)
+            self._process_production_units(
+                kernel,
+                entries,
+                year,
+                pipeline_cost_scaling,
+                distance_to_closest_h2_pipeline,
+            )
+
+    def _kernel(self, product, year, co2_cost_in_euro_per_ton_co2):
+        kernel = self._kernels.get(product)
+        if kernel is None:
+            kernel = DecisionKernel(product.available_processes)
+            self._kernels[product] = kernel
+        if kernel.year != year or kernel.co2_cost_in_euro_per_ton_co2 != co2_cost_in_euro_per_ton_co2:
+            kernel.update(year, co2_cost_in_euro_per_ton_co2)
+        return kernel
+
+    @staticmethod
+    def _process_production_units(kernel, entries, year, pipeline_cost_scaling, distance_to_closest_h2_pipeline):
+        production_units = [production_unit for production_unit, _position, _probability_limit in entries]
+        number_of_units = len(entries)
+        if distance_to_closest_h2_pipeline is None:
+            distance_to_closest_h2_pipeline = np.nan
+
+        new_positions, is_reinvesting = kernel.decide(
+            [production_unit.production_in_tons for production_unit in production_units],
+            [position for _production_unit, position, _probability_limit in entries],
+            [
+                DecisionEngine._year_or_nan(production_unit.year_of_last_reinvestment)
+                for production_unit in production_units
+            ],
+            np.full(number_of_units, distance_to_closest_h2_pipeline, dtype=np.float64),
+            np.full(number_of_units, pipeline_cost_scaling, dtype=np.float64),
+            [probability_limit for _production_unit, _position, probability_limit in entries],
+        )
+
+        for production_unit, position, is_unit_reinvesting in zip(
+            production_units,
+            new_positions.tolist(),
+            is_reinvesting.tolist(),
+            strict=True,
+        ):
+            production_unit.apply_decision(
+                year,
+                kernel.candidate_processes[position],
+                is_reinvesting=is_unit_reinvesting,
+            )
+
+    @staticmethod
+    def _year_or_nan(year):
+        if year is None:
+            return np.nan
+        return year
@@ -0,0 +1,180 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import numpy as np
+
+from utils import array_utils
+
+
+# pylint: disable=too-many-instance-attributes
+class DecisionKernel:
+    # Population level version of ProductionUnit.optimize_process for all production units of a
+    # product. The cost figures of the candidate processes are evaluated once per year with
+    # update; the decisions of all units are then taken with arrays of shape units x candidate
+    # processes.
+    #
+    # The cost terms are combined with the same floating point operations as in Process and
+    # ProductionUnit and the masked argmin keeps the tie rule of collection_utils.min_object,
+    # so the results are identical to the object based decisions.
+
+    DIRECT_REDUCTION_PROCESS_IDS = (38, 39)
+    DISTANCE_THRESHOLD = 50
+    HYDROGEN = 15
+
+    def __init__(self, candidate_processes):
+        self.candidate_processes = list(candidate_processes)
+        self._positions = {process: position for position, process in enumerate(self.candidate_processes)}
+
+        self._process_ids = np.array([process.id for process in self.candidate_processes])
+        self._lifetimes = np.array([process.lifetime_in_years for process in self.candidate_processes])
+        self._is_direct_reduction = np.array(
+            [process.id in DecisionKernel.DIRECT_REDUCTION_PROCESS_IDS for process in self.candidate_processes],
+            dtype=bool,
+        )
+        # Hydrogen processes pay the pipeline cost and need a pipeline nearby
+        self._is_using_hydrogen = np.array(
+            [process.carrier_footprint.is_using(DecisionKernel.HYDROGEN) for process in self.candidate_processes],
+            dtype=bool,
+        )
+        self._footprints = [process.carrier_footprint for process in self.candidate_processes]
+
+        # The year dependent figures are evaluated by update
+        self.year = None
+        self.co2_cost_in_euro_per_ton_co2 = None
+        self._costs_per_ton = None
+        self._energy_and_emission_costs = None
+        self._availabilities = None
+
+    def update(self, year, co2_cost_in_euro_per_ton_co2):
+        self.year = year
+        self.co2_cost_in_euro_per_ton_co2 = co2_cost_in_euro_per_ton_co2
+        self._costs_per_ton = np.array(
+            [
+                process.production_cost_in_euro_per_ton(year)
+                + (process.process_emission_in_ton_co2_per_ton + process.energy_emissions_in_ton_co2_per_ton(year))
+                * co2_cost_in_euro_per_ton_co2
+                for process in self.candidate_processes
+            ],
+            dtype=np.float64,
+        )
+        self._energy_and_emission_costs = np.array(
+            [
+                process.energy_and_emission_cost(year, co2_cost_in_euro_per_ton_co2)
+                for process in self.candidate_processes
+            ],
+            dtype=np.float64,
+        )
+        self._availabilities = [footprint.availabilities_in_gj(year) for footprint in self._footprints]
+
+    def position(self, process):
+        # Returns None if the process is not a candidate of the kernel
+        return self._positions.get(process)
+
+    # pylint: disable=too-many-arguments
+    def decide(
+        self,
+        production_in_tons,
+        process_positions,
+        years_of_last_reinvestment,
+        distances_to_closest_h2_pipeline,
+        pipeline_cost_scalings,
+        probability_limits,
+    ):
+        # Expects one entry per production unit in each array; missing reinvestment years and
+        # distances are nan. Returns the positions of the new processes and whether the units
+        # reinvest in the year.
+        production_in_tons = np.asarray(production_in_tons, dtype=np.float64)
+        process_positions = np.asarray(process_positions, dtype=np.int64)
+        years_of_last_reinvestment = np.asarray(years_of_last_reinvestment, dtype=np.float64)
+        distances = np.asarray(distances_to_closest_h2_pipeline, dtype=np.float64)
+        pipeline_cost_scalings = np.asarray(pipeline_cost_scalings, dtype=np.float64)
+
+        is_energy_available = self._is_energy_available(production_in_tons)
+        costs_with_pipelines = self._costs_with_pipelines(production_in_tons, pipeline_cost_scalings)
+
+        probabilities = self._probabilities_of_change(
+            process_positions,
+            years_of_last_reinvestment,
+            lambda: self._is_waiting(is_energy_available, costs_with_pipelines, production_in_tons),
+        )
+        is_reinvesting = ~(probabilities < np.asarray(probability_limits))
+
+        is_too_far_from_pipeline = self._is_using_hydrogen[None, :] & ~(distances[:, None] <= self.DISTANCE_THRESHOLD)
+        is_candidate = is_energy_available & ~is_too_far_from_pipeline
+
+        # The minima are only searched for the units that need them
+        new_positions = process_positions.copy()
+        if is_reinvesting.any():
+            new_positions[is_reinvesting] = self.masked_argmin(
+                costs_with_pipelines[is_reinvesting],
+                is_candidate[is_reinvesting],
+                process_positions[is_reinvesting],
+            )
+
+        is_switching_fuel = ~is_reinvesting & self._is_direct_reduction[process_positions]
+        if is_switching_fuel.any():
+            energy_and_emission_costs = np.broadcast_to(self._energy_and_emission_costs, is_candidate.shape)
+            new_positions[is_switching_fuel] = self.masked_argmin(
+                energy_and_emission_costs[is_switching_fuel],
+                is_candidate[is_switching_fuel],
+                process_positions[is_switching_fuel],
+            )
+        return new_positions, is_reinvesting
+
+    @staticmethod
+    def masked_argmin(costs, is_candidate, default_positions=None):
+        # Returns the position of the minimum candidate cost of each row with the rule of
+        # collection_utils.min_object: a candidate only replaces the position found so far if its
+        # cost is lower, so that the first minimum wins and undefined (nan) costs never win. Without
+        # default positions, the first candidate is the start value and rows without any candidate
+        # get the position -1.
+        number_of_rows = costs.shape[0]
+        if default_positions is None:
+            found_positions = np.full(number_of_rows, -1, dtype=np.int64)
+            found_costs = np.full(number_of_rows, np.nan)
+        else:
+            found_positions = np.array(default_positions, dtype=np.int64)
+            found_costs = costs[np.arange(number_of_rows), found_positions]
+        return array_utils.masked_argmin(
+            np.ascontiguousarray(costs, dtype=np.float64),
+            np.ascontiguousarray(is_candidate, dtype=np.bool_),
+            found_positions,
+            np.ascontiguousarray(found_costs, dtype=np.float64),
+        )
+
+    def _is_energy_available(self, production_in_tons):
+        is_energy_available = np.ones((len(production_in_tons), len(self.candidate_processes)), dtype=bool)
+        for position, footprint in enumerate(self._footprints):
+            is_energy_available[:, position] = array_utils.is_covering_demands(
+                self._availabilities[position],
+                footprint.demands_in_gj_per_ton,
+                production_in_tons,
+            )
+        return is_energy_available
+
+    def _costs_with_pipelines(self, production_in_tons, pipeline_cost_scalings):
+        # See Process.production_cost_in_euro
+        pipeline_costs = np.where(self._is_using_hydrogen[None, :], pipeline_cost_scalings[:, None], 1)
+        return pipeline_costs + production_in_tons[:, None] * self._costs_per_ton[None, :]
+
+    def _is_waiting(self, is_energy_available, costs_with_pipelines, production_in_tons):
+        # See ProductionUnit._check_production_cost_minima; units without available processes do not wait
+        costs_without_pipelines = 1 + production_in_tons[:, None] * self._costs_per_ton[None, :]
+        positions_with_pipelines = self.masked_argmin(costs_with_pipelines, is_energy_available)
+        positions_without_pipelines = self.masked_argmin(costs_without_pipelines, is_energy_available)
+        return (positions_with_pipelines >= 0) & (
+            self._process_ids[positions_with_pipelines] != self._process_ids[positions_without_pipelines]
+        )
+
+    def _probabilities_of_change(self, process_positions, years_of_last_reinvestment, is_waiting_function):
+        # See ProductionUnit.probability_of_change; the wait flags are only evaluated if a unit is in
+        # the waiting period
+        year = self.year
+        end_of_life = self._lifetimes[process_positions] + years_of_last_reinvestment
+        is_in_waiting_period = (end_of_life - 0 <= year) & (year < end_of_life + 0)
+        probabilities = np.zeros(len(process_positions), dtype=np.int64)
+        if is_in_waiting_period.any():
+            probabilities = np.where(is_in_waiting_period, np.where(is_waiting_function(), 0, 1), 0)
+        probabilities = np.where(year == end_of_life, 1, probabilities)
+        return np.where(np.isnan(years_of_last_reinvestment), 1, probabilities)
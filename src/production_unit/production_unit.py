@@ -18,8 +18,15 @@ class ProductionUnit(Entity):
         self.previous_year_of_last_reinvestment = year_of_last_reinvestment
         self.energy_demands = process.energy_demands
         self._product = product
+        # Energy availability of the processes of the product, see _energy_mask
+        self._energy_mask_key = None
+        self._energy_mask_of_year = None
+        # Production costs with and without pipelines by process, see _production_costs
+        self._production_cost_key = None
+        self._production_costs_by_process = {}
         # pylint: disable=fixme
         self._children = []
+        self._number_of_skipped_wait_evaluations = 0
 
     def optimize_process(
         self,
@@ -47,20 +54,12 @@ class ProductionUnit(Entity):
                 self._check_fuel_switch(year, co2_cost_in_euro_per_ton_co2, distance_to_closest_h2_pipeline)
                 return
 
-            available_processes = []
-            for process in self._product.available_processes:
-                available_processes.append(process)
-                if self.check_energy_availability(year, process):
-                    if self.check_h2_distance(process, distance_to_closest_h2_pipeline):
-                        available_processes.remove(process)
-                else:
-                    available_processes.remove(process)
+            available_processes = self._feasible_processes(year, distance_to_closest_h2_pipeline)
 
             self.previous_process = self.process
             self.process = self._process_with_min_production_cost(
                 year,
                 self.process,
-                self.production_in_tons,
                 available_processes,
                 co2_cost_in_euro_per_ton_co2,
                 pipeline_cost_scaling,
@@ -83,52 +82,88 @@ class ProductionUnit(Entity):
             )
             return probability
 
-        wait = self._check_production_cost_minima(year, co2_cost_in_euro_per_ton_co2, pipeline_cost_scaling)
+        # The cost minima are only compared in the waiting period before the end of life, where they
+        # decide about the result
+        self.previous_process = self.process
         if self.year_of_last_reinvestment is not None:
             end_of_life = self.process.year_of_new_investment(self.year_of_last_reinvestment)
             if year == end_of_life + 0:
+                self._number_of_skipped_wait_evaluations += 1
                 return 1
             if end_of_life - 0 <= year < end_of_life + 0:
+                wait = self._check_production_cost_minima(year, co2_cost_in_euro_per_ton_co2, pipeline_cost_scaling)
                 if wait:
                     return 0
                 return 1
+            self._number_of_skipped_wait_evaluations += 1
             return 0
+        self._number_of_skipped_wait_evaluations += 1
         return 1
 
     @staticmethod
     def check_h2_use(process):
         hydrogen = 15
-        for energy_demand in process.energy_demands:
-            energy_carrier = energy_demand.energy_carrier
-            if energy_carrier.id == hydrogen:
-                return True
-        for steam_demand in process.steam_demands:
-            energy_carrier = steam_demand.energy_carrier
-            if energy_carrier.id == hydrogen:
-                return True
-        for feedstock_demand in process.feedstock_demands:
-            energy_carrier = feedstock_demand.energy_carrier
-            if energy_carrier.id == hydrogen:
-                return True
-        return False
+        return process.carrier_footprint.is_using(hydrogen)
+
+    def number_of_skipped_wait_evaluations(self):
+        # Number of calls of probability_of_change that did not need to compare the cost minima
+        number_of_skipped_evaluations = self._number_of_skipped_wait_evaluations
+        for child in self._children:
+            number_of_skipped_evaluations += child.number_of_skipped_wait_evaluations()
+        return number_of_skipped_evaluations
 
     @property
     def has_children(self):
         return len(self._children) > 0
 
+    @property
+    def product(self):
+        return self._product
+
+    def apply_decision(self, year, process, is_reinvesting):
+        # Applies a decision of the DecisionKernel with the same state changes as optimize_process
+        self.previous_process = self.process
+        self.process = process
+        if is_reinvesting:
+            self.previous_year_of_last_reinvestment = self.year_of_last_reinvestment
+            self.year_of_last_reinvestment = year
+
+    def decision_state(self):
+        # State of the decisions of the unit and its children. The processes are identified by their
+        # ids, so that the state can be applied to the copy of the unit in another process.
+        state = (
+            self.previous_process.id,
+            self.process.id,
+            self.previous_year_of_last_reinvestment,
+            self.year_of_last_reinvestment,
+            self._number_of_skipped_wait_evaluations,
+        )
+        return state, [child.decision_state() for child in self._children]
+
+    def apply_decision_state(self, decision_state):
+        state, child_states = decision_state
+        (
+            id_previous_process,
+            id_process,
+            self.previous_year_of_last_reinvestment,
+            self.year_of_last_reinvestment,
+            self._number_of_skipped_wait_evaluations,
+        ) = state
+        # The decided processes are the current processes of the unit or available processes of its product
+        processes = {process.id: process for process in self._product.available_processes}
+        processes[self.previous_process.id] = self.previous_process
+        processes[self.process.id] = self.process
+        self.previous_process = processes[id_previous_process]
+        self.process = processes[id_process]
+        for child, child_state in zip(self._children, child_states, strict=True):
+            child.apply_decision_state(child_state)
+
     def _check_fuel_switch(self, year, co2_cost_in_euro_per_ton_co2, distance_to_closest_h2_pipeline):
         direct_reduction_h2 = 38
         direct_reduction_ng = 39
         process_id = self.process.id
         if process_id in (direct_reduction_h2, direct_reduction_ng):
-            available_processes = []
-            for process in self._product.available_processes:
-                available_processes.append(process)
-                if self.check_energy_availability(year, process):
-                    if self.check_h2_distance(process, distance_to_closest_h2_pipeline):
-                        available_processes.remove(process)
-                else:
-                    available_processes.remove(process)
+            available_processes = self._feasible_processes(year, distance_to_closest_h2_pipeline)
 
             self.previous_process = self.process
             self.process = self._process_with_min_energy_cost(
@@ -140,29 +175,19 @@ class ProductionUnit(Entity):
 
     def _check_production_cost_minima(self, year, co2_cost_in_euro_per_ton_co2, pipeline_cost_scaling):
         self.previous_process = self.process
-        available_processes = []
-        for process in self._product.available_processes:
-            available_processes.append(process)
-            if not self.check_energy_availability(year, process):
-                available_processes.remove(process)
+        available_processes = self._product.feasibility.feasible_processes(self._energy_mask(year))
         if len(available_processes) == 0:
             return None
         process_production_cost_with_pipelines = dict.fromkeys([process.id for process in available_processes])
         process_production_cost_without_pipelines = dict.fromkeys([process.id for process in available_processes])
         for process in available_processes:
-            production_cost_with_pipelines = process.production_cost_in_euro(
+            production_cost_with_pipelines, production_cost_without_pipelines = self._production_costs(
                 year,
-                self.production_in_tons,
+                process,
                 co2_cost_in_euro_per_ton_co2,
                 pipeline_cost_scaling,
             )
             process_production_cost_with_pipelines[process.id] = production_cost_with_pipelines
-            production_cost_without_pipelines = process.production_cost_in_euro(
-                year,
-                self.production_in_tons,
-                co2_cost_in_euro_per_ton_co2,
-                1,
-            )
             process_production_cost_without_pipelines[process.id] = production_cost_without_pipelines
 
         p_min_cost_with_pipelines = min(
@@ -178,11 +203,10 @@ class ProductionUnit(Entity):
             wait = True
         return wait
 
-    @staticmethod
     def _process_with_min_production_cost(
+        self,
         year,
         default_process,
-        production_in_tons,
         available_processes,
         co2_cost_in_euro_per_ton_co2,
         pipeline_cost_scaling,
@@ -191,16 +215,53 @@ class ProductionUnit(Entity):
             return default_process
         found_process = collection_utils.min_object(
             available_processes,
-            lambda process: process.production_cost_in_euro(
+            lambda process: self._production_costs(
                 year,
-                production_in_tons,
+                process,
                 co2_cost_in_euro_per_ton_co2,
                 pipeline_cost_scaling,
-            ),
+            )[0],
             default_process,
         )
         return found_process
 
+    def _feasible_processes(self, year, distance_to_closest_h2_pipeline):
+        # Processes of the product with available energy carriers and, if they use H2, a close
+        # enough pipeline
+        feasibility = self._product.feasibility
+        mask = self._energy_mask(year) & feasibility.h2_distance_mask(distance_to_closest_h2_pipeline)
+        return feasibility.feasible_processes(mask)
+
+    def _energy_mask(self, year):
+        # The energy availability is evaluated once per year and production volume
+        key = (year, self.production_in_tons)
+        if key != self._energy_mask_key:
+            self._energy_mask_key = key
+            self._energy_mask_of_year = self._product.feasibility.energy_mask(year, self.production_in_tons)
+        return self._energy_mask_of_year
+
+    def _production_costs(self, year, process, co2_cost_in_euro_per_ton_co2, pipeline_cost_scaling):
+        # Returns the production cost of the process with and without pipelines. Both costs are derived
+        # from one evaluation of Process.production_cost_parts_in_euro and are kept until the year, the
+        # co2 cost, the pipeline cost scaling or the production changes, since probability_of_change
+        # and optimize_process need them in the same year.
+        key = (year, co2_cost_in_euro_per_ton_co2, pipeline_cost_scaling, self.production_in_tons)
+        if key != self._production_cost_key:
+            self._production_cost_key = key
+            self._production_costs_by_process = {}
+
+        production_costs = self._production_costs_by_process.get(process)
+        if production_costs is None:
+            base_cost, pipeline_cost = process.production_cost_parts_in_euro(
+                year,
+                self.production_in_tons,
+                co2_cost_in_euro_per_ton_co2,
+                pipeline_cost_scaling,
+            )
+            production_costs = (pipeline_cost + base_cost, 1 + base_cost)
+            self._production_costs_by_process[process] = production_costs
+        return production_costs
+
     @staticmethod
     def _process_with_min_energy_cost(
         year,
@@ -230,25 +291,7 @@ class ProductionUnit(Entity):
         return investment
 
     def check_energy_availability(self, year, process):
-        for energy_demand in process.energy_demands:
-            energy_carrier = energy_demand.energy_carrier
-            availability = energy_carrier.availability_in_gj(year)
-            demand = energy_demand.demand_in_gj_per_ton
-
-            for feedstock_demand in process.feedstock_demands:
-                if energy_carrier == feedstock_demand.energy_carrier:
-                    demand += feedstock_demand.feedstock_demand_in_gj_per_ton
-
-            for steam_demand in process.steam_demands:
-                if energy_carrier == steam_demand.energy_carrier:
-                    demand += steam_demand.steam_demand_in_gj_per_ton
-
-            total_demand = demand * self.production_in_tons
-
-            if availability <= total_demand:
-                return False
-
-        return True
+        return process.carrier_footprint.is_available(year, self.production_in_tons)
 
     def check_h2_distance(self, process, distance_to_closest_h2_pipeline):
         distance_threshold = 50
@@ -2,6 +2,10 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+from process.process_catalog import ProcessCatalog
+from process.process_cost_cache import ProcessCostCache
+from process.process_cost_tensor import ProcessCostTensor
+from process.process_demand_matrices import ProcessDemandMatrices
 from process.process_factory_jrc import ProcessFactoryJRC
 from product.product_factory import ProductFactory
 from production_unit.production_unit import ProductionUnit
@@ -11,8 +15,10 @@ class ProductionUnitFactory:
     def __init__(self, data_interface, energy_carriers):
         self._data_interface = data_interface
         self._production_unit_mapping = data_interface.production_unit_mapping
-        self._process_factory = ProcessFactoryJRC(data_interface, energy_carriers)
+        # Products and processes are shared by all production units of the region
+        self._process_factory = ProcessCatalog(ProcessFactoryJRC(data_interface, energy_carriers))
         self._product_factory = ProductFactory(data_interface, self._process_factory)
+        self._products = {}
 
     def create_production_units(self, id_site):
         production_unit_df = self._production_unit_mapping[id_site]
@@ -22,6 +28,24 @@ class ProductionUnitFactory:
             production_units.append(production_unit)
         return production_units
 
+    def create_process_cost_tensor(self, time_span, energy_carrier_table=None, energy_carrier_curves=None):
+        # Evaluates the costs of all processes created so far for the years of the time span; if the
+        # energy carrier data is passed, the carrier dependent costs are evaluated with demand matrices
+        processes = self._process_factory.processes()
+        demand_matrices = None
+        if energy_carrier_table is not None:
+            demand_matrices = ProcessDemandMatrices(processes, energy_carrier_table)
+        process_cost_tensor = ProcessCostTensor(processes, time_span, demand_matrices, energy_carrier_curves)
+        process_cost_tensor.attach_to_processes()
+        return process_cost_tensor
+
+    def create_process_cost_cache(self, maximum_size):
+        # Shares one cache between all processes created so far
+        process_cost_cache = ProcessCostCache(maximum_size)
+        for process in self._process_factory.processes():
+            process.use_cost_cache(process_cost_cache)
+        return process_cost_cache
+
     def _create_production_unit(self, row):
         id_production_unit = int(row['id'])
         id_product = int(row['id_product'])
@@ -29,7 +53,7 @@ class ProductionUnitFactory:
         production_in_tons = row['production_in_tons']
         year_of_last_reinvestment = row['year_of_last_reinvestment']
 
-        product = self._product_factory.create_product(id_product)
+        product = self._product(id_product)
         process = self._process_factory.create_process(id_product, id_process)
 
         production_unit = ProductionUnit(
@@ -40,3 +64,8 @@ class ProductionUnitFactory:
             year_of_last_reinvestment,
         )
         return production_unit
+
+    def _product(self, id_product):
+        if id_product not in self._products:
+            self._products[id_product] = self._product_factory.create_product(id_product)
+        return self._products[id_product]
@@ -0,0 +1,92 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import heapq
+import math
+
+
+class ReinvestmentScheduler:
+    # Determines the production units of the sites that need a decision in a year. With the
+    # deterministic probability limit, ProductionUnit.optimize_process only changes a unit
+    #   - without year of last reinvestment,
+    #   - in the end of life year of its process (priority queue by end of life year),
+    #   - if its process is a direct reduction process (fuel switch registry).
+    # Units with children are due every year. For all other units, optimize_process would only
+    # reset previous_process; the scheduler does that for the units that were due in the previous
+    # year.
+    #
+    # The units are identified by their position in the order of the sites and their units. After a
+    # unit has been processed, reschedule pushes it with its new end of life year; outdated queue
+    # entries are skipped.
+
+    DIRECT_REDUCTION_PROCESS_IDS = (38, 39)
+
+    def __init__(self, sites):
+        self._sites = list(sites)
+        self._production_units = [production_unit for site in self._sites for production_unit in site.production_units]
+        self._site_by_position = [site for site in self._sites for _production_unit in site.production_units]
+        self._positions = {production_unit: position for position, production_unit in enumerate(self._production_units)}
+
+        self._queue = []
+        self._end_of_life_by_position = {}
+        self._fuel_switch_positions = set()
+        self._unscheduled_positions = set()
+        for position in range(len(self._production_units)):
+            self._schedule(position)
+
+        self._year = None
+        self._due_production_units_by_site = {}
+        self._due_positions = []
+
+    def due_production_units(self, site, year):
+        self._advance(year)
+        return self._due_production_units_by_site.get(site, [])
+
+    def reschedule(self, production_units):
+        for production_unit in production_units:
+            self._schedule(self._positions[production_unit])
+
+    def _advance(self, year):
+        if year == self._year:
+            return
+        self._year = year
+
+        for position in self._due_positions:
+            production_unit = self._production_units[position]
+            production_unit.previous_process = production_unit.process
+
+        due_positions = self._fuel_switch_positions | self._unscheduled_positions
+        while self._queue and self._queue[0][0] <= year:
+            end_of_life, position = heapq.heappop(self._queue)
+            if self._end_of_life_by_position.get(position) != end_of_life:
+                continue
+            del self._end_of_life_by_position[position]
+            if end_of_life == year:
+                due_positions.add(position)
+
+        self._due_positions = sorted(due_positions)
+        self._due_production_units_by_site = {}
+        for position in self._due_positions:
+            site = self._site_by_position[position]
+            self._due_production_units_by_site.setdefault(site, []).append(self._production_units[position])
+
+    def _schedule(self, position):
+        self._end_of_life_by_position.pop(position, None)
+        self._fuel_switch_positions.discard(position)
+        self._unscheduled_positions.discard(position)
+
+        production_unit = self._production_units[position]
+        if production_unit.has_children or production_unit.year_of_last_reinvestment is None:
+            self._unscheduled_positions.add(position)
+            return
+
+        process = production_unit.process
+        if process.id in ReinvestmentScheduler.DIRECT_REDUCTION_PROCESS_IDS:
+            self._fuel_switch_positions.add(position)
+
+        end_of_life = process.year_of_new_investment(production_unit.year_of_last_reinvestment)
+        # An undefined end of life (nan) never equals a year
+        if not math.isnan(end_of_life):
+            self._end_of_life_by_position[position] = end_of_life
+            heapq.heappush(self._queue, (end_of_life, position))
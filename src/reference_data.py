@@ -0,0 +1,199 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pandas as pd
+
+from input_database import InputDatabase
+from utils import sql_utils
+
+
+# pylint: disable=too-many-instance-attributes
+class ReferenceData:
+    # Holds the global (not region specific) input tables. They are read once in a single pass
+    # and shared by the DataInterface of every region. The tables must be treated as read-only.
+
+    # Only the listed columns are read; they are the ones used by the factories
+    PRODUCT_INDEX_COLUMNS = ['id_product', 'id_process']
+    PRODUCT_TABLE_COLUMNS = {
+        'product_process_mapping_jrc': [
+            'is_alternative_process',
+            'capex_2015_in_euro_per_ton',
+            'capex_2050_in_euro_per_ton',
+            'opex_2015_in_euro_per_ton',
+            'opex_2050_in_euro_per_ton',
+            'fuel_demand_in_gj_per_ton',
+            'steam_demand_in_gj_per_ton',
+            'feedstock_demand_in_gj_per_ton',
+            'electricity_demand_in_gj_per_ton',
+            'lifetime_in_years',
+            'interest_rate',
+            'depreciation_period',
+            'process_emission_in_ton_co2_per_ton',
+            'efficiency_improvement_2015',
+            'efficiency_improvement_2050',
+            'investment_flexibility_2015',
+            'investment_flexibility_2050',
+            'investment_funding_2015',
+            'investment_funding_2050',
+        ],
+        'process_energy_carrier_mapping_jrc': ['id_energy_carrier', 'fuel_share'],
+        'process_feedstock_mapping_jrc': ['id_energy_carrier', 'feedstock_share'],
+        'process_steam_mapping_jrc': ['id_energy_carrier', 'steam_share'],
+    }
+
+    SCENARIO_REGION_INDEX_COLUMNS = ['id_scenario', 'id_region', 'id_energy_carrier']
+    SCENARIO_REGION_TABLE_COLUMNS = {
+        'energy_carrier_cost': [
+            'cost_2015_in_euro_per_gj',
+            'cost_2030_in_euro_per_gj',
+            'cost_2050_in_euro_per_gj',
+        ],
+        'energy_carrier_emission': ['emission_2015_in_ton_per_gj', 'emission_2050_in_ton_per_gj'],
+        'region_energy_carrier_availability_mapping': ['availability_2015_in_gj', 'availability_2050_in_gj'],
+        'energy_carrier_subsidies': [
+            'subsidies_2015_in_euro_per_gj',
+            'subsidies_2030_in_euro_per_gj',
+            'subsidies_2050_in_euro_per_gj',
+        ],
+        'energy_carrier_taxes': ['taxes_2015_in_euro_per_gj', 'taxes_2050_in_euro_per_gj'],
+    }
+
+    def __init__(self, id_scenario, scenario_options, tables=None, input_database=None):
+        # The tables are read from the input database unless they are passed, e.g. from a snapshot
+        self.id_scenario = id_scenario
+        self._scenario_options = scenario_options
+
+        if tables is None:
+            if input_database is None:
+                input_database = InputDatabase(scenario_options)
+            tables = self._read_tables(input_database)
+
+        self.energy_carrier_data = tables['energy_carrier_data']
+        self.product_process_mapping = tables['product_process_mapping']
+        self.process_energy_carrier_mapping = tables['process_energy_carrier_mapping']
+        self.process_steam_mapping = tables['process_steam_mapping']
+        self.process_feedstock_mapping = tables['process_feedstock_mapping']
+        self.energy_carrier_cost_mapping = tables['energy_carrier_cost_mapping']
+        self.energy_carrier_emission_mapping = tables['energy_carrier_emission_mapping']
+        self.region_energy_carrier_availability_mapping = tables['region_energy_carrier_availability_mapping']
+        self.region_energy_carrier_subsidies = tables['region_energy_carrier_subsidies']
+        self.region_energy_carrier_taxes = tables['region_energy_carrier_taxes']
+
+    @property
+    def tables(self):
+        return {
+            'energy_carrier_data': self.energy_carrier_data,
+            'product_process_mapping': self.product_process_mapping,
+            'process_energy_carrier_mapping': self.process_energy_carrier_mapping,
+            'process_steam_mapping': self.process_steam_mapping,
+            'process_feedstock_mapping': self.process_feedstock_mapping,
+            'energy_carrier_cost_mapping': self.energy_carrier_cost_mapping,
+            'energy_carrier_emission_mapping': self.energy_carrier_emission_mapping,
+            'region_energy_carrier_availability_mapping': self.region_energy_carrier_availability_mapping,
+            'region_energy_carrier_subsidies': self.region_energy_carrier_subsidies,
+            'region_energy_carrier_taxes': self.region_energy_carrier_taxes,
+        }
+
+    def _read_tables(self, input_database):
+        connection = input_database.connect()
+        with connection:
+            id_product_filter = self._scenario_options['id_product_filter']
+            tables = {
+                'energy_carrier_data': self._read_energy_carrier_data(connection),
+                'product_process_mapping': self._read_product_process_mapping(connection, id_product_filter),
+                'process_energy_carrier_mapping': self._read_process_energy_carrier_mapping(
+                    connection,
+                    id_product_filter,
+                ),
+                'process_steam_mapping': self._read_process_steam_mapping(connection, id_product_filter),
+                'process_feedstock_mapping': self._read_process_feedstock_mapping(connection, id_product_filter),
+                'energy_carrier_cost_mapping': self._read_energy_carrier_cost_mapping(connection),
+                'energy_carrier_emission_mapping': self._read_energy_carrier_emission_mapping(connection),
+                'region_energy_carrier_availability_mapping': self._read_region_energy_carrier_availability_mapping(
+                    connection
+                ),
+                'region_energy_carrier_subsidies': self._read_region_energy_carrier_subsidies(connection),
+                'region_energy_carrier_taxes': self._read_region_energy_carrier_taxes(connection),
+            }
+        return tables
+
+    @staticmethod
+    def _read_energy_carrier_data(connection):
+        query = 'SELECT * from id_energy_carrier'
+        df = pd.read_sql_query(query, connection)
+        return df
+
+    @staticmethod
+    def _read_product_process_mapping(connection, id_product_filter):
+        return ReferenceData._read_product_table(connection, 'product_process_mapping_jrc', id_product_filter)
+
+    @staticmethod
+    def _read_process_energy_carrier_mapping(connection, id_product_filter):
+        return ReferenceData._read_product_table(connection, 'process_energy_carrier_mapping_jrc', id_product_filter)
+
+    @staticmethod
+    def _read_process_feedstock_mapping(connection, id_product_filter):
+        return ReferenceData._read_product_table(connection, 'process_feedstock_mapping_jrc', id_product_filter)
+
+    @staticmethod
+    def _read_process_steam_mapping(connection, id_product_filter):
+        return ReferenceData._read_product_table(connection, 'process_steam_mapping_jrc', id_product_filter)
+
+    def _read_energy_carrier_cost_mapping(self, connection):
+        return self._read_scenario_region_table(connection, 'energy_carrier_cost')
+
+    def _read_energy_carrier_emission_mapping(self, connection):
+        return self._read_scenario_region_table(connection, 'energy_carrier_emission')
+
+    def _read_region_energy_carrier_availability_mapping(self, connection):
+        return self._read_scenario_region_table(connection, 'region_energy_carrier_availability_mapping')
+
+    def _read_region_energy_carrier_subsidies(self, connection):
+        return self._read_scenario_region_table(connection, 'energy_carrier_subsidies')
+
+    def _read_region_energy_carrier_taxes(self, connection):
+        return self._read_scenario_region_table(connection, 'energy_carrier_taxes')
+
+    @staticmethod
+    def product_query(table_name, id_product_filter):
+        column_names = ReferenceData.PRODUCT_INDEX_COLUMNS + ReferenceData.PRODUCT_TABLE_COLUMNS[table_name]
+        query = sql_utils.select_query(table_name, column_names)
+
+        is_filtering_products = len(id_product_filter) > 0
+        if is_filtering_products:
+            query += ' WHERE id_product IN (' + sql_utils.placeholders(id_product_filter) + ')'
+        return query
+
+    @staticmethod
+    def scenario_region_query(table_name, region_ids):
+        column_names = (
+            ReferenceData.SCENARIO_REGION_INDEX_COLUMNS + ReferenceData.SCENARIO_REGION_TABLE_COLUMNS[table_name]
+        )
+        query = sql_utils.select_query(table_name, column_names)
+        query += ' WHERE id_scenario = ? AND id_region IN (' + sql_utils.placeholders(region_ids) + ')'
+        return query
+
+    @staticmethod
+    def _read_product_table(connection, table_name, id_product_filter):
+        query = ReferenceData.product_query(table_name, id_product_filter)
+        params = list(id_product_filter)
+
+        df = pd.read_sql_query(query, connection, index_col=ReferenceData.PRODUCT_INDEX_COLUMNS, params=params)
+        df = df.sort_index()
+        return df
+
+    def _read_scenario_region_table(self, connection, table_name):
+        # Only reads the rows of the current scenario and the simulated regions
+        region_ids = self._scenario_options['region_ids']
+        query = self.scenario_region_query(table_name, region_ids)
+        params = [self.id_scenario, *region_ids]
+
+        df = pd.read_sql_query(
+            query,
+            connection,
+            index_col=ReferenceData.SCENARIO_REGION_INDEX_COLUMNS,
+            params=params,
+        )
+        df = df.sort_index()
+        return df
@@ -5,19 +5,70 @@
 from energy_carrier.energy_carrier_factory import EnergyCarrierFactory
 from entity import Entity
 from industrial_site.site_factory import SiteFactory
+from production_unit.decision_engine import DecisionEngine
+from production_unit.reinvestment_scheduler import ReinvestmentScheduler
+from simulation.decision_mode import DecisionMode
+from simulation.simulation_mode import SimulationMode
 
 
 class Region(Entity):
-    def __init__(self, id_region, data_interface):
+    def __init__(
+        self,
+        id_region,
+        data_interface,
+        time_span=None,
+        *,
+        is_using_demand_matrices=False,
+        decision_mode=DecisionMode.OBJECT,
+        process_cost_cache_size=None,
+    ):
         self.id = id_region
         self._data_interface = data_interface
 
+        # In VECTORIZED decision mode, the production units of the sites are processed per product
+        self._decision_engine = None
+        if decision_mode == DecisionMode.VECTORIZED:
+            self._decision_engine = DecisionEngine()
+
+        # If the time span is known, the energy carrier curves are evaluated once for all of its years
         energy_carrier_factory = EnergyCarrierFactory(self._data_interface)
-        self._energy_carriers = energy_carrier_factory.create_energy_carrier_map()
+        self.energy_carrier_table = energy_carrier_factory.create_energy_carrier_table()
+        self.energy_carrier_curves = None
+        if time_span is not None:
+            self.energy_carrier_curves = energy_carrier_factory.create_energy_carrier_curves(
+                self.energy_carrier_table,
+                time_span,
+            )
+        self._energy_carriers = energy_carrier_factory.create_energy_carrier_map(
+            self.energy_carrier_table,
+            self.energy_carrier_curves,
+        )
 
         site_factory = SiteFactory(self._data_interface, self._energy_carriers)
         self.sites = site_factory.create_sites()
 
+        # In SCHEDULED decision mode, only the production units that are due in a year are processed
+        self._reinvestment_scheduler = None
+        if decision_mode == DecisionMode.SCHEDULED:
+            self._reinvestment_scheduler = ReinvestmentScheduler(self.sites)
+
+        # The demand matrices evaluate the process costs faster, but may differ in the last digits
+        self.process_cost_tensor = None
+        if time_span is not None:
+            if is_using_demand_matrices:
+                self.process_cost_tensor = site_factory.create_process_cost_tensor(
+                    time_span,
+                    self.energy_carrier_table,
+                    self.energy_carrier_curves,
+                )
+            else:
+                self.process_cost_tensor = site_factory.create_process_cost_tensor(time_span)
+
+        # If a size is passed, the processes of the region share a bounded cache of their cost figures
+        self.process_cost_cache = None
+        if process_cost_cache_size is not None:
+            self.process_cost_cache = site_factory.create_process_cost_cache(process_cost_cache_size)
+
     def co2_cost_in_euro_per_ton_c02(self, year):
         return self._data_interface.co2_cost_in_euro_per_ton_co2(year)
 
@@ -26,9 +77,106 @@ class Region(Entity):
 
         if pipeline_cost_scaling == 0:
             pipeline_cost_scaling = 1000000000
+        if self._decision_engine is not None:
+            self._decision_engine.process_sites(
+                self.sites,
+                year,
+                simulation_mode,
+                co2_cost_in_euro_per_ton_co2,
+                pipeline_cost_scaling,
+                distance_to_closest_h2_pipeline,
+            )
+            return
         for site in self.sites:
             distance = distance_to_closest_h2_pipeline
-            site.process_year(year, simulation_mode, co2_cost_in_euro_per_ton_co2, pipeline_cost_scaling, distance)
+            if self._is_scheduling(simulation_mode):
+                self._process_due_production_units(
+                    site,
+                    year,
+                    simulation_mode,
+                    co2_cost_in_euro_per_ton_co2,
+                    pipeline_cost_scaling,
+                    distance,
+                )
+            else:
+                site.process_year(year, simulation_mode, co2_cost_in_euro_per_ton_co2, pipeline_cost_scaling, distance)
+
+    # pylint: disable=too-many-arguments
+    def process_site(
+        self,
+        site,
+        year,
+        simulation_mode,
+        co2_cost_in_euro_per_ton_co2,
+        pipeline_cost_scaling,
+        distance_to_closest_h2_pipeline,
+    ):
+        # Processes a single site of the region, e.g. for the step of a SiteAgent
+        if self._decision_engine is not None:
+            self._decision_engine.process_sites(
+                [site],
+                year,
+                simulation_mode,
+                co2_cost_in_euro_per_ton_co2,
+                pipeline_cost_scaling,
+                distance_to_closest_h2_pipeline,
+            )
+        elif self._is_scheduling(simulation_mode):
+            self._process_due_production_units(
+                site,
+                year,
+                simulation_mode,
+                co2_cost_in_euro_per_ton_co2,
+                pipeline_cost_scaling,
+                distance_to_closest_h2_pipeline,
+            )
+        else:
+            site.process_year(
+                year,
+                simulation_mode,
+                co2_cost_in_euro_per_ton_co2,
+                pipeline_cost_scaling,
+                distance_to_closest_h2_pipeline,
+            )
+
+    def is_site_due(self, site, year, simulation_mode):
+        # False if the site has no production units that need a decision in the year
+        if self._is_scheduling(simulation_mode):
+            return len(self._reinvestment_scheduler.due_production_units(site, year)) > 0
+        return True
+
+    def reschedule_site(self, site, year, simulation_mode):
+        # Reschedules the due production units of a site whose decisions have been made in another
+        # process (see SiteAgent.apply_decision_state)
+        if self._is_scheduling(simulation_mode):
+            self._reinvestment_scheduler.reschedule(self._reinvestment_scheduler.due_production_units(site, year))
+
+    def _is_scheduling(self, simulation_mode):
+        # The random probability limits of MONTE_CARLO mode allow decisions in every year
+        return self._reinvestment_scheduler is not None and simulation_mode == SimulationMode.DETERMINISTIC
+
+    # pylint: disable=too-many-arguments
+    def _process_due_production_units(
+        self,
+        site,
+        year,
+        simulation_mode,
+        co2_cost_in_euro_per_ton_co2,
+        pipeline_cost_scaling,
+        distance_to_closest_h2_pipeline,
+    ):
+        production_units = self._reinvestment_scheduler.due_production_units(site, year)
+        if len(production_units) == 0:
+            return
+        site.process_production_units(
+            production_units,
+            year,
+            simulation_mode,
+            co2_cost_in_euro_per_ton_co2,
+            pipeline_cost_scaling,
+            distance_to_closest_h2_pipeline,
+        )
+        self._reinvestment_scheduler.reschedule(production_units)
 
     def site_df(self):
         site_df = self._data_interface.site_data.copy(deep=True)
@@ -52,6 +200,16 @@ class Region(Entity):
             process_ids.append(id_process)
         return process_ids
 
+    def number_of_production_units(self):
+        return sum(len(site.production_units) for site in self.sites)
+
+    def number_of_skipped_wait_evaluations(self):
+        # See ProductionUnit.probability_of_change
+        number_of_skipped_evaluations = 0
+        for site in self.sites:
+            number_of_skipped_evaluations += site.number_of_skipped_wait_evaluations()
+        return number_of_skipped_evaluations
+
     @property
     def scenario(self):
         return self._data_interface.id_scenario
@@ -3,27 +3,151 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 from data_interface import DataInterface
+from input_database import InputDatabase
+from reference_data import ReferenceData
 from region.region import Region
+from simulation.decision_mode import DecisionMode
+from simulation.execution_mode import ExecutionMode
+from snapshot_cache import SnapshotCache
+from utils import executor_utils
 
 
 class RegionFactory:
-    def __init__(self, id_scenario, scenario_options):
+    # Supported scenario options for the construction of the regions:
+    # 'region_execution_mode': ExecutionMode of the region construction, default SEQUENTIAL
+    # 'number_of_region_workers': number of threads or processes, default number of processors
+    # 'is_using_demand_matrices': evaluate the process costs with matrix products, default False
+    # 'decision_mode': DecisionMode of the production units, default OBJECT
+    # 'process_cost_cache_size': maximum number of cached process cost figures, default None (no cache)
+
+    def __init__(self, id_scenario, scenario_options, time_span=None):
         self._id_scenario = id_scenario
         self._scenario_options = scenario_options
+        self._time_span = time_span
+        self._reference_data = None
+        self._input_database = InputDatabase(scenario_options)
 
     def create_regions(self):
         region_ids = self._scenario_options['region_ids']
-        regions = {}
-        for region_id in region_ids:
-            region = self._create_region(region_id)
-            regions[region_id] = region
+        is_using_snapshot_cache = self._scenario_options.get('is_using_snapshot_cache', False)
+        if is_using_snapshot_cache:
+            data_interfaces = self._create_data_interfaces_with_snapshot_cache(region_ids)
+        else:
+            data_interfaces = self._create_data_interfaces(region_ids)
+
+        execution_mode = self._scenario_options.get('region_execution_mode', ExecutionMode.SEQUENTIAL)
+        if execution_mode == ExecutionMode.SEQUENTIAL:
+            regions = {}
+            for region_id in region_ids:
+                region = self._create_region(
+                    region_id,
+                    data_interfaces[region_id],
+                    self._time_span,
+                    is_using_demand_matrices=self._is_using_demand_matrices(),
+                    decision_mode=self._decision_mode(),
+                    process_cost_cache_size=self._process_cost_cache_size(),
+                )
+                regions[region_id] = region
+            return regions
+        return self._create_regions_in_parallel(region_ids, data_interfaces, execution_mode)
+
+    def _create_regions_in_parallel(self, region_ids, data_interfaces, execution_mode):
+        # The regions with most production units are submitted first, so that they do not
+        # delay the end of the construction. The resulting dict has the order of region_ids,
+        # independent of the order in which the workers finish.
+        submission_order = sorted(
+            region_ids,
+            key=lambda region_id: data_interfaces[region_id].number_of_production_units(),
+            reverse=True,
+        )
+        number_of_workers = self._scenario_options.get('number_of_region_workers')
+        with executor_utils.create_executor(execution_mode, number_of_workers) as executor:
+            futures = {
+                region_id: executor.submit(
+                    RegionFactory._create_region,
+                    region_id,
+                    data_interfaces[region_id],
+                    self._time_span,
+                    is_using_demand_matrices=self._is_using_demand_matrices(),
+                    decision_mode=self._decision_mode(),
+                    process_cost_cache_size=self._process_cost_cache_size(),
+                )
+                for region_id in submission_order
+            }
+            regions = {region_id: futures[region_id].result() for region_id in region_ids}
         return regions
 
-    def _create_region(self, region_id):
-        data_interface = DataInterface(
-            self._id_scenario,
-            self._scenario_options,
+    def _create_data_interfaces(self, region_ids, snapshot=None):
+        # The input tables are read from the input database if no snapshot is passed
+        if snapshot is None:
+            self._reference_data = ReferenceData(
+                self._id_scenario,
+                self._scenario_options,
+                input_database=self._input_database,
+            )
+            region_tables = dict.fromkeys(region_ids)
+        else:
+            self._reference_data = ReferenceData(
+                self._id_scenario,
+                self._scenario_options,
+                snapshot['reference_data'],
+            )
+            region_tables = snapshot['regions']
+
+        data_interfaces = {}
+        for region_id in region_ids:
+            data_interfaces[region_id] = DataInterface(
+                self._id_scenario,
+                self._scenario_options,
+                region_id,
+                self._reference_data,
+                region_tables[region_id],
+                self._input_database,
+            )
+        return data_interfaces
+
+    def _create_data_interfaces_with_snapshot_cache(self, region_ids):
+        snapshot_cache = SnapshotCache(self._input_database.path)
+        id_product_filter = self._scenario_options['id_product_filter']
+        key = snapshot_cache.key(self._id_scenario, id_product_filter, region_ids)
+
+        snapshot = snapshot_cache.load(key)
+        if snapshot is not None:
+            return self._create_data_interfaces(region_ids, snapshot)
+
+        data_interfaces = self._create_data_interfaces(region_ids)
+        snapshot = {
+            'reference_data': self._reference_data.tables,
+            'regions': {region_id: data_interface.tables for region_id, data_interface in data_interfaces.items()},
+        }
+        snapshot_cache.save(key, snapshot)
+        return data_interfaces
+
+    def _is_using_demand_matrices(self):
+        return self._scenario_options.get('is_using_demand_matrices', False)
+
+    def _decision_mode(self):
+        return self._scenario_options.get('decision_mode', DecisionMode.OBJECT)
+
+    def _process_cost_cache_size(self):
+        return self._scenario_options.get('process_cost_cache_size')
+
+    @staticmethod
+    def _create_region(
+        region_id,
+        data_interface,
+        time_span=None,
+        *,
+        is_using_demand_matrices=False,
+        decision_mode=DecisionMode.OBJECT,
+        process_cost_cache_size=None,
+    ):
+        region = Region(
             region_id,
+            data_interface,
+            time_span,
+            is_using_demand_matrices=is_using_demand_matrices,
+            decision_mode=decision_mode,
+            process_cost_cache_size=process_cost_cache_size,
         )
-        region = Region(region_id, data_interface)
         return region
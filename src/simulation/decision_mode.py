@@ -0,0 +1,11 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from enum import Enum
+
+
+class DecisionMode(Enum):
+    OBJECT = 1
+    VECTORIZED = 2
+    SCHEDULED = 3
@@ -0,0 +1,11 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from enum import Enum
+
+
+class ExecutionMode(Enum):
+    SEQUENTIAL = 1
+    THREAD_POOL = 2
+    PROCESS_POOL = 3
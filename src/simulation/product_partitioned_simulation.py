@@ -0,0 +1,128 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import logging
+import os
+
+from input_database import InputDatabase
+from region.region_factory import RegionFactory
+from simulation.execution_mode import ExecutionMode
+from simulation.simulation import Simulation
+from utils import executor_utils, sql_utils
+
+
+class ProductPartitionedSimulation:
+    # Simulates the products of the scenario as independent partitions. The production units of
+    # different products never compete in ProductionUnit.optimize_process and, without mesa, the sites
+    # are not coupled by pipelines. A partition therefore creates and simulates the regions with the
+    # production units of a single product (id_product_filter). The partitions are distributed to
+    # shards with similar numbers of production units, one shard per worker. The partial results of the
+    # visitors are combined and merged into the visitors before they are finalized, so that the result
+    # tables contain the rows of all products in the order of the unpartitioned simulation.
+
+    def __init__(
+        self,
+        id_scenario,
+        scenario_options,
+        time_span,
+        visitors,
+        *,
+        execution_mode=ExecutionMode.PROCESS_POOL,
+        number_of_workers=None,
+    ):
+        executor_utils.check_forked_execution_mode(execution_mode)
+        self._id_scenario = id_scenario
+        self._scenario_options = scenario_options
+        self._time_span = time_span
+        self._visitors = visitors
+        self._execution_mode = execution_mode
+        self._number_of_workers = number_of_workers
+
+    def run(self):
+        production_units_by_product = self._number_of_production_units_by_product()
+        logging.info('Simulating product partitions %s', production_units_by_product)
+        if self._execution_mode == ExecutionMode.SEQUENTIAL:
+            partition_results = self.simulate_partitions(list(production_units_by_product))
+        else:
+            partition_results = self._simulate_partitions_in_parallel(production_units_by_product)
+
+        # The partial visitors combine the results of the partitions, e.g. the site tables of the same regions
+        region_ids = self._scenario_options['region_ids']
+        combined_visitors = [visitor.create_partial_visitor(region_ids) for visitor in self._visitors]
+        partition_results.sort(key=lambda partition_result: partition_result[0])
+        for _id_product, partial_results in partition_results:
+            for combined_visitor, visitor_results in zip(combined_visitors, partial_results, strict=True):
+                combined_visitor.merge_partial_results(visitor_results)
+
+        for visitor, combined_visitor in zip(self._visitors, combined_visitors, strict=True):
+            visitor.merge_partial_results(combined_visitor.partial_results())
+            visitor.finalize()
+
+    def _simulate_partitions_in_parallel(self, production_units_by_product):
+        number_of_workers = self._number_of_workers or os.cpu_count()
+        shards = executor_utils.balanced_shards(
+            list(production_units_by_product),
+            production_units_by_product.get,
+            number_of_workers,
+        )
+
+        shard_results = executor_utils.map_in_forked_workers(
+            ProductPartitionedSimulation.simulate_partitions,
+            shards,
+            self,
+            self._execution_mode,
+        )
+        return [partition_result for shard_result in shard_results for partition_result in shard_result]
+
+    def simulate_partitions(self, product_ids):
+        return [self.simulate_partition(id_product) for id_product in product_ids]
+
+    def simulate_partition(self, id_product):
+        # Creates and simulates the regions with the production units of the product; returns the id of
+        # the product and the partial results of the visitors
+        partition_options = {
+            **self._scenario_options,
+            'id_product_filter': [id_product],
+            # The partitions are already simulated in parallel
+            'region_execution_mode': ExecutionMode.SEQUENTIAL,
+            # The snapshot cache only keeps the snapshot of the latest product filter
+            'is_using_snapshot_cache': False,
+        }
+        region_factory = RegionFactory(self._id_scenario, partition_options, self._time_span)
+        regions = region_factory.create_regions()
+
+        simulation = Simulation(
+            self._scenario_options['simulation_mode'],
+            self._time_span,
+            regions,
+            self._visitors,
+        )
+        _regions, partial_results = simulation.simulate_regions(list(regions))
+        logging.info('Simulated product partition %s', id_product)
+        return id_product, partial_results
+
+    def _number_of_production_units_by_product(self):
+        # Products without production units in the regions do not need a partition
+        region_ids = self._scenario_options['region_ids']
+        id_product_filter = self._scenario_options['id_product_filter']
+        query = self.product_query(region_ids, id_product_filter)
+        connection = InputDatabase(self._scenario_options).connect()
+        with connection:
+            rows = connection.execute(query, [*region_ids, *id_product_filter]).fetchall()
+        return dict(rows)
+
+    @staticmethod
+    def product_query(region_ids, id_product_filter):
+        query = (
+            'SELECT production_unit.id_product, COUNT(*) from production_unit'
+            ' INNER JOIN site ON production_unit.id_site = site.id'
+        )
+        query += ' WHERE site.id_region IN (' + sql_utils.placeholders(region_ids) + ')'
+
+        is_filtering_products = len(id_product_filter) > 0
+        if is_filtering_products:
+            query += ' AND production_unit.id_product IN (' + sql_utils.placeholders(id_product_filter) + ')'
+
+        query += ' GROUP BY production_unit.id_product ORDER BY production_unit.id_product'
+        return query
@@ -2,20 +2,113 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import logging
+import os
+
+from simulation.execution_mode import ExecutionMode
+from utils import executor_utils
+
+
 class Simulation:
-    def __init__(self, simulation_mode, time_span, regions, visitors):
+    # In the parallel execution modes, the regions are distributed to shards with similar numbers of
+    # production units, one shard per worker. The regions do not interact, so a worker simulates all
+    # years of its regions with its own partial visitors. The partial results are merged in a
+    # deterministic order before the visitors are finalized. The workers of the process pool are forked
+    # and inherit the prebuilt regions; the simulated regions are returned to the main process.
+
+    def __init__(
+        self,
+        simulation_mode,
+        time_span,
+        regions,
+        visitors,
+        *,
+        execution_mode=ExecutionMode.SEQUENTIAL,
+        number_of_workers=None,
+    ):
+        executor_utils.check_forked_execution_mode(execution_mode)
         self.simulation_mode = simulation_mode
         self.regions = regions
         self._time_span = time_span
         self._visitors = visitors
-        self._pipeline_cost_scaling = None
+        self._execution_mode = execution_mode
+        self._number_of_workers = number_of_workers
+        # Without pipelines, the costs are not scaled and the distance to the closest H2 pipeline is 0,
+        # like for a SiteAgent that does not recognize pipelines
+        self._pipeline_cost_scaling = 1
+        self._distance_to_closest_h2_pipeline = 0
 
     def run(self):
-        for year in self._time_span:
-            for region in self.regions.values():
-                region.process_year(year, self.simulation_mode, self._pipeline_cost_scaling)
-                for visitor in self._visitors:
-                    region.accept(visitor, year)
+        if self._execution_mode == ExecutionMode.SEQUENTIAL:
+            for year in self._time_span:
+                for region in self.regions.values():
+                    self._process_region_year(region, year, self._visitors)
+        else:
+            self._run_in_parallel()
 
         for visitor in self._visitors:
             visitor.finalize()
+        self._log_skipped_wait_evaluations()
+        self._log_process_cost_cache_statistics()
+
+    def _process_region_year(self, region, year, visitors):
+        region.process_year(
+            year,
+            self.simulation_mode,
+            self._pipeline_cost_scaling,
+            self._distance_to_closest_h2_pipeline,
+        )
+        for visitor in visitors:
+            region.accept(visitor, year)
+
+    def _run_in_parallel(self):
+        region_ids = list(self.regions)
+        number_of_workers = self._number_of_workers or os.cpu_count()
+        shards = executor_utils.balanced_shards(
+            region_ids,
+            lambda region_id: self.regions[region_id].number_of_production_units(),
+            number_of_workers,
+        )
+
+        shard_results = executor_utils.map_in_forked_workers(
+            Simulation.simulate_regions,
+            shards,
+            self,
+            self._execution_mode,
+        )
+
+        for shard_regions, _partial_results in shard_results:
+            self.regions.update(shard_regions)
+
+        # The shards keep the order of the regions; if they are merged in the order of their last
+        # regions, the results of the last region are merged last, like in the sequential simulation
+        region_positions = {region_id: position for position, region_id in enumerate(region_ids)}
+        shard_results.sort(key=lambda shard_result: region_positions[list(shard_result[0])[-1]])
+        for _shard_regions, partial_results in shard_results:
+            for visitor, visitor_results in zip(self._visitors, partial_results, strict=True):
+                visitor.merge_partial_results(visitor_results)
+
+    def simulate_regions(self, region_ids):
+        # Simulates all years of the passed regions with partial visitors; returns the regions and the
+        # partial results of the visitors
+        regions = {region_id: self.regions[region_id] for region_id in region_ids}
+        partial_visitors = [visitor.create_partial_visitor(list(self.regions)) for visitor in self._visitors]
+        for year in self._time_span:
+            for region in regions.values():
+                self._process_region_year(region, year, partial_visitors)
+        return regions, [visitor.partial_results() for visitor in partial_visitors]
+
+    def _log_skipped_wait_evaluations(self):
+        number_of_skipped_evaluations = sum(
+            region.number_of_skipped_wait_evaluations() for region in self.regions.values()
+        )
+        logging.info('Skipped %s cost minima comparisons of production units', number_of_skipped_evaluations)
+
+    def _log_process_cost_cache_statistics(self):
+        for region in self.regions.values():
+            if region.process_cost_cache is not None:
+                logging.info(
+                    'Process cost cache of region %s: %s',
+                    region.id,
+                    region.process_cost_cache.statistics(),
+                )
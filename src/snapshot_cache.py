@@ -0,0 +1,73 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import hashlib
+import json
+import logging
+import pickle
+from pathlib import Path
+
+from utils import file_utils
+
+
+class SnapshotCache:
+    # Stores the prepared input tables as binary snapshot on disk. The file name contains a hash of the
+    # content of the input database and of the options that influence the tables. If the database or
+    # the options change, a new snapshot is created and the outdated ones are deleted.
+    #
+    # The snapshots are pickled because pandas and geopandas restore them with all data types, indices
+    # and geometries without any parsing. Only load snapshots that have been created by this cache.
+
+    # Increase the version if the structure of the cached tables changes
+    VERSION = 2
+
+    def __init__(self, database_path='./input/input.sqlite', cache_folder='./input/cache'):
+        self._database_path = database_path
+        self._cache_folder = cache_folder
+
+    def key(self, id_scenario, id_product_filter, region_ids):
+        options = {
+            'version': SnapshotCache.VERSION,
+            'id_scenario': id_scenario,
+            'id_product_filter': list(id_product_filter),
+            'region_ids': list(region_ids),
+        }
+        key_hash = hashlib.sha256()
+        key_hash.update(self._database_hash().encode('utf8'))
+        key_hash.update(json.dumps(options, sort_keys=True).encode('utf8'))
+        return key_hash.hexdigest()
+
+    def load(self, key):
+        snapshot_path = self._snapshot_path(key)
+        if not snapshot_path.is_file():
+            return None
+
+        logging.info('Loading input snapshot %s', snapshot_path)
+        with snapshot_path.open('rb') as file:
+            return pickle.load(file)  # noqa: S301
+
+    def save(self, key, snapshot):
+        file_utils.create_folder_if_not_exists(self._cache_folder)
+        self._delete_outdated_snapshots(key)
+
+        snapshot_path = self._snapshot_path(key)
+        logging.info('Saving input snapshot %s', snapshot_path)
+        with snapshot_path.open('wb') as file:
+            pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _database_hash(self):
+        database_hash = hashlib.sha256()
+        chunk_size = 1024 * 1024
+        with Path(self._database_path).open('rb') as file:
+            for chunk in iter(lambda: file.read(chunk_size), b''):
+                database_hash.update(chunk)
+        return database_hash.hexdigest()
+
+    def _delete_outdated_snapshots(self, key):
+        for snapshot_path in Path(self._cache_folder).glob('*.pickle'):
+            if snapshot_path.stem != key:
+                file_utils.delete_file_if_exists(snapshot_path)
+
+    def _snapshot_path(self, key):
+        return Path(self._cache_folder) / (key + '.pickle')
@@ -3,11 +3,12 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 from steam_demand.steam_demand import SteamDemand
+from utils import share_utils
 
 
 class SteamDemandFactory:
     def __init__(self, data_interface, energy_carriers):
-        self._process_steam_mapping = data_interface.process_steam_mapping
+        self._steam_shares = share_utils.group_shares(data_interface.process_steam_mapping, 'steam_share')
         self._energy_carriers = energy_carriers
 
     def create_steam_demands(
@@ -19,25 +20,20 @@ class SteamDemandFactory:
         steam_demands = []
 
         if steam_demand_in_gj_per_ton > 0:
-            try:
-                query = 'id_product==' + str(id_product) + '&id_process==' + str(id_process)
-                steam_share_entries = self._process_steam_mapping.query(query)
-            except KeyError as error:
-                message = 'No fuel shares for id_product | id_process: ' + str(id_product) + ' | ' + str(id_process)
-                raise ValueError(message) from error
-
-            for _, row in steam_share_entries.iterrows():
-                steam_demand = self._create_steam_demand(row, steam_demand_in_gj_per_ton)
+            energy_carrier_ids, steam_shares = share_utils.shares_of_process(
+                self._steam_shares,
+                id_product,
+                id_process,
+            )
+            demands_in_gj_per_ton = steam_demand_in_gj_per_ton * steam_shares
+            demand_entries = zip(energy_carrier_ids.tolist(), demands_in_gj_per_ton, strict=True)
+            for id_energy_carrier, demand_in_gj_per_ton in demand_entries:
+                steam_demand = self._create_steam_demand(id_energy_carrier, demand_in_gj_per_ton)
                 steam_demands.append(steam_demand)
 
         return steam_demands
 
-    def _create_steam_demand(self, row, steam_demand_in_gj_per_ton):
-        id_energy_carrier = row['id_energy_carrier']
+    def _create_steam_demand(self, id_energy_carrier, demand_in_gj_per_ton):
         energy_carrier = self._energy_carriers[id_energy_carrier]
-
-        steam_share = row['steam_share']
-        demand_in_gj_per_ton = steam_demand_in_gj_per_ton * steam_share
-
         steam_demand = SteamDemand(energy_carrier, demand_in_gj_per_ton)
         return steam_demand
@@ -0,0 +1,40 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import numpy as np
+
+from utils import numba_utils
+
+
+@numba_utils.jit
+def masked_argmin(costs, is_candidate, found_positions, found_costs):
+    # Searches the minimum candidate cost of each row. A candidate only replaces the position found so
+    # far if there is none yet or if its cost is lower, so that the first minimum wins and nan never
+    # wins. The found positions and costs are start values and are updated in place.
+    number_of_rows, number_of_columns = costs.shape
+    for row in range(number_of_rows):
+        found_position = found_positions[row]
+        found_cost = found_costs[row]
+        for column in range(number_of_columns):
+            if not is_candidate[row, column]:
+                continue
+            cost = costs[row, column]
+            if found_position < 0 or cost < found_cost:
+                found_position = column
+                found_cost = cost
+        found_positions[row] = found_position
+        found_costs[row] = found_cost
+    return found_positions
+
+
+@numba_utils.jit
+def is_covering_demands(availabilities, demands_per_ton, production_in_tons):
+    # Returns for each production whether all availabilities exceed the corresponding demands
+    is_covering = np.ones(len(production_in_tons), dtype=np.bool_)
+    for row in range(len(production_in_tons)):
+        for index in range(len(demands_per_ton)):
+            if availabilities[index] <= demands_per_ton[index] * production_in_tons[row]:
+                is_covering[row] = False
+                break
+    return is_covering
@@ -0,0 +1,76 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from simulation.execution_mode import ExecutionMode
+
+# State of the running map_in_forked_workers, inherited by the forked workers
+_worker_state = {}
+
+
+def create_executor(execution_mode, number_of_workers=None, mp_context=None):
+    # Returns an executor for the parallel execution modes; the number of workers defaults
+    # to the number of processors. The workers of a process pool are started with the passed
+    # multiprocessing context, e.g. forked to inherit the objects of the main process.
+    if execution_mode == ExecutionMode.THREAD_POOL:
+        return ThreadPoolExecutor(max_workers=number_of_workers)
+    if execution_mode == ExecutionMode.PROCESS_POOL:
+        return ProcessPoolExecutor(max_workers=number_of_workers, mp_context=mp_context)
+    message = 'Unsupported execution mode for executor: ' + str(execution_mode)
+    raise ValueError(message)
+
+
+def map_in_forked_workers(function, shards, state, execution_mode=ExecutionMode.PROCESS_POOL):
+    # Returns the results of function(state, shard) for the shards, one worker per shard. The workers
+    # of a process pool are forked and inherit the state, e.g. prepared regions, instead of receiving
+    # it pickled; only the shards and the results are pickled. The function must be picklable, e.g.
+    # a function of a module or a method of a class.
+    is_using_processes = execution_mode == ExecutionMode.PROCESS_POOL
+    mp_context = multiprocessing.get_context('fork') if is_using_processes else None
+    _worker_state['state'] = state
+    try:
+        with create_executor(execution_mode, len(shards), mp_context) as executor:
+            futures = [
+                executor.submit(_apply_to_shard, function, shard, is_reseeding_random=is_using_processes)
+                for shard in shards
+            ]
+            return [future.result() for future in futures]
+    finally:
+        _worker_state.clear()
+
+
+def _apply_to_shard(function, shard, *, is_reseeding_random=False):
+    # Forked workers would otherwise draw the same random numbers, e.g. in MONTE_CARLO mode
+    if is_reseeding_random:
+        random.seed()
+    return function(_worker_state['state'], shard)
+
+
+def check_forked_execution_mode(execution_mode):
+    # The simulations fork the workers of a process pool, so that they inherit the prepared objects;
+    # forking is not available on all platforms, e.g. on Windows
+    is_forking = 'fork' in multiprocessing.get_all_start_methods()
+    if execution_mode == ExecutionMode.PROCESS_POOL and not is_forking:
+        message = (
+            'The PROCESS_POOL execution mode requires forked worker processes, which are not supported on this'
+            ' platform. Please use the SEQUENTIAL execution mode.'
+        )
+        raise ValueError(message)
+
+
+def balanced_shards(items, weight_function, number_of_shards):
+    # Distributes the items to at most number_of_shards shards with similar total weights: the
+    # heaviest remaining item is added to the lightest shard. The items of a shard keep their
+    # passed order and empty shards are omitted.
+    positions = {item: position for position, item in enumerate(items)}
+    shards = [[] for _ in range(max(min(number_of_shards, len(items)), 1))]
+    shard_weights = [0] * len(shards)
+    for item in sorted(items, key=weight_function, reverse=True):
+        lightest_shard = shard_weights.index(min(shard_weights))
+        shards[lightest_shard].append(item)
+        shard_weights[lightest_shard] += weight_function(item)
+    return [sorted(shard, key=positions.get) for shard in shards if shard]
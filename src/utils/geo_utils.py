@@ -0,0 +1,72 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from math import asin, cos, inf, pi, sqrt
+
+import numpy as np
+import shapely
+
+from utils import numba_utils
+
+
+@numba_utils.jit
+def haversine_distance(lat1, lon1, lat2, lon2):
+    # Great circle distance in km
+    p = pi / 180
+    a = 0.5 - cos((lat2 - lat1) * p) / 2 + cos(lat1 * p) * cos(lat2 * p) * (1 - cos((lon2 - lon1) * p)) / 2
+    return 12742 * asin(sqrt(a))
+
+
+@numba_utils.jit
+def closest_point_on_line(x, y, coordinates, start, end):
+    # Projects the point on the segments of the line coordinates[start:end] and returns the closest
+    # projected point; if several segments are equally close, the first one wins
+    closest_x = coordinates[start, 0]
+    closest_y = coordinates[start, 1]
+    min_distance = inf
+    for index in range(start, end - 1):
+        start_x = coordinates[index, 0]
+        start_y = coordinates[index, 1]
+        delta_x = coordinates[index + 1, 0] - start_x
+        delta_y = coordinates[index + 1, 1] - start_y
+        squared_length = delta_x * delta_x + delta_y * delta_y
+
+        fraction = 0.0
+        if squared_length > 0:
+            fraction = ((x - start_x) * delta_x + (y - start_y) * delta_y) / squared_length
+            fraction = min(max(fraction, 0.0), 1.0)
+        projected_x = start_x + fraction * delta_x
+        projected_y = start_y + fraction * delta_y
+
+        distance = sqrt((x - projected_x) * (x - projected_x) + (y - projected_y) * (y - projected_y))
+        if distance < min_distance:
+            min_distance = distance
+            closest_x = projected_x
+            closest_y = projected_y
+    return closest_x, closest_y
+
+
+@numba_utils.jit
+def min_distance_to_lines_in_km(x, y, coordinates, line_offsets):
+    # The coordinates of line i are coordinates[line_offsets[i]:line_offsets[i + 1]]. Like in
+    # MesaSimulation.calculate_km_distance, the first coordinate is passed as latitude.
+    min_distance = inf
+    for line_index in range(len(line_offsets) - 1):
+        closest_x, closest_y = closest_point_on_line(
+            x,
+            y,
+            coordinates,
+            line_offsets[line_index],
+            line_offsets[line_index + 1],
+        )
+        min_distance = min(min_distance, haversine_distance(x, y, closest_x, closest_y))
+    return min_distance
+
+
+def line_coordinates(lines):
+    # Returns the coordinates of the lines as one array and the offsets of the lines in that array
+    coordinates, line_indices = shapely.get_coordinates(lines, return_index=True)
+    numbers_of_coordinates = np.bincount(line_indices, minlength=len(lines))
+    line_offsets = np.concatenate([[0], np.cumsum(numbers_of_coordinates)]).astype(np.int64)
+    return coordinates, line_offsets
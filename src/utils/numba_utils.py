@@ -0,0 +1,36 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import os
+
+import numba
+
+# Numeric kernels are written as plain python functions that only use numpy arrays, numbers and
+# the math module. The jit decorator compiles them with numba; the compiled machine code is cached
+# on disk (in the __pycache__ folder of the module or in NUMBA_CACHE_DIR), so that later runs do
+# not pay the compile time again.
+#
+# If the environment variable FORECAST_SITES_DISABLE_NUMBA is set to 1, the kernels stay plain
+# python functions. Both variants use the same floating point operations in the same order; running
+# the simulation once with and once without numba allows to compare the results bit for bit.
+# python_function returns the python variant of a single kernel for comparisons in one process.
+
+DISABLE_NUMBA_VARIABLE = 'FORECAST_SITES_DISABLE_NUMBA'
+
+
+def is_numba_enabled():
+    return os.environ.get(DISABLE_NUMBA_VARIABLE, '0') != '1'
+
+
+def jit(python_function):
+    # Division by zero results in inf or nan like in numpy instead of raising ZeroDivisionError. The
+    # python variant only behaves the same for numpy operands, so the kernels have to receive numpy
+    # arrays and numpy scalars; python floats would raise ZeroDivisionError without numba.
+    if not is_numba_enabled():
+        return python_function
+    return numba.njit(cache=True, error_model='numpy')(python_function)
+
+
+def python_function(kernel):
+    return getattr(kernel, 'py_func', kernel)
@@ -0,0 +1,26 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import numpy as np
+
+NO_SHARES = (np.array([], dtype=np.int64), np.array([], dtype=np.float64))
+
+
+def group_shares(share_mapping, share_column_name):
+    # Groups a share mapping (e.g. process_energy_carrier_mapping) by product and process once, so that
+    # the shares of a process can be looked up without filtering the whole table. Returns a dict
+    # from (id_product, id_process) to a tuple of the energy carrier ids and the corresponding shares,
+    # both as arrays in the order of the mapping.
+    share_df = share_mapping.reset_index()
+    grouped_shares = {}
+    for (id_product, id_process), group_df in share_df.groupby(['id_product', 'id_process'], sort=False):
+        energy_carrier_ids = group_df['id_energy_carrier'].to_numpy(dtype=np.int64)
+        shares = group_df[share_column_name].to_numpy(dtype=np.float64)
+        grouped_shares[(id_product, id_process)] = (energy_carrier_ids, shares)
+    return grouped_shares
+
+
+def shares_of_process(grouped_shares, id_product, id_process):
+    # Returns empty arrays if there are no shares for the process
+    return grouped_shares.get((id_product, id_process), NO_SHARES)
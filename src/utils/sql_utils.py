@@ -0,0 +1,14 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+
+def placeholders(collection):
+    # Returns the parameter placeholders for an IN (...) clause, e.g. '?, ?, ?' for three entries.
+    # The values themselves have to be passed as query parameters.
+    return ', '.join('?' * len(collection))
+
+
+def select_query(table_name, column_names):
+    # The table and column names are defined in the code and not passed by the user
+    return 'SELECT ' + ', '.join(column_names) + ' from ' + table_name  # noqa: S608
@@ -2,6 +2,11 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import numpy as np
+
+from utils import numba_utils
+
+
 def create_time_span(start_year, end_year, year_increment):
     return list(range(start_year, end_year + 1, year_increment))
 
@@ -41,3 +46,48 @@ def exponential_decrease(year, value_2015, value_2030, value_2050):
         slope = (value_2050 - value_2030) / (2050 - year_threshold)
         value = value_2030 + slope * (year - year_threshold)
     return value
+
+
+# The following kernels evaluate the functions above for an array of years. They use the same
+# floating point operations as the scalar functions, so the values are identical.
+
+
+@numba_utils.jit
+def interpolate_years(years, value_2015, value_2050):
+    values = np.empty(len(years), dtype=np.float64)
+    slope = (value_2050 - value_2015) / (2050 - 2022)
+    for index in range(len(years)):
+        values[index] = value_2015 + slope * (years[index] - 2022)
+    return values
+
+
+@numba_utils.jit
+def interpolate_cost_years(years, value_2015, value_2030, value_2050):
+    values = np.empty(len(years), dtype=np.float64)
+    year_threshold = 2030
+    slope_until_threshold = (value_2030 - value_2015) / (year_threshold - 2022)
+    slope_after_threshold = (value_2050 - value_2030) / (2050 - year_threshold)
+    for index in range(len(years)):
+        year = years[index]
+        if year <= year_threshold:
+            values[index] = value_2015 + slope_until_threshold * (year - 2022)
+        else:
+            values[index] = value_2030 + slope_after_threshold * (year - year_threshold)
+    return values
+
+
+@numba_utils.jit
+def exponential_decrease_years(years, value_2015, value_2030, value_2050):
+    # The exponent is converted to float, because numba would evaluate an integer exponent by
+    # repeated multiplication instead of pow
+    values = np.empty(len(years), dtype=np.float64)
+    year_threshold = 2030
+    slope_until_threshold = (value_2030 / value_2015) ** (1 / (year_threshold - 2022))
+    slope_after_threshold = (value_2050 - value_2030) / (2050 - year_threshold)
+    for index in range(len(years)):
+        year = years[index]
+        if year <= year_threshold:
+            values[index] = value_2015 * slope_until_threshold ** float(year - 2022)
+        else:
+            values[index] = value_2030 + slope_after_threshold * (year - year_threshold)
+    return values
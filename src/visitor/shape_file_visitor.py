@@ -4,6 +4,8 @@
 
 import logging
 
+import pandas as pd
+
 from utils import collection_utils, file_utils
 from visitor.visitor import Visitor
 
@@ -12,6 +14,9 @@ class ShapeFileVisitor(Visitor):
     def __init__(self):
         self._output_path = '../output'
         file_utils.create_folder_if_not_exists(self._output_path)
+        # A partial visitor collects the site tables per year instead of exporting them, together with the
+        # ids of the production units and their processes per site
+        self._site_dfs_by_year = None
 
     def visit_region(self, region, year):
         self._export_sites_to_shape_file(region, year)
@@ -31,13 +36,74 @@ class ShapeFileVisitor(Visitor):
     def finalize(self):
         pass
 
+    def create_partial_visitor(self, _region_ids):
+        partial_visitor = ShapeFileVisitor()
+        partial_visitor._site_dfs_by_year = {}
+        return partial_visitor
+
+    def partial_results(self):
+        return self._site_dfs_by_year
+
+    def merge_partial_results(self, partial_results):
+        # The shape file of a year is overwritten by each region, like in the sequential simulation. A
+        # partial visitor instead combines the site tables of the same regions, e.g. of product partitions.
+        for year, (site_df, unit_process_ids) in partial_results.items():
+            if self._site_dfs_by_year is None:
+                site_df['proc_ids'] = self._join_process_ids(site_df, unit_process_ids)
+                self._export_site_df(site_df, year)
+            elif year in self._site_dfs_by_year:
+                self._site_dfs_by_year[year] = self._combine_site_dfs(
+                    self._site_dfs_by_year[year],
+                    (site_df, unit_process_ids),
+                )
+            else:
+                self._site_dfs_by_year[year] = (site_df, unit_process_ids)
+
     def _export_sites_to_shape_file(self, region, year):
         site_df = region.site_df()
         site_df['year'] = site_df.apply(lambda _site_row: year, axis=1)
+
+        if self._site_dfs_by_year is not None:
+            unit_process_ids = {
+                site.id: [(production_unit.id, production_unit.process.id) for production_unit in site.production_units]
+                for site in region.sites
+            }
+            self._site_dfs_by_year[year] = (site_df, unit_process_ids)
+            return
+
         process_ids = site_df.apply(lambda site_row: region.get_process_ids_for_site(site_row.name), axis=1)
         process_ids_string = collection_utils.join_with_comma(process_ids)
         site_df['proc_ids'] = process_ids_string
+        self._export_site_df(site_df, year)
+
+    @staticmethod
+    def _join_process_ids(site_df, unit_process_ids):
+        # The process ids of a site are ordered by the ids of the production units, like in the site
+        process_ids = [
+            [id_process for _id_production_unit, id_process in sorted(unit_process_ids[id_site])]
+            for id_site in site_df.index
+        ]
+        return collection_utils.join_with_comma(process_ids)
+
+    @staticmethod
+    def _combine_site_dfs(site_result, other_site_result):
+        # Sites with production units of several products are contained in the tables of several partitions;
+        # the combined table is ordered by the ids of the sites, like the site table of the input database
+        site_df, unit_process_ids = site_result
+        other_site_df, other_unit_process_ids = other_site_result
+        if other_site_df.empty:
+            return site_result
+        if site_df.empty:
+            return other_site_result
+
+        is_new_site = ~other_site_df.index.isin(site_df.index)
+        combined_site_df = pd.concat([site_df, other_site_df[is_new_site]]).sort_index()
+        combined_unit_process_ids = {id_site: list(units) for id_site, units in unit_process_ids.items()}
+        for id_site, units in other_unit_process_ids.items():
+            combined_unit_process_ids.setdefault(id_site, []).extend(units)
+        return combined_site_df, combined_unit_process_ids
 
+    def _export_site_df(self, site_df, year):
         self._check_export_column_names(site_df)
         shape_file_path = self._prepare_shape_file_path(year)
         if site_df.empty:
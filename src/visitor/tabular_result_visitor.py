@@ -43,6 +43,15 @@ class TabularResultVisitor(Visitor):
         self._production_cost_in_euro_per_ton = None
         self._energy_carrier_cost_in_euro_per_ton = None
 
+        # A partial visitor records the numbers of rows of the tables at each visit of a production unit,
+        # so that merged rows can be ordered like in the sequential simulation: by the visit that added
+        # them (year, position of the region, id of the site, id of the production unit) and then by
+        # their order in the partial table. The sites and their production units are ordered by id.
+        self._region_positions = None
+        self._visit_keys = []
+        self._row_counts_by_visit = []
+        self._merged_row_keys = {}
+
     def _initialize_result_tables(self):
         ## Aggregated result tables
         # Demand tables
@@ -109,6 +118,8 @@ class TabularResultVisitor(Visitor):
         logging.debug('visiting production unit %s in %s', production_unit.id, year)
         self._id_production_unit = production_unit.id
         self._production_in_tons = production_unit.production_in_tons
+        if self._region_positions is not None:
+            self._record_visit((year, self._region_positions[self._region.id], self._id_site, production_unit.id))
 
         self._year_of_last_reinvestment = production_unit.previous_year_of_last_reinvestment
         self._previous_process = production_unit.previous_process
@@ -488,6 +499,54 @@ class TabularResultVisitor(Visitor):
         self._save(self._virtual_annuity_per_process_df, '_comparison_annuity_per_process_df', output_folder)
         self._save(self._virtual_opex_per_process_df, '_comparison_opex_per_process_df', output_folder)
 
+    def create_partial_visitor(self, region_ids):
+        partial_visitor = TabularResultVisitor()
+        partial_visitor._region_positions = {id_region: position for position, id_region in enumerate(region_ids)}
+        return partial_visitor
+
+    def partial_results(self):
+        # The tables with the sort keys of their rows
+        return {
+            name: (df, self._row_keys(name, table_position, len(df)))
+            for table_position, (name, df) in enumerate(self._result_tables().items())
+        }
+
+    def merge_partial_results(self, partial_results):
+        # The rows of the partial tables are ordered by their sort keys; rows with equal keys keep their
+        # order. The year columns keep their chronological order.
+        for name, (partial_df, partial_row_keys) in partial_results.items():
+            if partial_df.empty:
+                continue
+            df = getattr(self, name)
+            if df.empty:
+                merged_df = partial_df
+                row_keys = partial_row_keys
+            else:
+                merged_df = pd.concat([df, partial_df])
+                row_keys = self._merged_row_keys[name] + partial_row_keys
+            row_order = sorted(range(len(row_keys)), key=row_keys.__getitem__)
+            year_column_names = sorted(merged_df.columns, key=lambda column_name: int(column_name[1:]))
+            setattr(self, name, merged_df.iloc[row_order][year_column_names])
+            self._merged_row_keys[name] = [row_keys[position] for position in row_order]
+
+    def _result_tables(self):
+        return {name: value for name, value in vars(self).items() if isinstance(value, pd.DataFrame)}
+
+    def _record_visit(self, visit_key):
+        self._visit_keys.append(visit_key)
+        self._row_counts_by_visit.append([len(df) for df in self._result_tables().values()])
+
+    def _row_keys(self, name, table_position, number_of_rows):
+        # The rows that have been added between two visits get the key of the first visit
+        if name in self._merged_row_keys:
+            return self._merged_row_keys[name]
+        row_counts = [row_counts[table_position] for row_counts in self._row_counts_by_visit]
+        row_counts.append(number_of_rows)
+        row_keys = []
+        for visit_position, visit_key in enumerate(self._visit_keys):
+            row_keys += [visit_key] * (row_counts[visit_position + 1] - row_counts[visit_position])
+        return row_keys
+
     @staticmethod
     def _save(df, name, output_folder):
         sqlite_path = output_folder + '/output.sqlite'
@@ -33,3 +33,19 @@ class Visitor(ABC):
     @abstractmethod
     def finalize(self):
         raise NotImplementedError(NOT_IMPLEMENTED)
+
+    @abstractmethod
+    def create_partial_visitor(self, region_ids):
+        # Returns an empty visitor that collects the results of a part of the simulation (e.g. of a
+        # region in a worker process) without writing any output. The region ids are ordered like in
+        # the sequential simulation, so that the partial results can be merged in the same order.
+        raise NotImplementedError(NOT_IMPLEMENTED)
+
+    @abstractmethod
+    def partial_results(self):
+        raise NotImplementedError(NOT_IMPLEMENTED)
+
+    @abstractmethod
+    def merge_partial_results(self, partial_results):
+        # Adds the partial results of a partial visitor before finalize
+        raise NotImplementedError(NOT_IMPLEMENTED)
@@ -0,0 +1,45 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Shared fixtures of the tests; the mock fixtures return builder functions, so that a test can create
+# several mocks with different arguments
+import pytest
+from mock import MagicMock
+
+from process.carrier_footprint import CarrierFootprint
+
+
+@pytest.fixture
+def energy_carrier_mock():
+    def create_energy_carrier_mock(id_energy_carrier, availability_in_gj=0):
+        energy_carrier = MagicMock(availability_in_gj=MagicMock(return_value=availability_in_gj))
+        energy_carrier.id = id_energy_carrier
+        return energy_carrier
+
+    return create_energy_carrier_mock
+
+
+@pytest.fixture
+def demand_mock():
+    def create_demand_mock(energy_carrier, demand_in_gj_per_ton=0, demand_attribute='demand_in_gj_per_ton'):
+        demand = MagicMock(energy_carrier=energy_carrier)
+        setattr(demand, demand_attribute, demand_in_gj_per_ton)
+        demand.get_energy_carrier_id.return_value = energy_carrier.id
+        return demand
+
+    return create_demand_mock
+
+
+@pytest.fixture
+def process_mock():
+    def create_process_mock(id_process=None, energy_demands=()):
+        process = MagicMock()
+        process.id = id_process
+        process.energy_demands = list(energy_demands)
+        process.steam_demands = []
+        process.feedstock_demands = []
+        process.carrier_footprint = CarrierFootprint(process.energy_demands, [], [])
+        return process
+
+    return create_process_mock
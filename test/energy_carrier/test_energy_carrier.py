@@ -3,8 +3,11 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 import pytest
+from mock import MagicMock
 
 from energy_carrier.energy_carrier import EnergyCarrier
+from energy_carrier.energy_carrier_curves import EnergyCarrierCurves
+from energy_carrier.energy_carrier_table import EnergyCarrierTable
 
 
 @pytest.fixture
@@ -71,3 +74,22 @@ def test_taxes_in_euro_per_gj(sut):
     year = 2015
     result = sut.taxes_in_euro_per_gj(year)
     assert result == 11
+
+
+class TestCurves:
+    @pytest.fixture
+    def energy_carrier_with_curves(self):
+        data = dict.fromkeys(EnergyCarrierTable.COLUMN_NAMES, 1)
+        curves = MagicMock()
+        curves.year_positions = {2022: 0, 2023: 1}
+        curves.curves_of_energy_carrier = MagicMock(
+            return_value={curve_name: [10, 20] for curve_name in EnergyCarrierCurves.CURVE_NAMES},
+        )
+        return EnergyCarrier(15, 'hydrogen', data, curves)
+
+    def test_precomputed_year(self, energy_carrier_with_curves):
+        assert energy_carrier_with_curves.cost_in_euro_per_gj(2023) == 20
+        assert energy_carrier_with_curves.taxes_in_euro_per_gj(2022) == 10
+
+    def test_other_year(self, energy_carrier_with_curves):
+        assert energy_carrier_with_curves.availability_in_gj(2030) == 1
@@ -0,0 +1,35 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+
+from energy_carrier.energy_carrier_curves import EnergyCarrierCurves
+from energy_carrier.energy_carrier_table import EnergyCarrierTable
+from utils.time_utils import exponential_decrease, interpolate
+
+
+@pytest.fixture
+def sut():
+    columns = {column_name: [1, 2] for column_name in EnergyCarrierTable.COLUMN_NAMES}
+    columns['cost_2015_in_euro_per_gj'] = [2, 4]
+    columns['cost_2030_in_euro_per_gj'] = [5, 6]
+    columns['cost_2050_in_euro_per_gj'] = [20, 30]
+    columns['availability_2050_in_gj'] = [70, 80]
+    energy_carrier_table = EnergyCarrierTable([15, 1], ['hydrogen', 'electricity'], columns)
+    return EnergyCarrierCurves(energy_carrier_table, [2022, 2030, 2040])
+
+
+def test_year_positions(sut):
+    assert sut.year_positions == {2022: 0, 2030: 1, 2040: 2}
+
+
+def test_matrix(sut):
+    result = sut.matrix('cost_in_euro_per_gj')
+    assert result.shape == (2, 3)
+    assert result[1, 2] == exponential_decrease(2040, 4, 6, 30)
+
+
+def test_curves_of_energy_carrier(sut):
+    result = sut.curves_of_energy_carrier(15)
+    assert list(result['availability_in_gj']) == [interpolate(year, 1, 70) for year in [2022, 2030, 2040]]
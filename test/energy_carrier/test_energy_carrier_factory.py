@@ -10,34 +10,57 @@ from energy_carrier.energy_carrier import EnergyCarrier
 from energy_carrier.energy_carrier_factory import EnergyCarrierFactory
 
 
+def _mapping(column_values):
+    mapping = pd.DataFrame(
+        {
+            'id_scenario': [1, 1, 1],
+            'id_region': [10, 10, 11],
+            'id_energy_carrier': [100, 200, 100],
+            **column_values,
+        },
+    )
+    return mapping.set_index(['id_scenario', 'id_region', 'id_energy_carrier'])
+
+
 @pytest.fixture
 def sut():
     data_interface = MagicMock()
     data_interface.id_scenario = 1
     data_interface.id_region = 10
-    data_interface.energy_carrier_data = pd.DataFrame({'id': ['energy_carrier_id'], 'name': ['energy_carrier_name']})
+    data_interface.energy_carrier_data = pd.DataFrame({'id': [200, 100], 'name': ['hydrogen', 'electricity']})
 
-    energy_carrier_mapping = pd.DataFrame(
+    data_interface.energy_carrier_cost_mapping = _mapping(
         {
-            'id_scenario': [1],
-            'id_region': [10],
-            'id_energy_carrier': [100],
-            'cost_2015_in_euro_per_gj': 2015,
-            'cost_2030_in_euro_per_gj': 2030,
-            'cost_2050_in_euro_per_gj': 2050,
-            'emission_2015_in_ton_per_gj': 2015,
-            'emission_2050_in_ton_per_gj': 2050,
-            'availability_2015_in_gj': 2015,
-            'availability_2050_in_gj': 2050,
-            'subsidies_2015_in_euro_per_gj': 2015,
-            'subsidies_2030_in_euro_per_gj': 2030,
-            'subsidies_2050_in_euro_per_gj': 2050,
-            'taxes_2015_in_euro_per_gj': 2015,
-            'taxes_2050_in_euro_per_gj': 2050,
+            'cost_2015_in_euro_per_gj': [1, 2, 3],
+            'cost_2030_in_euro_per_gj': [4, 5, 6],
+            'cost_2050_in_euro_per_gj': [7, 8, 9],
+        },
+    )
+    data_interface.energy_carrier_emission_mapping = _mapping(
+        {
+            'emission_2015_in_ton_per_gj': [1, 2, 3],
+            'emission_2050_in_ton_per_gj': [4, 5, 6],
+        },
+    )
+    data_interface.region_energy_carrier_availability_mapping = _mapping(
+        {
+            'availability_2015_in_gj': [1, 2, 3],
+            'availability_2050_in_gj': [4, 5, 6],
+        },
+    )
+    data_interface.region_energy_carrier_subsidies = _mapping(
+        {
+            'subsidies_2015_in_euro_per_gj': [1, 2, 3],
+            'subsidies_2030_in_euro_per_gj': [4, 5, 6],
+            'subsidies_2050_in_euro_per_gj': [7, 8, 9],
+        },
+    )
+    data_interface.region_energy_carrier_taxes = _mapping(
+        {
+            'taxes_2015_in_euro_per_gj': [1, 2, 3],
+            'taxes_2050_in_euro_per_gj': [4, 5, 6],
         },
     )
-    energy_carrier_mapping = energy_carrier_mapping.set_index(['id_scenario', 'id_region', 'id_energy_carrier'])
-    data_interface.energy_carrier_cost_mapping = energy_carrier_mapping
 
     energy_carrier_factory = EnergyCarrierFactory(data_interface)
     return energy_carrier_factory
@@ -48,24 +71,55 @@ def energy_carrier_init_mock(
     id_energy_carrier,
     name,
     data,
+    _curves=None,
 ):
     self.name = name
     self.id_energy_carrier = id_energy_carrier
     self.data = data
 
 
+@patch.object(EnergyCarrier, '__init__', energy_carrier_init_mock)
 def test_create_energy_carrier_map(sut):
-    sut._create_energy_carrier = MagicMock(return_value='dummy_energy_carrier')
     result = sut.create_energy_carrier_map()
-    assert isinstance(result, dict)
+    assert list(result.keys()) == [200, 100]
+
+    energy_carrier = result[200]
+    assert energy_carrier.name == 'hydrogen'
+    assert energy_carrier.data['cost_2030_in_euro_per_gj'] == 5
+    assert energy_carrier.data['taxes_2050_in_euro_per_gj'] == 5
+
+
+class TestCreateEnergyCarrierTable:
+    def test_columns(self, sut):
+        result = sut.create_energy_carrier_table()
+        assert list(result.energy_carrier_ids) == [200, 100]
+        assert result.names == ['hydrogen', 'electricity']
+        assert list(result.column('cost_2015_in_euro_per_gj')) == [2.0, 1.0]
+        assert list(result.column('availability_2050_in_gj')) == [5.0, 4.0]
+
+    def test_missing_energy_carrier(self, sut):
+        sut._energy_carrier_data = pd.DataFrame({'id': [300], 'name': ['missing']})
+        with pytest.raises(KeyError):
+            sut.create_energy_carrier_table()
+
+    def test_energy_carrier_missing_in_one_table(self, sut):
+        cost_mapping = sut._energy_carrier_cost_mapping
+        sut._energy_carrier_cost_mapping = cost_mapping.drop(index=(1, 10, 100))
+
+        with pytest.raises(KeyError) as error:
+            sut.create_energy_carrier_table()
+        assert error.value.args[0] == (1, 10, 100)
+
 
-    energy_carrier = result['energy_carrier_id']
-    assert energy_carrier == 'dummy_energy_carrier'
+def test_create_energy_carrier_curves(sut):
+    energy_carrier_table = sut.create_energy_carrier_table()
+    result = sut.create_energy_carrier_curves(energy_carrier_table, [2022, 2023])
+    assert result.matrix('cost_in_euro_per_gj').shape == (2, 2)
 
 
 @patch.object(EnergyCarrier, '__init__', energy_carrier_init_mock)
 def test_create_energy_carrier(sut):
     id_energy_carrier = 100
     name = 'dummy'
-    result = sut._create_energy_carrier(id_energy_carrier, name)
+    result = sut._create_energy_carrier(id_energy_carrier, name, {'cost_2015_in_euro_per_gj': 1})
     assert result.name == name
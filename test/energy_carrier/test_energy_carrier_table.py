@@ -0,0 +1,34 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+
+from energy_carrier.energy_carrier_table import EnergyCarrierTable
+
+
+@pytest.fixture
+def sut():
+    columns = {column_name: [1, 2] for column_name in EnergyCarrierTable.COLUMN_NAMES}
+    columns['cost_2015_in_euro_per_gj'] = [10, 20]
+    return EnergyCarrierTable([15, 1], ['hydrogen', 'electricity'], columns)
+
+
+def test_len(sut):
+    assert len(sut) == 2
+
+
+def test_column(sut):
+    result = sut.column('cost_2015_in_euro_per_gj')
+    assert result.dtype == float
+    assert list(result) == [10.0, 20.0]
+
+
+def test_position(sut):
+    assert sut.position(1) == 1
+
+
+def test_data(sut):
+    result = sut.data(1)
+    assert result['cost_2015_in_euro_per_gj'] == 20
+    assert list(result.keys()) == EnergyCarrierTable.COLUMN_NAMES
@@ -73,6 +73,7 @@ class TestCreateEnergyDemands:
 
         assert result[0].energy_carrier == 'dummy_electricity_energy_carrier'
         assert result[1] == 'dummy_energy_demand'
+        sut._create_energy_demand.assert_called_once_with(100, 5)
 
     @patch.object(EnergyDemand, '__init__', energy_demand_init_mock)
     def test_with_missing_mapping_entry(self, sut):
@@ -92,7 +93,6 @@ class TestCreateEnergyDemands:
 
 @patch.object(EnergyDemand, '__init__', energy_demand_init_mock)
 def test_create_energy_demand(sut):
-    row = {'id_energy_carrier': 100, 'fuel_share': 0.8}
-    fuel_demand_in_gj_per_ton = 100
-    result = sut._create_energy_demand(row, fuel_demand_in_gj_per_ton)
-    assert result is not None
+    demand_in_gj_per_ton = 80
+    result = sut._create_energy_demand(100, demand_in_gj_per_ton)
+    assert result.energy_carrier == 'dummy_energy_carrier'
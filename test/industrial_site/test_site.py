@@ -23,6 +23,7 @@ def sut():
         production_unit.process = process
         production_unit.probability_of_change.return_value = 1
         production_unit.number_of_process_usages.return_value = 1
+        production_unit.number_of_skipped_wait_evaluations.return_value = 2
         index += 1
 
     site = Site(
@@ -50,6 +51,28 @@ class TestProcessYear:
             sut.process_year(2015, 'FakeMode', 0, 1, 1)
 
 
+def test_process_production_units(sut):
+    production_unit = sut.production_units[1]
+    sut.process_production_units([production_unit], 2018, SimulationMode.DETERMINISTIC, 0, 1000, 10)
+    production_unit.optimize_process.assert_called_once_with(2018, 0, 1, 10, 1)
+    assert not sut.production_units[0].optimize_process.called
+
+
+class TestPipelineCostScalingOfSite:
+    def test_close_pipelines(self):
+        assert Site.pipeline_cost_scaling_of_site(1000, 10) == 1
+
+    def test_distant_pipelines(self):
+        assert Site.pipeline_cost_scaling_of_site(1000, 80) == 1000
+
+    def test_without_pipelines(self):
+        assert Site.pipeline_cost_scaling_of_site(1000, None) == 1000
+
+
+def test_probability_limit():
+    assert Site.probability_limit(SimulationMode.DETERMINISTIC) == 1
+
+
 def test_visitor_call(sut):
     visitor = Mock()
     year = 2015
@@ -65,6 +88,10 @@ def test_number_of_process_usage(sut):
     assert sut.number_of_process_usages(process) == 3
 
 
+def test_number_of_skipped_wait_evaluations(sut):
+    assert sut.number_of_skipped_wait_evaluations() == 6
+
+
 def test_process_ids(sut):
     process_ids = sut.process_ids
     assert process_ids == [1, 2, 3]
@@ -70,3 +70,9 @@ def test_create_site(sut):
 
     site = sut._create_site(row)
     assert site.id == 39
+
+
+def test_create_process_cost_tensor(sut):
+    sut._production_unit_factory.create_process_cost_tensor = MagicMock(return_value='mocked_tensor')
+    result = sut.create_process_cost_tensor([2022])
+    assert result == 'mocked_tensor'
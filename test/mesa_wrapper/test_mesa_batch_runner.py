@@ -0,0 +1,45 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from mock import MagicMock, patch
+
+from mesa_wrapper.mesa_batch_runner import MesaBatchRunner
+from mesa_wrapper.mesa_simulation import MesaSimulation
+
+
+def mesa_simulation_init_mock(
+    self,
+    _simulation_mode,
+    _time_span,
+    _regions,
+    _visitors,
+    **_options,
+):
+    self.running = True
+    self.datacollector = 'mocked_data_collector'
+
+    def step_mock():
+        self.running = False
+
+    self.step = MagicMock(side_effect=step_mock)
+
+
+@patch.object(MesaSimulation, '__init__', mesa_simulation_init_mock)
+def test_run():
+    sut = MesaBatchRunner('mocked_simulation_mode', [2020], {}, [])
+
+    result = sut.run()
+
+    assert result == 'mocked_data_collector'
+    assert sut.simulation.step.call_count == 1
+
+
+def test_run_without_visualization_server():
+    sut = MesaBatchRunner('mocked_simulation_mode', [2020, 2021], {}, [])
+    sut.simulation.recognize_pipelines = False
+
+    sut.run()
+
+    assert not sut.simulation.running
+    assert sut.simulation.schedule.previous_time == 2021
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 import pytest
+from mesa_geo.geoagent import GeoAgent
 from mock import MagicMock, patch
 
 from mesa_wrapper.site_agent import SiteAgent
@@ -22,7 +23,7 @@ def sut():
 def test_step(sut):
     sut.step()
     # assert sut.model.regions.co2_cost_in_euro_per_ton_c02.called
-    assert sut.site.process_year.called
+    assert sut.model.regions[sut.region_id].process_site.called
     # assert sut.pipeline_cost_scaling.called
     # assert sut.get_distance_to_closest_H2_pipeline.called
 
@@ -46,3 +47,40 @@ def test_get_distance_to_closest_h2_pipeline(sut):
     sut.model.pipeline_site_relations = MagicMock()
     result = sut.model.pipeline_site_relations.indes.get_level_values()
     assert result.called
+
+
+class TestDecisionState:
+    @pytest.fixture
+    def agent(self):
+        with patch.object(GeoAgent, '__init__', return_value=None):
+            site_agent = SiteAgent(
+                model=MagicMock(),
+                geometry=MagicMock(),
+                crs=MagicMock(),
+                region_id='mocked_region_id',
+                site=MagicMock(),
+            )
+        site_agent.model = MagicMock()
+        return site_agent
+
+    def test_is_due(self, agent):
+        region = agent.model.regions['mocked_region_id']
+        region.is_site_due.return_value = False
+        assert not agent.is_due()
+        region.is_site_due.assert_called_once_with(agent.site, agent.model.year, agent.model.simulation_mode)
+
+    def test_apply_decision_state(self, agent):
+        production_unit = MagicMock()
+        production_unit.decision_state.return_value = 'mocked_state'
+        agent.site.production_units = [production_unit]
+
+        decision_state = agent.decision_state()
+        agent.apply_decision_state(decision_state)
+
+        assert decision_state == ['mocked_state']
+        production_unit.apply_decision_state.assert_called_once_with('mocked_state')
+        agent.model.regions['mocked_region_id'].reschedule_site.assert_called_once_with(
+            agent.site,
+            agent.model.year,
+            agent.model.simulation_mode,
+        )
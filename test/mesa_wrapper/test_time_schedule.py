@@ -3,9 +3,10 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 import pytest
-from mock import MagicMock
+from mock import MagicMock, patch
 
 from mesa_wrapper.time_schedule import TimeSchedule
+from simulation.execution_mode import ExecutionMode
 
 
 @pytest.fixture
@@ -38,3 +39,68 @@ class TestStep:
         sut.step()
         with pytest.raises(StopIteration):
             sut.step()
+
+
+def test_init_with_thread_pool():
+    with pytest.raises(ValueError, match='Unsupported execution mode'):
+        TimeSchedule(model=MagicMock(), time_span=[2020], execution_mode=ExecutionMode.THREAD_POOL)
+
+
+def test_init_with_process_pool_without_fork():
+    with (
+        patch('multiprocessing.get_all_start_methods', return_value=['spawn']),
+        pytest.raises(ValueError, match='requires forked worker processes'),
+    ):
+        TimeSchedule(model=MagicMock(), time_span=[2020], execution_mode=ExecutionMode.PROCESS_POOL)
+
+
+class _ExecutorMock:
+    # Runs the submitted functions immediately in the main process
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_args):
+        return False
+
+    @staticmethod
+    def submit(function, *args, **kwargs):
+        return MagicMock(result=MagicMock(return_value=function(*args, **kwargs)))
+
+
+class TestStepInParallel:
+    @staticmethod
+    def _agent_mock(*, is_due):
+        agent = MagicMock()
+        agent.is_due.return_value = is_due
+        agent.decision_state.side_effect = lambda: 'state of ' + str(id(agent))
+        return agent
+
+    def test_step(self):
+        sut = TimeSchedule(
+            model=MagicMock(),
+            time_span=[2020],
+            execution_mode=ExecutionMode.PROCESS_POOL,
+            number_of_workers=2,
+        )
+        agents = [self._agent_mock(is_due=True), self._agent_mock(is_due=False), self._agent_mock(is_due=True)]
+        sut._agents = agents
+
+        with patch('utils.executor_utils.create_executor', return_value=_ExecutorMock()):
+            sut.step()
+
+        for agent in (agents[0], agents[2]):
+            assert agent.step.called
+            agent.apply_decision_state.assert_called_once_with('state of ' + str(id(agent)))
+        assert not agents[1].step.called
+        assert not agents[1].apply_decision_state.called
+        for agent in agents:
+            assert agent.advance.called
+
+    def test_step_without_due_agents(self):
+        sut = TimeSchedule(model=MagicMock(), time_span=[2020], execution_mode=ExecutionMode.PROCESS_POOL)
+        sut._agents = [self._agent_mock(is_due=False)]
+
+        with patch('utils.executor_utils.create_executor') as patched_create_executor:
+            sut.step()
+
+        assert not patched_create_executor.called
@@ -0,0 +1,65 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+
+from process.carrier_footprint import CarrierFootprint
+
+
+@pytest.fixture
+def electricity(energy_carrier_mock):
+    return energy_carrier_mock(1, 100)
+
+
+@pytest.fixture
+def hydrogen(energy_carrier_mock):
+    return energy_carrier_mock(15, 40)
+
+
+@pytest.fixture
+def sut(electricity, hydrogen, demand_mock):
+    energy_demands = [demand_mock(electricity, 2)]
+    feedstock_demands = [
+        demand_mock(electricity, 3, 'feedstock_demand_in_gj_per_ton'),
+        demand_mock(hydrogen, 100, 'feedstock_demand_in_gj_per_ton'),
+    ]
+    steam_demands = [demand_mock(electricity, 5, 'steam_demand_in_gj_per_ton')]
+    return CarrierFootprint(energy_demands, feedstock_demands, steam_demands)
+
+
+def test_init(sut, electricity):
+    assert sut.energy_carriers == (electricity,)
+    assert sut.demands_in_gj_per_ton.tolist() == [10]
+    assert dict(sut.demand_in_gj_per_ton_by_energy_carrier) == {electricity: 10}
+    assert sut.energy_carrier_ids == frozenset([1, 15])
+
+
+def test_is_immutable(sut, electricity):
+    with pytest.raises(ValueError, match='read-only'):
+        sut.demands_in_gj_per_ton[0] = 1
+    with pytest.raises(TypeError):
+        sut.demand_in_gj_per_ton_by_energy_carrier[electricity] = 1
+
+
+def test_is_using(sut):
+    assert sut.is_using(15)
+    assert not sut.is_using(2)
+
+
+def test_availabilities_in_gj(sut, electricity):
+    assert sut.availabilities_in_gj(2030).tolist() == [100]
+    assert sut.availabilities_in_gj(2030).tolist() == [100]
+    electricity.availability_in_gj.assert_called_once_with(2030)
+
+
+class TestIsAvailable:
+    def test_available(self, sut):
+        assert sut.is_available(2030, 9.9) is True
+
+    def test_not_available(self, sut):
+        assert sut.is_available(2030, 10) is False
+
+    def test_without_energy_demands(self):
+        footprint = CarrierFootprint([], [], [])
+        assert footprint.is_available(2030, 10) is True
@@ -6,7 +6,9 @@ from unittest.mock import MagicMock, Mock
 
 import pytest
 
+from process.carrier_footprint import CarrierFootprint
 from process.process import Process
+from process.process_cost_cache import ProcessCostCache
 
 
 @pytest.fixture
@@ -173,3 +175,146 @@ def test_investment_flexibility(sut):
     year = 2015
     result = sut._investment_flexibility(year)
     assert result == 0
+
+
+class TestCostTensor:
+    @pytest.fixture
+    def process(self):
+        data = {
+            'lifetime_in_years': 20,
+            'energy_demands': [],
+            'feedstock_demands': [],
+            'steam_demands': [],
+            'capex_2015_in_euro_per_ton': 100,
+            'capex_2050_in_euro_per_ton': 100,
+            'opex_2015_in_euro_per_ton': 10,
+            'opex_2050_in_euro_per_ton': 38,
+            'interest_rate': 0.1,
+            'depreciation_period': 10,
+            'process_emission_in_ton_co2_per_ton': 1,
+            'efficiency_improvement_2015': 0,
+            'efficiency_improvement_2050': 0,
+            'investment_funding_2015': 0,
+            'investment_funding_2050': 0,
+            'investment_flexibility_2015': 0,
+            'investment_flexibility_2050': 0,
+        }
+        return Process(39, data)
+
+    def test_cost_tensor_rows(self, process):
+        result = process.cost_tensor_rows([2022, 2023])
+        assert result[1] == [10, 11]
+        assert result[2] == [0, 0]
+
+    def test_use_cost_tensor(self, process):
+        cost_tensor = MagicMock()
+        cost_tensor.year_positions = {2022: 0}
+        cost_tensor.rows_of_process = MagicMock(return_value={'opex_in_euro_per_ton': [99]})
+
+        process.use_cost_tensor(cost_tensor, 0)
+
+        assert process.opex_in_euro_per_ton(2022) == 99
+        assert process.opex_in_euro_per_ton(2023) == 11
+
+
+class TestProductionCostParts:
+    @pytest.fixture
+    def process(self):
+        data = {
+            'lifetime_in_years': 20,
+            'energy_demands': [],
+            'feedstock_demands': [],
+            'steam_demands': [],
+            'capex_2015_in_euro_per_ton': 100,
+            'capex_2050_in_euro_per_ton': 100,
+            'opex_2015_in_euro_per_ton': 10,
+            'opex_2050_in_euro_per_ton': 38,
+            'interest_rate': 0.1,
+            'depreciation_period': 10,
+            'process_emission_in_ton_co2_per_ton': 1,
+            'efficiency_improvement_2015': 0,
+            'efficiency_improvement_2050': 0,
+            'investment_funding_2015': 0,
+            'investment_funding_2050': 0,
+            'investment_flexibility_2015': 0,
+            'investment_flexibility_2050': 0,
+        }
+        return Process(39, data)
+
+    def test_without_hydrogen(self, process):
+        base_cost, pipeline_cost = process.production_cost_parts_in_euro(2023, 2, 3, 7)
+        assert pipeline_cost == 1
+        assert base_cost == 2 * (process.production_cost_in_euro_per_ton(2023) + 1 * 3)
+        assert process.production_cost_in_euro(2023, 2, 3, 7) == 1 + base_cost
+
+    def test_with_hydrogen(self, process):
+        hydrogen_demand = MagicMock()
+        hydrogen_demand.get_energy_carrier_id.return_value = 15
+        hydrogen_demand.energy_carrier_emission_in_ton_co2_per_ton.return_value = 0
+        hydrogen_demand.energy_carrier_cost_in_euro_per_ton.return_value = 0
+        hydrogen_demand.energy_carrier_subsidies_in_euro_per_ton.return_value = 0
+        hydrogen_demand.energy_carrier_taxes_in_euro_per_ton.return_value = 0
+        process.energy_demands = [hydrogen_demand]
+        process.carrier_footprint = CarrierFootprint(process.energy_demands, [], [])
+
+        base_cost, pipeline_cost = process.production_cost_parts_in_euro(2023, 2, 3, 7)
+        assert pipeline_cost == 7
+        assert process.production_cost_in_euro(2023, 2, 3, 7) == 7 + base_cost
+
+
+class TestCostCache:
+    @pytest.fixture
+    def process(self):
+        data = {
+            'lifetime_in_years': 20,
+            'energy_demands': [],
+            'feedstock_demands': [],
+            'steam_demands': [],
+            'capex_2015_in_euro_per_ton': 100,
+            'capex_2050_in_euro_per_ton': 100,
+            'opex_2015_in_euro_per_ton': 10,
+            'opex_2050_in_euro_per_ton': 38,
+            'interest_rate': 0.1,
+            'depreciation_period': 10,
+            'process_emission_in_ton_co2_per_ton': 1,
+            'efficiency_improvement_2015': 0,
+            'efficiency_improvement_2050': 0,
+            'investment_funding_2015': 0,
+            'investment_funding_2050': 0,
+            'investment_flexibility_2015': 0,
+            'investment_flexibility_2050': 0,
+        }
+        return Process(39, data)
+
+    def test_production_cost_in_euro_per_ton(self, process):
+        expected_result = process.production_cost_in_euro_per_ton(2023)
+        cost_cache = ProcessCostCache(maximum_size=10)
+        process.use_cost_cache(cost_cache)
+
+        first_result = process.production_cost_in_euro_per_ton(2023)
+        second_result = process.production_cost_in_euro_per_ton(2023)
+
+        assert first_result == expected_result
+        assert second_result == expected_result
+        assert cost_cache.hits == 1
+
+    def test_energy_and_emission_cost(self, process):
+        expected_result = process.energy_and_emission_cost(2023, 3)
+        cost_cache = ProcessCostCache(maximum_size=10)
+        process.use_cost_cache(cost_cache)
+
+        process.energy_and_emission_cost(2023, 3)
+        result = process.energy_and_emission_cost(2023, 3)
+
+        assert result == expected_result
+        assert cost_cache.hits == 1
+        assert process.energy_and_emission_cost(2023, 4) != expected_result
+
+    def test_adapt_energy_demands(self, process):
+        cost_cache = ProcessCostCache(maximum_size=10)
+        process.use_cost_cache(cost_cache)
+        process.production_cost_in_euro_per_ton(2023)
+
+        process.adapt_energy_demands({})
+
+        assert len(cost_cache) == 0
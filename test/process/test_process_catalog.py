@@ -0,0 +1,36 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+from mock import MagicMock
+
+from process.process_catalog import ProcessCatalog
+
+
+@pytest.fixture
+def sut():
+    process_factory = MagicMock()
+    process_factory.create_process = MagicMock(side_effect=lambda _id_product, _id_process: MagicMock())
+    return ProcessCatalog(process_factory)
+
+
+def test_create_processes(sut):
+    result = sut.create_processes(10, [1, 2])
+    assert len(result) == 2
+    assert result[0] is not result[1]
+
+
+def test_create_process(sut):
+    first_result = sut.create_process(10, 1)
+    second_result = sut.create_process(10, 1)
+    other_product_result = sut.create_process(11, 1)
+
+    assert first_result is second_result
+    assert first_result is not other_product_result
+    assert sut._process_factory.create_process.call_count == 2
+
+
+def test_processes(sut):
+    process = sut.create_process(10, 1)
+    assert sut.processes() == [process]
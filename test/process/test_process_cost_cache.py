@@ -0,0 +1,119 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+from mock import MagicMock
+
+from process.process_cost_cache import ProcessCostCache
+
+
+def _value_function(name, value=1):
+    return MagicMock(__name__=name, return_value=value)
+
+
+@pytest.fixture
+def sut():
+    return ProcessCostCache(maximum_size=2)
+
+
+def test_init_with_invalid_size():
+    with pytest.raises(ValueError, match='must be positive'):
+        ProcessCostCache(maximum_size=0)
+
+
+def test_evaluate(sut):
+    process = MagicMock()
+    value_function = _value_function('energy_and_emission_cost', 7)
+
+    first_result = sut.evaluate(value_function, process, 2022, 100)
+    second_result = sut.evaluate(value_function, process, 2022, 100)
+
+    assert first_result == 7
+    assert second_result == 7
+    value_function.assert_called_once_with(2022, 100)
+    assert sut.hits == 1
+    assert sut.misses == 1
+
+
+def test_evaluate_distinguishes_keys(sut):
+    process = MagicMock()
+    other_process = MagicMock()
+    value_function = _value_function('energy_and_emission_cost')
+
+    sut.evaluate(value_function, process, 2022, 100)
+    sut.evaluate(value_function, process, 2022, 200)
+    sut.evaluate(value_function, other_process, 2022, 100)
+
+    assert value_function.call_count == 3
+    assert sut.hits == 0
+
+
+def test_evaluate_evicts_least_recently_used_value(sut):
+    value_function = _value_function('production_cost_in_euro_per_ton')
+    first_process = MagicMock()
+    second_process = MagicMock()
+    third_process = MagicMock()
+
+    sut.evaluate(value_function, first_process, 2022)
+    sut.evaluate(value_function, second_process, 2022)
+    sut.evaluate(value_function, first_process, 2022)
+    sut.evaluate(value_function, third_process, 2022)
+
+    assert len(sut) == 2
+    assert sut.evictions == 1
+    sut.evaluate(value_function, first_process, 2022)
+    assert sut.hits == 2
+    sut.evaluate(value_function, second_process, 2022)
+    assert sut.misses == 4
+
+
+def test_evaluate_drops_previous_years(sut):
+    process = MagicMock()
+    value_function = _value_function('production_cost_in_euro_per_ton')
+    sut.evaluate(value_function, process, 2022)
+
+    sut.evaluate(value_function, process, 2023)
+
+    assert len(sut) == 1
+    assert sut.evictions == 0
+
+
+def test_invalidate_process(sut):
+    process = MagicMock()
+    other_process = MagicMock()
+    value_function = _value_function('production_cost_in_euro_per_ton')
+    sut.evaluate(value_function, process, 2022)
+    sut.evaluate(value_function, other_process, 2022)
+
+    sut.invalidate_process(process)
+
+    assert len(sut) == 1
+
+
+def test_clear(sut):
+    sut.evaluate(_value_function('production_cost_in_euro_per_ton'), MagicMock(), 2022)
+    sut.clear()
+    assert len(sut) == 0
+
+
+def test_statistics(sut):
+    process = MagicMock()
+    value_function = _value_function('production_cost_in_euro_per_ton')
+    sut.evaluate(value_function, process, 2022)
+    sut.evaluate(value_function, process, 2022)
+
+    result = sut.statistics()
+
+    assert result == {
+        'size': 1,
+        'maximum_size': 2,
+        'hits': 1,
+        'misses': 1,
+        'evictions': 0,
+        'hit_rate': 0.5,
+    }
+
+
+def test_statistics_without_requests(sut):
+    assert sut.statistics()['hit_rate'] == 0
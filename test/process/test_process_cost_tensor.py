@@ -0,0 +1,69 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+from mock import MagicMock
+
+from process.process_cost_tensor import ProcessCostTensor
+
+
+@pytest.fixture
+def tensor_process_mock(process_mock):
+    def create_tensor_process_mock(offset):
+        process = process_mock()
+        process.cost_tensor_rows = MagicMock(
+            side_effect=lambda years: [
+                [offset + quantity_position + year - 2022 for year in years]
+                for quantity_position in range(len(ProcessCostTensor.QUANTITY_NAMES))
+            ],
+        )
+        return process
+
+    return create_tensor_process_mock
+
+
+@pytest.fixture
+def sut(tensor_process_mock):
+    processes = [tensor_process_mock(0), tensor_process_mock(100)]
+    return ProcessCostTensor(processes, [2022, 2023, 2024])
+
+
+def test_year_positions(sut):
+    assert sut.year_positions == {2022: 0, 2023: 1, 2024: 2}
+
+
+def test_matrix(sut):
+    result = sut.matrix('opex_in_euro_per_ton')
+    assert result.shape == (2, 3)
+    assert list(result[1]) == [101, 102, 103]
+
+
+def test_rows_of_process(sut):
+    result = sut.rows_of_process(0)
+    assert list(result['energy_emissions_in_ton_co2_per_ton']) == [5, 6, 7]
+
+
+def test_attach_to_processes(sut):
+    sut.attach_to_processes()
+    sut.processes[1].use_cost_tensor.assert_called_once_with(sut, 1)
+
+
+class TestWithDemandMatrices:
+    def test_data(self):
+        process = MagicMock()
+        process.annuity_on_investment_per_ton = MagicMock(side_effect=lambda year: year - 2000)
+        process.opex_in_euro_per_ton = MagicMock(return_value=5)
+        demand_matrices = MagicMock()
+        demand_matrices.energy_carrier_cost_in_euro_per_ton = MagicMock(return_value=[[1, 2]])
+        demand_matrices.energy_carrier_subsidies_in_euro_per_ton = MagicMock(return_value=[[3, 4]])
+        demand_matrices.energy_carrier_taxes_in_euro_per_ton = MagicMock(return_value=[[5, 6]])
+        demand_matrices.energy_emissions_in_ton_co2_per_ton = MagicMock(return_value=[[7, 8]])
+
+        result = ProcessCostTensor([process], [2022, 2023], demand_matrices, 'mocked_curves')
+
+        assert list(result.matrix('annuity_on_investment_per_ton')[0]) == [22, 23]
+        assert list(result.matrix('opex_in_euro_per_ton')[0]) == [5, 5]
+        assert list(result.matrix('energy_carrier_taxes_in_euro_per_ton')[0]) == [5, 6]
+        demand_matrices.energy_emissions_in_ton_co2_per_ton.assert_called_once_with('mocked_curves')
+        assert not process.cost_tensor_rows.called
@@ -0,0 +1,75 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import numpy as np
+import pytest
+from mock import MagicMock
+
+from energy_carrier.energy_carrier_table import EnergyCarrierTable
+from process.process_demand_matrices import ProcessDemandMatrices
+
+
+def _curves_mock(matrices):
+    return MagicMock(matrix=MagicMock(side_effect=lambda curve_name: np.array(matrices[curve_name])))
+
+
+@pytest.fixture
+def sut(demand_mock, energy_carrier_mock):
+    columns = {column_name: [0, 0, 0] for column_name in EnergyCarrierTable.COLUMN_NAMES}
+    energy_carrier_table = EnergyCarrierTable([1, 8, 15], ['electricity', 'other', 'hydrogen'], columns)
+
+    first_process = MagicMock(
+        energy_demands=[
+            demand_mock(energy_carrier_mock(1), 2),
+            demand_mock(energy_carrier_mock(15), 1),
+        ],
+        steam_demands=[demand_mock(energy_carrier_mock(15), 3, 'steam_demand_in_gj_per_ton')],
+        feedstock_demands=[demand_mock(energy_carrier_mock(1), 5, 'feedstock_demand_in_gj_per_ton')],
+    )
+    second_process = MagicMock(
+        energy_demands=[],
+        steam_demands=[],
+        feedstock_demands=[demand_mock(energy_carrier_mock(8), 0, 'feedstock_demand_in_gj_per_ton')],
+    )
+    return ProcessDemandMatrices([first_process, second_process], energy_carrier_table)
+
+
+def test_init(sut):
+    assert sut.energy.tolist() == [[2, 0, 1], [0, 0, 0]]
+    assert sut.steam.tolist() == [[0, 0, 3], [0, 0, 0]]
+    assert sut.feedstock.tolist() == [[5, 0, 0], [0, 0, 0]]
+
+
+def test_energy_carrier_cost_in_euro_per_ton(sut):
+    curves = _curves_mock({'cost_in_euro_per_gj': [[1, 2], [3, 4], [10, 20]]})
+    result = sut.energy_carrier_cost_in_euro_per_ton(curves)
+    assert result.tolist() == [[47, 94], [0, 0]]
+
+
+def test_energy_carrier_cost_with_undefined_cost(sut):
+    # Only the process that uses the carrier gets an undefined cost
+    curves = _curves_mock({'cost_in_euro_per_gj': [[1, 2], [np.nan, 4], [10, 20]]})
+    result = sut.energy_carrier_cost_in_euro_per_ton(curves)
+    assert result[0].tolist() == [47, 94]
+    assert np.isnan(result[1, 0])
+    assert result[1, 1] == 0
+
+
+def test_energy_carrier_subsidies_in_euro_per_ton(sut):
+    curves = _curves_mock({'subsidies_in_euro_per_gj': [[1], [0], [0]]})
+    result = sut.energy_carrier_subsidies_in_euro_per_ton(curves)
+    assert result.tolist() == [[7], [0]]
+
+
+def test_energy_carrier_taxes_in_euro_per_ton(sut):
+    curves = _curves_mock({'taxes_in_euro_per_gj': [[0], [0], [2]]})
+    result = sut.energy_carrier_taxes_in_euro_per_ton(curves)
+    assert result.tolist() == [[8], [0]]
+
+
+def test_energy_emissions_in_ton_co2_per_ton(sut):
+    # Feedstock is excluded and does not propagate undefined emissions
+    curves = _curves_mock({'emission_in_ton_per_gj': [[1], [np.nan], [2]]})
+    result = sut.energy_emissions_in_ton_co2_per_ton(curves)
+    assert result.tolist() == [[10], [0]]
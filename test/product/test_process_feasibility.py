@@ -0,0 +1,60 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import numpy as np
+import pytest
+
+from product.process_feasibility import ProcessFeasibility
+
+
+@pytest.fixture
+def processes(process_mock, demand_mock, energy_carrier_mock):
+    electricity = energy_carrier_mock(1, 100)
+    natural_gas = energy_carrier_mock(2, 30)
+    hydrogen = energy_carrier_mock(15, 1000)
+    return [
+        process_mock(energy_demands=[demand_mock(electricity, 2), demand_mock(natural_gas, 1)]),
+        process_mock(energy_demands=[demand_mock(hydrogen, 5)]),
+        process_mock(),
+    ]
+
+
+@pytest.fixture
+def sut(processes):
+    return ProcessFeasibility(processes)
+
+
+class TestEnergyMask:
+    @pytest.mark.parametrize('production_in_tons', [0, 10, 29.9, 30, 50, 200, 1e6])
+    def test_equals_carrier_footprints(self, sut, processes, production_in_tons):
+        result = sut.energy_mask(2030, production_in_tons)
+        expected = [process.carrier_footprint.is_available(2030, production_in_tons) for process in processes]
+        assert result.tolist() == expected
+
+    def test_availabilities_evaluated_once_per_year(self, sut, processes):
+        sut.energy_mask(2030, 10)
+        sut.energy_mask(2030, 20)
+        energy_carrier = processes[0].carrier_footprint.energy_carriers[0]
+        energy_carrier.availability_in_gj.assert_called_once_with(2030)
+
+
+class TestH2DistanceMask:
+    def test_close_pipeline(self, sut):
+        assert sut.h2_distance_mask(50).tolist() == [True, True, True]
+
+    def test_distant_pipeline(self, sut):
+        assert sut.h2_distance_mask(51).tolist() == [True, False, True]
+
+    def test_without_pipeline(self, sut):
+        assert sut.h2_distance_mask(None).tolist() == [True, False, True]
+
+
+def test_feasible_processes(sut, processes):
+    result = sut.feasible_processes(np.array([True, False, True]))
+    assert result == [processes[0], processes[2]]
+
+
+def test_without_processes():
+    sut = ProcessFeasibility([])
+    assert sut.energy_mask(2030, 10).tolist() == []
@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -30,3 +30,10 @@ def test_accept(sut):
     year = 2015
     sut.accept(visitor, year)
     assert visitor.visit_product.called
+
+
+@patch('product.product.ProcessFeasibility')
+def test_feasibility(mocked_process_feasibility, sut):
+    result = sut.feasibility
+    assert sut.feasibility is result
+    mocked_process_feasibility.assert_called_once_with(sut.available_processes)
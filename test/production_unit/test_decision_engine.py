@@ -0,0 +1,84 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import numpy as np
+import pytest
+from mock import MagicMock, patch
+
+from production_unit.decision_engine import DecisionEngine
+from production_unit.decision_kernel import DecisionKernel
+from simulation.simulation_mode import SimulationMode
+
+
+def _production_unit_mock(product, process, *, has_children=False):
+    return MagicMock(
+        product=product,
+        process=process,
+        has_children=has_children,
+        production_in_tons=10,
+        year_of_last_reinvestment=None,
+    )
+
+
+@pytest.fixture
+def sut():
+    return DecisionEngine()
+
+
+def kernel_init_mock(self, _candidate_processes):
+    self.year = None
+    self.co2_cost_in_euro_per_ton_co2 = None
+
+
+def kernel_update_mock(self, year, co2_cost_in_euro_per_ton_co2):
+    self.year = year
+    self.co2_cost_in_euro_per_ton_co2 = co2_cost_in_euro_per_ton_co2
+    self.number_of_updates = getattr(self, 'number_of_updates', 0) + 1
+
+
+@patch.object(DecisionKernel, 'update', kernel_update_mock)
+@patch.object(DecisionKernel, '__init__', kernel_init_mock)
+def test__kernel(sut):
+    product = MagicMock()
+    first_kernel = sut._kernel(product, 2030, 100)
+    second_kernel = sut._kernel(product, 2030, 100)
+    third_kernel = sut._kernel(product, 2031, 100)
+
+    assert first_kernel is second_kernel
+    assert second_kernel is third_kernel
+    assert third_kernel.number_of_updates == 2
+
+
+class TestProcessSites:
+    def test_decisions_are_applied(self, sut):
+        process = MagicMock()
+        other_process = MagicMock()
+        product = MagicMock(available_processes=[process, other_process])
+        production_unit = _production_unit_mock(product, process)
+        site = MagicMock(production_units=[production_unit])
+        kernel = MagicMock(candidate_processes=[process, other_process])
+        kernel.position = MagicMock(return_value=0)
+        kernel.decide = MagicMock(return_value=(np.array([1]), np.array([True])))
+        sut._kernel = MagicMock(return_value=kernel)
+
+        sut.process_sites([site], 2030, SimulationMode.DETERMINISTIC, 100, 1000, None)
+
+        production_unit.apply_decision.assert_called_once_with(2030, other_process, is_reinvesting=True)
+        assert not production_unit.optimize_process.called
+        distances = kernel.decide.call_args[0][3]
+        assert np.isnan(distances[0])
+
+    def test_production_units_with_children_use_object_decision(self, sut):
+        product = MagicMock(available_processes=[])
+        production_unit = _production_unit_mock(product, MagicMock(), has_children=True)
+        site = MagicMock(production_units=[production_unit])
+
+        sut.process_sites([site], 2030, SimulationMode.DETERMINISTIC, 100, 1000, 10)
+
+        production_unit.optimize_process.assert_called_once_with(2030, 100, 1, 10, 1)
+
+    def test_unknown_mode(self, sut):
+        site = MagicMock(production_units=[MagicMock()])
+        with pytest.raises(ValueError, match='Unknown simulation mode'):
+            sut.process_sites([site], 2030, 'FakeMode', 100, 1000, 10)
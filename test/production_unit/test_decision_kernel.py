@@ -0,0 +1,121 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from functools import partial
+
+import numpy as np
+import pytest
+from mock import MagicMock
+
+from process.process import Process
+from product.product import Product
+from production_unit.decision_kernel import DecisionKernel
+from production_unit.production_unit import ProductionUnit
+
+
+@pytest.fixture
+def decision_process_mock(process_mock, demand_mock):
+    # pylint: disable=too-many-arguments
+    def create_decision_process_mock(
+        id_process,
+        cost_per_ton,
+        energy_and_emission_cost,
+        energy_carrier,
+        demand_in_gj_per_ton,
+        lifetime,
+    ):
+        process = process_mock(id_process, [demand_mock(energy_carrier, demand_in_gj_per_ton)])
+        process.lifetime_in_years = lifetime
+        process.process_emission_in_ton_co2_per_ton = 0.5
+        process.production_cost_in_euro_per_ton = MagicMock(return_value=cost_per_ton)
+        process.energy_emissions_in_ton_co2_per_ton = MagicMock(return_value=0.25)
+        process.energy_and_emission_cost = MagicMock(return_value=energy_and_emission_cost)
+        process.production_cost_in_euro = partial(Process.production_cost_in_euro, process)
+        process.production_cost_parts_in_euro = partial(Process.production_cost_parts_in_euro, process)
+        process.year_of_new_investment = partial(Process.year_of_new_investment, process)
+        return process
+
+    return create_decision_process_mock
+
+
+@pytest.fixture
+def processes(energy_carrier_mock, decision_process_mock):
+    electricity = energy_carrier_mock(1, 1000)
+    hydrogen = energy_carrier_mock(15, 1000)
+    natural_gas = energy_carrier_mock(2, 50)
+    return [
+        decision_process_mock(38, 100, 30, hydrogen, 1, 20),
+        decision_process_mock(39, 90, 20, natural_gas, 1, 20),
+        decision_process_mock(40, 95, 10, electricity, 2, 30),
+        decision_process_mock(41, 95, np.nan, electricity, 2, 30),
+    ]
+
+
+@pytest.fixture
+def sut(processes):
+    kernel = DecisionKernel(processes)
+    kernel.update(2030, 100)
+    return kernel
+
+
+class TestMaskedArgmin:
+    def test_first_minimum_wins(self):
+        costs = np.array([[3.0, 1.0, 1.0]])
+        is_candidate = np.array([[True, True, True]])
+        result = DecisionKernel.masked_argmin(costs, is_candidate)
+        assert result.tolist() == [1]
+
+    def test_default_is_kept_on_tie(self):
+        costs = np.array([[3.0, 1.0, 1.0]])
+        is_candidate = np.array([[True, True, True]])
+        result = DecisionKernel.masked_argmin(costs, is_candidate, [2])
+        assert result.tolist() == [2]
+
+    def test_undefined_costs_never_win(self):
+        costs = np.array([[np.nan, 1.0], [2.0, np.nan]])
+        is_candidate = np.array([[True, True], [True, True]])
+        result = DecisionKernel.masked_argmin(costs, is_candidate, [0, 0])
+        assert result.tolist() == [0, 0]
+
+    def test_without_candidates(self):
+        costs = np.array([[3.0, 1.0]])
+        is_candidate = np.array([[False, False]])
+        assert DecisionKernel.masked_argmin(costs, is_candidate).tolist() == [-1]
+        assert DecisionKernel.masked_argmin(costs, is_candidate, [0]).tolist() == [0]
+
+
+def test_position(sut, processes):
+    assert sut.position(processes[2]) == 2
+    assert sut.position(MagicMock()) is None
+
+
+@pytest.mark.parametrize('probability_limit', [0, 1])
+def test_decide_equals_optimize_process(sut, processes, probability_limit):
+    # production in tons, position of process, year of last reinvestment, distance, pipeline cost scaling
+    units = [
+        (10, 0, 2010, 80, 1000),
+        (10, 1, 2010, 10, 1),
+        (100, 2, 2000, None, 10e12),
+        (10, 0, None, 30, 1),
+        (1, 1, 2015, 80, 1000),
+        (10, 3, 2020, 80, 1000),
+    ]
+    product = Product(1, processes)
+
+    new_positions, is_reinvesting = sut.decide(
+        [unit[0] for unit in units],
+        [unit[1] for unit in units],
+        [np.nan if unit[2] is None else unit[2] for unit in units],
+        [np.nan if unit[3] is None else unit[3] for unit in units],
+        [unit[4] for unit in units],
+        [probability_limit] * len(units),
+    )
+
+    for index, (production_in_tons, position, year_of_last_reinvestment, distance, scaling) in enumerate(units):
+        production_unit = ProductionUnit(
+            index, product, processes[position], production_in_tons, year_of_last_reinvestment
+        )
+        production_unit.optimize_process(2030, 100, scaling, distance, probability_limit)
+        assert production_unit.process is processes[new_positions[index]]
+        assert (production_unit.year_of_last_reinvestment == 2030) == is_reinvesting[index]
@@ -2,9 +2,11 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import numpy as np
 import pytest
 from mock import MagicMock, patch
 
+from process.carrier_footprint import CarrierFootprint
 from production_unit.production_unit import ProductionUnit
 
 
@@ -46,6 +48,44 @@ class TestProbabilityOfChange:
         assert result == 0
 
 
+class TestLazyWait:
+    @pytest.fixture
+    def unit(self, sut):
+        sut.process.year_of_new_investment = MagicMock(return_value=2030)
+        sut._check_production_cost_minima = MagicMock(return_value=True)
+        return sut
+
+    def test_before_end_of_life(self, unit):
+        result = unit.probability_of_change(2020, 1, 1)
+        assert result == 0
+        unit._check_production_cost_minima.assert_not_called()
+        assert unit.number_of_skipped_wait_evaluations() == 1
+
+    def test_at_end_of_life(self, unit):
+        result = unit.probability_of_change(2030, 1, 1)
+        assert result == 1
+        unit._check_production_cost_minima.assert_not_called()
+        assert unit.number_of_skipped_wait_evaluations() == 1
+
+    def test_without_year_of_last_reinvestment(self, unit):
+        unit.year_of_last_reinvestment = None
+        unit.probability_of_change(2020, 1, 1)
+        unit.probability_of_change(2021, 1, 1)
+        unit._check_production_cost_minima.assert_not_called()
+        assert unit.number_of_skipped_wait_evaluations() == 2
+
+    def test_previous_process(self, unit):
+        unit.previous_process = MagicMock()
+        unit.probability_of_change(2020, 1, 1)
+        assert unit.previous_process is unit.process
+
+    def test_with_children(self, unit):
+        child = MagicMock()
+        child.number_of_skipped_wait_evaluations.return_value = 3
+        unit._children = [child]
+        assert unit.number_of_skipped_wait_evaluations() == 3
+
+
 def test_check_production_cost_minima(sut):
     year = 2015
     co2_cost_in_euro_per_ton_co2 = 2
@@ -77,13 +117,13 @@ def test_optimize_process(sut):
 def test_process_with_min_production_cost(patched_min_object, sut):
     year = 2020
     default_process = MagicMock()
-    production_in_tons = 2
+    available_processes = ['mocked_process']
     co2_cost_in_euro_per_ton_co2 = 2
     pipeline_cost_scaling = 1
     result = sut._process_with_min_production_cost(
         year,
         default_process,
-        production_in_tons,
+        available_processes,
         co2_cost_in_euro_per_ton_co2,
         pipeline_cost_scaling,
     )
@@ -91,6 +131,50 @@ def test_process_with_min_production_cost(patched_min_object, sut):
     assert result == 'mocked_min_object'
 
 
+class TestFeasibleProcesses:
+    def test_with_close_pipeline(self, sut):
+        feasibility = sut._product.feasibility
+        feasibility.energy_mask = MagicMock(return_value=np.array([True, True, False]))
+        feasibility.h2_distance_mask = MagicMock(return_value=np.array([True, False, True]))
+        feasibility.feasible_processes = MagicMock(return_value=['mocked_process'])
+
+        result = sut._feasible_processes(2020, 10)
+
+        assert result == ['mocked_process']
+        assert feasibility.feasible_processes.call_args[0][0].tolist() == [True, False, False]
+        feasibility.h2_distance_mask.assert_called_once_with(10)
+
+    def test_energy_mask_evaluated_once_per_year(self, sut):
+        feasibility = sut._product.feasibility
+        feasibility.energy_mask = MagicMock(return_value=np.array([True]))
+        sut._energy_mask(2020)
+        sut._energy_mask(2020)
+        feasibility.energy_mask.assert_called_once_with(2020, 1)
+
+        sut.production_in_tons = 2
+        sut._energy_mask(2020)
+        assert feasibility.energy_mask.call_count == 2
+
+
+class TestProductionCosts:
+    def test_with_and_without_pipelines(self, sut):
+        process = MagicMock()
+        process.production_cost_parts_in_euro = MagicMock(return_value=(10, 3))
+        result = sut._production_costs(2020, process, 2, 3)
+        process.production_cost_parts_in_euro.assert_called_once_with(2020, 1, 2, 3)
+        assert result == (13, 11)
+
+    def test_evaluated_once_per_year(self, sut):
+        process = MagicMock()
+        process.production_cost_parts_in_euro = MagicMock(return_value=(10, 3))
+        sut._production_costs(2020, process, 2, 3)
+        sut._production_costs(2020, process, 2, 3)
+        assert process.production_cost_parts_in_euro.call_count == 1
+
+        sut._production_costs(2021, process, 2, 3)
+        assert process.production_cost_parts_in_euro.call_count == 2
+
+
 class TestProcessWithMinEnergyCost:
     @patch('utils.collection_utils.min_object', return_value='mocked_min_object')
     def test_with_available_processes(self, patched_min_object, sut):
@@ -157,7 +241,7 @@ class TestCheckEnergyAvailability:
         energy_carrier.availability_in_gj.return_value = 100  # Set availability greater than demand
         energy_demand.demand_in_gj_per_ton = 10
         sut.production_in_tons = 5  # Set the production in tons for testing
-        process.energy_demands = [energy_demand]  # Assign the energy_demand to the process
+        process.carrier_footprint = CarrierFootprint([energy_demand], [], [])
 
         # Call the method under test
         result = sut.check_energy_availability(year, process)
@@ -176,7 +260,7 @@ class TestCheckEnergyAvailability:
         energy_carrier.availability_in_gj.return_value = 10  # Set availability less than demand
         energy_demand.demand_in_gj_per_ton = 10
         sut.production_in_tons = 5  # Set the production in tons for testing
-        process.energy_demands = [energy_demand]  # Assign the energy_demand to the process
+        process.carrier_footprint = CarrierFootprint([energy_demand], [], [])
 
         # Call the method under test
         result = sut.check_energy_availability(year, process)
@@ -185,14 +269,16 @@ class TestCheckEnergyAvailability:
         assert result is False
 
 
-def test_check_h2_use(sut):
-    process = MagicMock()  # Mock the process object
-    energy_demand = MagicMock()  # Mock an energy_demand object
-    energy_carrier = MagicMock(return_value=15)
-    process.energy_demands = [energy_demand]
-    energy_demand.energy_carrier = energy_carrier
-    result = sut.check_h2_use(process)
-    assert result is True
+class TestCheckH2Use:
+    def test_with_hydrogen(self, sut, process_mock, demand_mock, energy_carrier_mock):
+        steam_demand = demand_mock(energy_carrier_mock(15), 1, 'steam_demand_in_gj_per_ton')
+        process = process_mock()
+        process.carrier_footprint = CarrierFootprint([], [], [steam_demand])
+        assert sut.check_h2_use(process) is True
+
+    def test_without_hydrogen(self, sut, process_mock, demand_mock, energy_carrier_mock):
+        process = process_mock(energy_demands=[demand_mock(energy_carrier_mock(1), 1)])
+        assert sut.check_h2_use(process) is False
 
 
 def test_check_h2_distance(sut):
@@ -210,3 +296,53 @@ def test_accept(sut):
     assert sut._product.accept.called
     assert sut.process.accept.called
     assert sut._children[0].accept.called
+
+
+class TestApplyDecision:
+    def test_with_reinvestment(self, sut):
+        process = sut.process
+        new_process = MagicMock()
+        sut.apply_decision(2030, new_process, is_reinvesting=True)
+        assert sut.previous_process is process
+        assert sut.process is new_process
+        assert sut.previous_year_of_last_reinvestment == 2020
+        assert sut.year_of_last_reinvestment == 2030
+
+    def test_without_reinvestment(self, sut):
+        sut.apply_decision(2030, sut.process, is_reinvesting=False)
+        assert sut.year_of_last_reinvestment == 2020
+
+
+def test_product(sut):
+    assert sut.product is sut._product
+
+
+class TestDecisionState:
+    def test_apply_decision_state(self, sut, process_mock):
+        first_process = process_mock(1)
+        second_process = process_mock(2)
+        sut._product.available_processes = [first_process, second_process]
+        sut.process = first_process
+        sut.previous_process = first_process
+        other_unit = ProductionUnit(2, sut._product, first_process, 1, 2020)
+        other_unit.apply_decision(2030, second_process, is_reinvesting=True)
+        other_unit._number_of_skipped_wait_evaluations = 3
+
+        sut.apply_decision_state(other_unit.decision_state())
+
+        assert sut.previous_process is first_process
+        assert sut.process is second_process
+        assert sut.previous_year_of_last_reinvestment == 2020
+        assert sut.year_of_last_reinvestment == 2030
+        assert sut.number_of_skipped_wait_evaluations() == 3
+
+    def test_with_children(self, sut):
+        child = MagicMock()
+        child.decision_state.return_value = 'mocked_child_state'
+        sut._children = [child]
+
+        state, child_states = sut.decision_state()
+        sut.apply_decision_state((state, ['mocked_new_child_state']))
+
+        assert child_states == ['mocked_child_state']
+        child.apply_decision_state.assert_called_once_with('mocked_new_child_state')
@@ -2,10 +2,12 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import numpy as np
 import pandas as pd
 import pytest
 from mock import MagicMock, patch
 
+from process.process_cost_tensor import ProcessCostTensor
 from production_unit.production_unit import ProductionUnit
 from production_unit.production_unit_factory import ProductionUnitFactory
 
@@ -59,3 +61,50 @@ def test_create_production_unit(sut):
 
     result = sut._create_production_unit(row)
     assert result is not None
+
+
+def test__product(sut):
+    sut._product_factory.create_product = MagicMock(return_value='mocked_product')
+
+    first_result = sut._product(10)
+    second_result = sut._product(10)
+
+    assert first_result == 'mocked_product'
+    assert second_result == 'mocked_product'
+    assert sut._product_factory.create_product.call_count == 1
+
+
+def test_create_process_cost_tensor(sut):
+    process = MagicMock()
+    process.cost_tensor_rows = MagicMock(return_value=[[1, 2]] * len(ProcessCostTensor.QUANTITY_NAMES))
+    sut._process_factory._processes = {(10, 100): process}
+
+    result = sut.create_process_cost_tensor([2022, 2023])
+
+    assert result.data.shape == (len(ProcessCostTensor.QUANTITY_NAMES), 1, 2)
+    assert process.use_cost_tensor.called
+
+
+def test_create_process_cost_tensor_with_demand_matrices(sut):
+    process = MagicMock(energy_demands=[], steam_demands=[], feedstock_demands=[])
+    process.annuity_on_investment_per_ton = MagicMock(return_value=1)
+    process.opex_in_euro_per_ton = MagicMock(return_value=2)
+    sut._process_factory._processes = {(10, 100): process}
+    energy_carrier_table = MagicMock(__len__=MagicMock(return_value=1))
+    energy_carrier_curves = MagicMock(matrix=MagicMock(return_value=np.array([[3.0, 4.0]])))
+
+    result = sut.create_process_cost_tensor([2022, 2023], energy_carrier_table, energy_carrier_curves)
+
+    assert result.demand_matrices is not None
+    assert list(result.matrix('opex_in_euro_per_ton')[0]) == [2, 2]
+    assert list(result.matrix('energy_carrier_cost_in_euro_per_ton')[0]) == [0, 0]
+
+
+def test_create_process_cost_cache(sut):
+    process = MagicMock()
+    sut._process_factory._processes = {(10, 100): process}
+
+    result = sut.create_process_cost_cache(100)
+
+    assert result.maximum_size == 100
+    process.use_cost_cache.assert_called_once_with(result)
@@ -0,0 +1,106 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+from mock import MagicMock
+
+from production_unit.reinvestment_scheduler import ReinvestmentScheduler
+
+
+@pytest.fixture
+def lifetime_process_mock(process_mock):
+    def create_lifetime_process_mock(id_process, lifetime_in_years):
+        process = process_mock(id_process)
+        process.year_of_new_investment = MagicMock(side_effect=lambda year: lifetime_in_years + year)
+        return process
+
+    return create_lifetime_process_mock
+
+
+def _production_unit_mock(process, year_of_last_reinvestment, *, has_children=False):
+    production_unit = MagicMock()
+    production_unit.process = process
+    production_unit.previous_process = process
+    production_unit.year_of_last_reinvestment = year_of_last_reinvestment
+    production_unit.has_children = has_children
+    return production_unit
+
+
+@pytest.fixture
+def production_units(lifetime_process_mock):
+    return [
+        _production_unit_mock(lifetime_process_mock(1, 10), 2015),
+        _production_unit_mock(lifetime_process_mock(2, 20), 2015),
+        _production_unit_mock(lifetime_process_mock(38, 30), 2000),
+        _production_unit_mock(lifetime_process_mock(3, 10), None),
+        _production_unit_mock(lifetime_process_mock(4, 10), 2000, has_children=True),
+        _production_unit_mock(lifetime_process_mock(5, 10), float('nan')),
+    ]
+
+
+@pytest.fixture
+def sites(production_units):
+    return [MagicMock(production_units=production_units[:2]), MagicMock(production_units=production_units[2:])]
+
+
+@pytest.fixture
+def sut(sites):
+    return ReinvestmentScheduler(sites)
+
+
+class TestDueProductionUnits:
+    def test_end_of_life(self, sut, sites, production_units):
+        assert sut.due_production_units(sites[0], 2025) == [production_units[0]]
+        assert sut.due_production_units(sites[1], 2025) == production_units[2:5]
+
+    def test_not_at_end_of_life(self, sut, sites, production_units):
+        assert sut.due_production_units(sites[0], 2024) == []
+        assert sut.due_production_units(sites[1], 2024) == production_units[2:5]
+
+    def test_passed_end_of_life(self, sut, sites, production_units):
+        sut.due_production_units(sites[0], 2026)
+        assert sut.due_production_units(sites[0], 2035) == [production_units[1]]
+
+
+class TestReschedule:
+    def test_new_year_of_last_reinvestment(self, sut, sites, production_units):
+        production_unit = production_units[0]
+        assert sut.due_production_units(sites[0], 2025) == [production_unit]
+
+        production_unit.year_of_last_reinvestment = 2025
+        sut.reschedule([production_unit])
+
+        assert sut.due_production_units(sites[0], 2030) == []
+        assert sut.due_production_units(sites[0], 2035) == [production_unit, production_units[1]]
+
+    def test_outdated_entries_are_skipped(self, sut, sites, production_units):
+        production_unit = production_units[1]
+        production_unit.year_of_last_reinvestment = 2020
+        sut.reschedule([production_unit])
+
+        assert sut.due_production_units(sites[0], 2035) == []
+        assert sut.due_production_units(sites[0], 2040) == [production_unit]
+
+    def test_fuel_switch(self, sut, sites, production_units, lifetime_process_mock):
+        production_unit = production_units[2]
+        production_unit.process = lifetime_process_mock(1, 10)
+        sut.reschedule([production_unit])
+        assert sut.due_production_units(sites[1], 2021) == production_units[3:5]
+
+    def test_first_reinvestment(self, sut, sites, production_units):
+        production_unit = production_units[3]
+        production_unit.year_of_last_reinvestment = 2022
+        sut.reschedule([production_unit])
+        assert production_unit not in sut.due_production_units(sites[1], 2023)
+        assert production_unit in sut.due_production_units(sites[1], 2032)
+
+
+def test_previous_process_is_reset(sut, sites, production_units):
+    production_unit = production_units[0]
+    sut.due_production_units(sites[0], 2025)
+    production_unit.previous_process = MagicMock()
+
+    sut.due_production_units(sites[0], 2026)
+
+    assert production_unit.previous_process is production_unit.process
@@ -8,15 +8,23 @@ from mock import MagicMock, patch
 
 from energy_carrier.energy_carrier_factory import EnergyCarrierFactory
 from industrial_site.site_factory import SiteFactory
+from production_unit.decision_engine import DecisionEngine
+from production_unit.reinvestment_scheduler import ReinvestmentScheduler
 from region.region import Region
+from simulation.decision_mode import DecisionMode
+from simulation.simulation_mode import SimulationMode
 
 
 def energy_carrier_factory_init_mock(self, _data_interface):
+    self.create_energy_carrier_table = MagicMock()
+    self.create_energy_carrier_curves = MagicMock(return_value='mocked_energy_carrier_curves')
     self.create_energy_carrier_map = MagicMock()
 
 
 def site_factory_init_mock(self, _data_interface, _energy_carriers):
     self.create_sites = MagicMock()
+    self.create_process_cost_tensor = MagicMock(return_value='mocked_process_cost_tensor')
+    self.create_process_cost_cache = MagicMock(return_value='mocked_process_cost_cache')
 
 
 @pytest.fixture
@@ -27,6 +35,28 @@ def sut():
     return region
 
 
+@patch.object(SiteFactory, '__init__', site_factory_init_mock)
+@patch.object(EnergyCarrierFactory, '__init__', energy_carrier_factory_init_mock)
+def test_init_with_time_span():
+    region = Region(id_region=1, data_interface=MagicMock(), time_span=[2022, 2023])
+    assert region.energy_carrier_curves == 'mocked_energy_carrier_curves'
+    assert region.process_cost_tensor == 'mocked_process_cost_tensor'
+
+
+@patch.object(SiteFactory, 'create_process_cost_tensor', return_value='mocked_process_cost_tensor')
+@patch.object(SiteFactory, 'create_sites', MagicMock())
+@patch.object(SiteFactory, '__init__', MagicMock(return_value=None))
+@patch.object(EnergyCarrierFactory, '__init__', energy_carrier_factory_init_mock)
+def test_init_with_demand_matrices(patched_create_process_cost_tensor):
+    region = Region(id_region=1, data_interface=MagicMock(), time_span=[2022], is_using_demand_matrices=True)
+    assert region.process_cost_tensor == 'mocked_process_cost_tensor'
+    patched_create_process_cost_tensor.assert_called_once_with(
+        [2022],
+        region.energy_carrier_table,
+        'mocked_energy_carrier_curves',
+    )
+
+
 def test_co2_cost_in_euro_per_ton_c02(sut):
     sut._data_interface.co2_cost_in_euro_per_ton_co2 = MagicMock(return_value='mocked_co2_cost')
     result = sut.co2_cost_in_euro_per_ton_c02(year=2020)
@@ -49,6 +79,130 @@ def test_process_year(sut):
     assert site_mock.process_year.called
 
 
+def test_process_year_with_decision_engine(sut):
+    sut.co2_cost_in_euro_per_ton_c02 = MagicMock(return_value='mocked_co2_cost')
+    sut._decision_engine = MagicMock()
+    site_mock = MagicMock()
+    sut.sites = [site_mock]
+
+    sut.process_year(2020, 'mocked_simulation_mode', 0, None)
+
+    sut._decision_engine.process_sites.assert_called_once_with(
+        [site_mock],
+        2020,
+        'mocked_simulation_mode',
+        'mocked_co2_cost',
+        1000000000,
+        None,
+    )
+    assert not site_mock.process_year.called
+
+
+class TestProcessSite:
+    def test_object_decisions(self, sut):
+        site_mock = MagicMock()
+        sut.process_site(site_mock, 2020, 'mocked_simulation_mode', 100, 1, 10)
+        site_mock.process_year.assert_called_once_with(2020, 'mocked_simulation_mode', 100, 1, 10)
+
+    def test_vectorized_decisions(self, sut):
+        sut._decision_engine = MagicMock()
+        site_mock = MagicMock()
+        sut.process_site(site_mock, 2020, 'mocked_simulation_mode', 100, 1, 10)
+        sut._decision_engine.process_sites.assert_called_once_with(
+            [site_mock], 2020, 'mocked_simulation_mode', 100, 1, 10
+        )
+
+
+@patch.object(SiteFactory, '__init__', site_factory_init_mock)
+@patch.object(EnergyCarrierFactory, '__init__', energy_carrier_factory_init_mock)
+def test_init_with_vectorized_decision_mode():
+    region = Region(id_region=1, data_interface=MagicMock(), decision_mode=DecisionMode.VECTORIZED)
+    assert isinstance(region._decision_engine, DecisionEngine)
+
+
+@patch.object(SiteFactory, '__init__', site_factory_init_mock)
+@patch.object(EnergyCarrierFactory, '__init__', energy_carrier_factory_init_mock)
+@patch.object(ReinvestmentScheduler, '__init__', MagicMock(return_value=None))
+def test_init_with_scheduled_decision_mode():
+    region = Region(id_region=1, data_interface=MagicMock(), decision_mode=DecisionMode.SCHEDULED)
+    assert isinstance(region._reinvestment_scheduler, ReinvestmentScheduler)
+
+
+@patch.object(SiteFactory, '__init__', site_factory_init_mock)
+@patch.object(EnergyCarrierFactory, '__init__', energy_carrier_factory_init_mock)
+def test_init_with_process_cost_cache():
+    region = Region(id_region=1, data_interface=MagicMock(), process_cost_cache_size=100)
+    assert region.process_cost_cache == 'mocked_process_cost_cache'
+
+
+def test_init_without_process_cost_cache(sut):
+    assert sut.process_cost_cache is None
+
+
+class TestScheduledDecisions:
+    @pytest.fixture
+    def scheduled_sut(self, sut):
+        sut.co2_cost_in_euro_per_ton_c02 = MagicMock(return_value='mocked_co2_cost')
+        sut.sites = [MagicMock(), MagicMock()]
+        due_production_units = {sut.sites[0]: ['mocked_production_unit'], sut.sites[1]: []}
+        sut._reinvestment_scheduler = MagicMock()
+        sut._reinvestment_scheduler.due_production_units = MagicMock(
+            side_effect=lambda site, _year: due_production_units[site],
+        )
+        return sut
+
+    def test_process_year(self, scheduled_sut):
+        scheduled_sut.process_year(2020, SimulationMode.DETERMINISTIC, 5, 10)
+
+        first_site, second_site = scheduled_sut.sites
+        first_site.process_production_units.assert_called_once_with(
+            ['mocked_production_unit'],
+            2020,
+            SimulationMode.DETERMINISTIC,
+            'mocked_co2_cost',
+            5,
+            10,
+        )
+        assert not second_site.process_production_units.called
+        scheduled_sut._reinvestment_scheduler.reschedule.assert_called_once_with(['mocked_production_unit'])
+
+    def test_process_year_in_monte_carlo_mode(self, scheduled_sut):
+        scheduled_sut.process_year(2020, SimulationMode.MONTE_CARLO, 5, 10)
+        for site in scheduled_sut.sites:
+            assert site.process_year.called
+        assert not scheduled_sut._reinvestment_scheduler.due_production_units.called
+
+    def test_process_site(self, scheduled_sut):
+        site = scheduled_sut.sites[0]
+        scheduled_sut.process_site(site, 2020, SimulationMode.DETERMINISTIC, 100, 1, 10)
+        site.process_production_units.assert_called_once_with(
+            ['mocked_production_unit'],
+            2020,
+            SimulationMode.DETERMINISTIC,
+            100,
+            1,
+            10,
+        )
+
+    def test_reschedule_site(self, scheduled_sut):
+        scheduled_sut.reschedule_site(scheduled_sut.sites[0], 2020, SimulationMode.DETERMINISTIC)
+        scheduled_sut._reinvestment_scheduler.reschedule.assert_called_once_with(['mocked_production_unit'])
+
+    def test_reschedule_site_in_monte_carlo_mode(self, scheduled_sut):
+        scheduled_sut.reschedule_site(scheduled_sut.sites[0], 2020, SimulationMode.MONTE_CARLO)
+        assert not scheduled_sut._reinvestment_scheduler.reschedule.called
+
+    def test_is_site_due(self, scheduled_sut):
+        first_site, second_site = scheduled_sut.sites
+        assert scheduled_sut.is_site_due(first_site, 2020, SimulationMode.DETERMINISTIC)
+        assert not scheduled_sut.is_site_due(second_site, 2020, SimulationMode.DETERMINISTIC)
+        assert scheduled_sut.is_site_due(second_site, 2020, SimulationMode.MONTE_CARLO)
+
+
+def test_is_site_due_without_scheduler(sut):
+    assert sut.is_site_due(MagicMock(), 2020, SimulationMode.DETERMINISTIC)
+
+
 def test_site_df(sut):
     sut._data_interface.site_data = pd.DataFrame(
         {
@@ -96,3 +250,15 @@ def test_get_process_ids_for_site(sut):
     result = sut.get_process_ids_for_site(id_site=2)
 
     assert result == ['mocked_process_id']
+
+
+def test_number_of_skipped_wait_evaluations(sut):
+    sut.sites = [MagicMock(), MagicMock()]
+    sut.sites[0].number_of_skipped_wait_evaluations.return_value = 2
+    sut.sites[1].number_of_skipped_wait_evaluations.return_value = 3
+    assert sut.number_of_skipped_wait_evaluations() == 5
+
+
+def test_number_of_production_units(sut):
+    sut.sites = [MagicMock(production_units=[1, 2]), MagicMock(production_units=[3])]
+    assert sut.number_of_production_units() == 3
@@ -5,9 +5,13 @@
 import pytest
 
 from data_interface import DataInterface
+from reference_data import ReferenceData
 from region.region import Region
 from region.region_factory import RegionFactory
-from test_utils.isi_mock import MagicMock, patch
+from simulation.decision_mode import DecisionMode
+from simulation.execution_mode import ExecutionMode
+from snapshot_cache import SnapshotCache
+from test_utils.isi_mock import MagicMock, patch, patch_property
 
 
 def data_interface_init_mock(
@@ -15,14 +19,30 @@ def data_interface_init_mock(
     _id_scenario,
     _scenario_options,
     _id_region,
+    _reference_data,
+    tables=None,
+    _input_database=None,
 ):
-    pass
+    self.mocked_tables = tables
+
+
+def reference_data_init_mock(
+    self,
+    _id_scenario,
+    _scenario_options,
+    tables=None,
+    input_database=None,
+):
+    self.mocked_tables = tables
+    self.mocked_input_database = input_database
 
 
 def region_init_mock(
     self,
     _region_id,
     _data_interface,
+    _time_span=None,
+    **_region_options,
 ):
     self.id = None
     self._sites = [MagicMock(), MagicMock]
@@ -31,21 +51,101 @@ def region_init_mock(
 
 @pytest.fixture
 def sut():
-    mocked_scenario_options = {'region_ids': [1, 2]}
+    mocked_scenario_options = {'region_ids': [1, 2], 'id_product_filter': [5]}
     region_factory = RegionFactory('mocked_id_scenario', mocked_scenario_options)
     return region_factory
 
 
+@patch.object(DataInterface, '__init__', data_interface_init_mock)
+@patch.object(ReferenceData, '__init__', reference_data_init_mock)
 @patch(RegionFactory._create_region, 'MockedRegion')
 def test_create_regions(sut):
     regions = sut.create_regions()
     assert regions[1] == 'MockedRegion'
     assert regions[2] == 'MockedRegion'
+    assert isinstance(sut._reference_data, ReferenceData)
 
 
 @patch.object(DataInterface, '__init__', data_interface_init_mock)
+@patch.object(ReferenceData, '__init__', reference_data_init_mock)
+@patch(RegionFactory._create_regions_in_parallel, {1: 'MockedRegion'})
+def test_create_regions_in_parallel_mode(sut):
+    sut._scenario_options['region_execution_mode'] = ExecutionMode.THREAD_POOL
+    regions = sut.create_regions()
+    assert regions == {1: 'MockedRegion'}
+
+
+class TestCreateRegionsInParallel:
+    def test_order(self, sut):
+        data_interfaces = {
+            1: MagicMock(number_of_production_units=MagicMock(return_value=1)),
+            2: MagicMock(number_of_production_units=MagicMock(return_value=5)),
+            3: MagicMock(number_of_production_units=MagicMock(return_value=3)),
+        }
+        submitted_region_ids = []
+
+        def create_region_mock(
+            region_id,
+            _data_interface,
+            _time_span,
+            *,
+            is_using_demand_matrices,
+            decision_mode,
+            process_cost_cache_size,
+        ):
+            assert not is_using_demand_matrices
+            assert decision_mode == DecisionMode.OBJECT
+            assert process_cost_cache_size is None
+            submitted_region_ids.append(region_id)
+            return 'MockedRegion' + str(region_id)
+
+        with patch.object(RegionFactory, '_create_region', create_region_mock):
+            sut._scenario_options['number_of_region_workers'] = 1
+            regions = sut._create_regions_in_parallel([1, 2, 3], data_interfaces, ExecutionMode.THREAD_POOL)
+
+        assert submitted_region_ids == [2, 3, 1]
+        assert list(regions.keys()) == [1, 2, 3]
+        assert regions[3] == 'MockedRegion3'
+
+
+class TestCreateDataInterfacesWithSnapshotCache:
+    @patch.object(DataInterface, '__init__', data_interface_init_mock)
+    @patch.object(ReferenceData, '__init__', reference_data_init_mock)
+    @patch.object(SnapshotCache, 'key', MagicMock(return_value='mocked_key'))
+    @patch.object(SnapshotCache, 'save')
+    @patch.object(SnapshotCache, 'load', MagicMock(return_value=None))
+    def test_cold_start(self, patched_save, sut):
+        with (
+            patch_property(ReferenceData.tables, 'mocked_reference_tables'),
+            patch_property(DataInterface.tables, 'mocked_tables'),
+        ):
+            data_interfaces = sut._create_data_interfaces_with_snapshot_cache([1, 2])
+        assert data_interfaces[1].mocked_tables is None
+
+        snapshot = patched_save.call_args.args[1]
+        assert snapshot['reference_data'] == 'mocked_reference_tables'
+        assert snapshot['regions'] == {1: 'mocked_tables', 2: 'mocked_tables'}
+
+    @patch.object(DataInterface, '__init__', data_interface_init_mock)
+    @patch.object(ReferenceData, '__init__', reference_data_init_mock)
+    @patch.object(SnapshotCache, 'key', MagicMock(return_value='mocked_key'))
+    @patch.object(SnapshotCache, 'save')
+    @patch.object(
+        SnapshotCache,
+        'load',
+        MagicMock(
+            return_value={'reference_data': 'mocked_reference_tables', 'regions': {1: 'mocked_tables_1', 2: None}},
+        ),
+    )
+    def test_warm_start(self, patched_save, sut):
+        data_interfaces = sut._create_data_interfaces_with_snapshot_cache([1, 2])
+        assert data_interfaces[1].mocked_tables == 'mocked_tables_1'
+        assert sut._reference_data.mocked_tables == 'mocked_reference_tables'
+        assert not patched_save.called
+
+
 @patch.object(Region, '__init__', region_init_mock)
 def test_create_region(sut):
     region_id = 1
-    region = sut._create_region(region_id)
+    region = sut._create_region(region_id, 'mocked_data_interface')
     assert isinstance(region, Region)
@@ -0,0 +1,14 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from simulation.decision_mode import DecisionMode
+
+
+def test_decision_mode():
+    enum_value = DecisionMode.VECTORIZED
+    assert enum_value.value == 2
+
+
+def test_scheduled_decision_mode():
+    assert DecisionMode.SCHEDULED.value == 3
@@ -0,0 +1,10 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from simulation.execution_mode import ExecutionMode
+
+
+def test_execution_mode():
+    enum_value = ExecutionMode.SEQUENTIAL
+    assert enum_value.value == 1
@@ -0,0 +1,103 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from simulation.execution_mode import ExecutionMode
+from simulation.product_partitioned_simulation import ProductPartitionedSimulation
+from simulation.simulation_mode import SimulationMode
+
+
+@pytest.fixture
+def scenario_options():
+    return {
+        'id_product_filter': [],
+        'region_ids': [1, 2],
+        'simulation_mode': SimulationMode.DETERMINISTIC,
+        'region_execution_mode': ExecutionMode.PROCESS_POOL,
+        'is_using_snapshot_cache': True,
+    }
+
+
+def visitor_mock(merged_results):
+    visitor = MagicMock()
+    visitor.create_partial_visitor.side_effect = lambda _region_ids: visitor_mock(merged_results)
+    visitor.merge_partial_results.side_effect = merged_results.append
+    visitor.partial_results.return_value = 'mocked_combined_results'
+    return visitor
+
+
+class TestRun:
+    @pytest.mark.parametrize('execution_mode', [ExecutionMode.SEQUENTIAL, ExecutionMode.THREAD_POOL])
+    def test_run(self, scenario_options, execution_mode):
+        merged_results = []
+        visitor = visitor_mock(merged_results)
+        sut = ProductPartitionedSimulation(
+            1,
+            scenario_options,
+            [2015],
+            [visitor],
+            execution_mode=execution_mode,
+            number_of_workers=2,
+        )
+        sut._number_of_production_units_by_product = MagicMock(return_value={5: 1, 22: 3, 51: 2})
+
+        with patch.object(
+            ProductPartitionedSimulation,
+            'simulate_partition',
+            lambda _self, id_product: (id_product, ['results of product ' + str(id_product)]),
+        ):
+            sut.run()
+
+        assert merged_results == [
+            'results of product 5',
+            'results of product 22',
+            'results of product 51',
+            'mocked_combined_results',
+        ]
+        assert visitor.finalize.called
+
+
+class TestSimulatePartition:
+    @patch('simulation.product_partitioned_simulation.Simulation')
+    @patch('simulation.product_partitioned_simulation.RegionFactory')
+    def test_simulate_partition(self, patched_region_factory, patched_simulation, scenario_options):
+        regions = {1: MagicMock(), 2: MagicMock()}
+        patched_region_factory.return_value.create_regions.return_value = regions
+        patched_simulation.return_value.simulate_regions.return_value = (regions, ['mocked_partial_results'])
+        visitors = [MagicMock()]
+        sut = ProductPartitionedSimulation(1, scenario_options, [2015], visitors)
+
+        result = sut.simulate_partition(22)
+
+        assert result == (22, ['mocked_partial_results'])
+        partition_options = patched_region_factory.call_args.args[1]
+        assert partition_options['id_product_filter'] == [22]
+        assert partition_options['region_execution_mode'] == ExecutionMode.SEQUENTIAL
+        assert not partition_options['is_using_snapshot_cache']
+        assert scenario_options['id_product_filter'] == []
+        patched_simulation.assert_called_once_with(SimulationMode.DETERMINISTIC, [2015], regions, visitors)
+        patched_simulation.return_value.simulate_regions.assert_called_once_with([1, 2])
+
+
+class TestProductQuery:
+    def test_without_filter(self):
+        query = ProductPartitionedSimulation.product_query([1, 2], [])
+        assert 'site.id_region IN (?, ?)' in query
+        assert 'production_unit.id_product IN' not in query
+        assert query.endswith('GROUP BY production_unit.id_product ORDER BY production_unit.id_product')
+
+    def test_with_filter(self):
+        query = ProductPartitionedSimulation.product_query([1], [5, 22, 51])
+        assert 'production_unit.id_product IN (?, ?, ?)' in query
+
+
+def test_process_pool_without_fork(scenario_options):
+    with (
+        patch('multiprocessing.get_all_start_methods', return_value=['spawn']),
+        pytest.raises(ValueError, match='requires forked worker processes'),
+    ):
+        ProductPartitionedSimulation(1, scenario_options, [2015], [], execution_mode=ExecutionMode.PROCESS_POOL)
@@ -2,10 +2,11 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from simulation.execution_mode import ExecutionMode
 from simulation.simulation import Simulation
 from simulation.simulation_mode import SimulationMode
 
@@ -31,3 +32,89 @@ def test_run(sut):
 def test_process_year(sut):
     sut._process_year(2015)
     assert sut.region.process_year.called
+
+
+def test_run_without_pipelines():
+    region = MagicMock(process_cost_cache=None)
+    region.number_of_skipped_wait_evaluations.return_value = 0
+    visitor = Mock()
+    simulation = Simulation(SimulationMode.DETERMINISTIC, [2015, 2016], {1: region}, [visitor])
+
+    simulation.run()
+
+    region.process_year.assert_called_with(2016, SimulationMode.DETERMINISTIC, 1, 0)
+    assert region.accept.call_count == 2
+    assert visitor.finalize.called
+
+
+class TestRunInParallel:
+    @staticmethod
+    def _region_mock(id_region, number_of_production_units):
+        region = MagicMock(process_cost_cache=None)
+        region.id = id_region
+        region.number_of_production_units.return_value = number_of_production_units
+        region.number_of_skipped_wait_evaluations.return_value = 0
+        return region
+
+    def test_run(self):
+        regions = {
+            1: self._region_mock(1, 1),
+            2: self._region_mock(2, 5),
+            3: self._region_mock(3, 2),
+        }
+        merged_results = []
+        visitor = MagicMock()
+        visitor.create_partial_visitor.side_effect = lambda _region_ids: MagicMock(
+            partial_results=MagicMock(return_value='mocked_partial_results'),
+        )
+        visitor.merge_partial_results.side_effect = merged_results.append
+        simulation = Simulation(
+            SimulationMode.DETERMINISTIC,
+            [2015, 2016],
+            regions,
+            [visitor],
+            execution_mode=ExecutionMode.THREAD_POOL,
+            number_of_workers=2,
+        )
+
+        simulation.run()
+
+        for region in regions.values():
+            assert region.process_year.call_count == 2
+            assert region.accept.call_count == 2
+        assert list(simulation.regions) == [1, 2, 3]
+        assert merged_results == ['mocked_partial_results'] * 2
+        assert visitor.finalize.called
+
+    def test_merge_order(self):
+        regions = {1: self._region_mock(1, 5), 2: self._region_mock(2, 1), 3: self._region_mock(3, 1)}
+        visitor = MagicMock()
+        simulation = Simulation(
+            SimulationMode.DETERMINISTIC,
+            [2015],
+            regions,
+            [visitor],
+            execution_mode=ExecutionMode.THREAD_POOL,
+            number_of_workers=2,
+        )
+        shard_results = {
+            (1,): ({1: regions[1]}, ['results of region 1']),
+            (2, 3): ({2: regions[2], 3: regions[3]}, ['results of regions 2 and 3']),
+        }
+
+        with patch(
+            'utils.executor_utils.map_in_forked_workers',
+            lambda _function, shards, _state, _execution_mode: [shard_results[tuple(shard)] for shard in shards],
+        ):
+            simulation._run_in_parallel()
+
+        merged_results = [call.args[0] for call in visitor.merge_partial_results.call_args_list]
+        assert merged_results == ['results of region 1', 'results of regions 2 and 3']
+
+
+def test_process_pool_without_fork():
+    with (
+        patch('multiprocessing.get_all_start_methods', return_value=['spawn']),
+        pytest.raises(ValueError, match='requires forked worker processes'),
+    ):
+        Simulation(SimulationMode.DETERMINISTIC, [2015], {}, [], execution_mode=ExecutionMode.PROCESS_POOL)
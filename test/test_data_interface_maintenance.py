@@ -0,0 +1,101 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import sqlite3
+
+import pytest
+
+import data_interface_maintenance
+from data_interface_maintenance import IndexAdvisor
+from reference_data import ReferenceData
+
+
+def _create_input_tables(connection):
+    connection.execute('CREATE TABLE id_scenario (id integer PRIMARY KEY NOT NULL, name text NOT NULL)')
+    connection.execute(
+        'CREATE TABLE site (id integer PRIMARY KEY NOT NULL, id_region integer NOT NULL, id_company integer,'
+        ' latitude real, longitude real, co2_equivalent_2015_in_tons real)'
+    )
+    connection.execute(
+        'CREATE TABLE production_unit (id integer PRIMARY KEY NOT NULL, id_site integer NOT NULL,'
+        ' id_product integer NOT NULL, id_process integer NOT NULL, production_in_tons real NOT NULL,'
+        ' year_of_last_reinvestment integer NOT NULL)'
+    )
+    for table_name, column_names in ReferenceData.SCENARIO_REGION_TABLE_COLUMNS.items():
+        all_column_names = ReferenceData.SCENARIO_REGION_INDEX_COLUMNS + column_names
+        connection.execute('CREATE TABLE ' + table_name + ' (' + ', '.join(all_column_names) + ')')
+
+    connection.execute("INSERT INTO id_scenario VALUES (1, 'reference')")
+    sites = [(id_site, id_site % 10, 0, 0, 0, 0) for id_site in range(100)]
+    connection.executemany('INSERT INTO site VALUES (?, ?, ?, ?, ?, ?)', sites)
+    connection.execute('INSERT INTO production_unit VALUES (100, 10, 5, 11, 1000, 2010)')
+
+
+@pytest.fixture
+def sut():
+    connection = sqlite3.connect(':memory:')
+    _create_input_tables(connection)
+    index_advisor = IndexAdvisor(connection, number_of_repetitions=1)
+    yield index_advisor
+    connection.close()
+
+
+def test_missing_indices(sut):
+    result = sut.missing_indices()
+    assert result.keys() == sut.recommended_indices().keys()
+
+
+def test_create_missing_indices(sut):
+    created_indices = sut.create_missing_indices()
+    assert 'index_site_id_region' in created_indices
+    assert sut.missing_indices() == {}
+
+
+def test_query_shapes(sut):
+    result = sut.query_shapes()
+    query, params = result['production_unit_by_product']
+    assert 'production_unit.id_product IN (?)' in query
+    assert params == [0, 5]
+
+
+def test_migrate(sut):
+    _created_indices, report_before, report_after = sut.migrate()
+
+    assert report_before['site']['plan'] == ['SCAN site']
+    assert 'index_site_id_region' in report_after['site']['plan'][0]
+    assert report_after['production_unit']['time_in_ms'] >= 0
+
+
+def test_report(sut):
+    missing_indices, query_report = sut.report()
+    assert len(missing_indices) > 0
+    assert 'energy_carrier_cost' in query_report
+
+
+class TestMain:
+    def test_dry_run(self, tmp_path):
+        database_path = str(tmp_path / 'input.sqlite')
+        connection = sqlite3.connect(database_path)
+        _create_input_tables(connection)
+        connection.commit()
+        connection.close()
+
+        data_interface_maintenance.main(['--database', database_path, '--dry-run'])
+
+        connection = sqlite3.connect(database_path)
+        assert len(IndexAdvisor(connection).missing_indices()) > 0
+        connection.close()
+
+    def test_migration(self, tmp_path):
+        database_path = str(tmp_path / 'input.sqlite')
+        connection = sqlite3.connect(database_path)
+        _create_input_tables(connection)
+        connection.commit()
+        connection.close()
+
+        data_interface_maintenance.main(['--database', database_path])
+
+        connection = sqlite3.connect(database_path)
+        assert IndexAdvisor(connection).missing_indices() == {}
+        connection.close()
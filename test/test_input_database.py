@@ -0,0 +1,49 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import sqlite3
+
+import pytest
+
+from input_database import InputDatabase
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    path = str(tmp_path / 'input.sqlite')
+    connection = sqlite3.connect(path)
+    connection.execute('CREATE TABLE foo (id integer PRIMARY KEY NOT NULL, baa real)')
+    connection.execute('INSERT INTO foo VALUES (1, 10.0)')
+    connection.commit()
+    connection.close()
+    return path
+
+
+def test_default_path():
+    sut = InputDatabase({})
+    assert sut.path == './input/input.sqlite'
+
+
+class TestConnect:
+    def test_read_only_file(self, database_path):
+        sut = InputDatabase({'input_database_path': database_path})
+        connection = sut.connect()
+
+        assert connection.execute('SELECT baa from foo').fetchall() == [(10.0,)]
+        assert connection.execute('PRAGMA cache_size').fetchone()[0] == -InputDatabase.CACHE_SIZE_IN_KIBIBYTES
+        with pytest.raises(sqlite3.OperationalError):
+            connection.execute('INSERT INTO foo VALUES (2, 20.0)')
+        connection.close()
+
+    def test_memory_copy(self, database_path):
+        sut = InputDatabase({'input_database_path': database_path, 'is_copying_input_into_memory': True})
+        first_connection = sut.connect()
+        second_connection = sut.connect()
+
+        assert first_connection.execute('SELECT baa from foo').fetchall() == [(10.0,)]
+        assert second_connection.execute('SELECT baa from foo').fetchall() == [(10.0,)]
+        with pytest.raises(sqlite3.OperationalError):
+            second_connection.execute('INSERT INTO foo VALUES (2, 20.0)')
+        first_connection.close()
+        second_connection.close()
@@ -2,11 +2,14 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import pytest
 from mock import Mock, patch
 
 import main
+from mesa_wrapper.mesa_batch_runner import MesaBatchRunner
 from mesa_wrapper.mesa_server import MesaServer
 from region.region_factory import RegionFactory
+from simulation.product_partitioned_simulation import ProductPartitionedSimulation
 from simulation.simulation import Simulation
 from utils import time_utils
 
@@ -17,6 +20,7 @@ def simulation_init_mock(
     _time_span,
     _co2_cost,
     _region,
+    **_options,
 ):
     self.run = Mock()
 
@@ -31,10 +35,22 @@ def mesa_server_init_mock(
     self.run = Mock()
 
 
+def mesa_batch_runner_init_mock(
+    self,
+    _simulation_mode,
+    _time_span,
+    _regions,
+    _visitors,
+    **_options,
+):
+    self.run = Mock()
+
+
 def region_factory_init_mock(
     self,
     _id_scenario,
     _scenario_options,
+    _time_span=None,
 ):
     self.create_regions = Mock()
 
@@ -83,3 +99,47 @@ class TestSimulate:
         except Exception as exception:
             message = f'simulation raised an exception {exception}'
             raise AssertionError(message) from exception
+
+    @patch.object(RegionFactory, '__init__', region_factory_init_mock)
+    @patch.object(MesaBatchRunner, '__init__', mesa_batch_runner_init_mock)
+    @patch.object(MesaServer, '__init__')
+    def test_with_mesa_batch_runner(self, patched_mesa_server_init):
+        id_scenario = 1
+        time_span = []
+
+        scenario_options = {
+            'simulation_mode': 'mocked_simulation_mode',
+            'is_using_mesa': True,
+            'is_using_mesa_server': False,
+        }
+
+        main.simulate(id_scenario, time_span, scenario_options)
+
+        assert not patched_mesa_server_init.called
+
+    @patch.object(ProductPartitionedSimulation, 'run')
+    @patch.object(RegionFactory, '__init__')
+    def test_with_product_partitions(self, patched_region_factory_init, patched_run):
+        id_scenario = 1
+        time_span = []
+
+        scenario_options = {
+            'simulation_mode': 'mocked_simulation_mode',
+            'is_using_mesa': False,
+            'is_partitioning_products': True,
+        }
+
+        main.simulate(id_scenario, time_span, scenario_options)
+
+        assert patched_run.called
+        assert not patched_region_factory_init.called
+
+    def test_with_product_partitions_and_mesa(self):
+        scenario_options = {
+            'simulation_mode': 'mocked_simulation_mode',
+            'is_using_mesa': True,
+            'is_partitioning_products': True,
+        }
+
+        with pytest.raises(ValueError, match='without mesa'):
+            main.simulate(1, [], scenario_options)
@@ -0,0 +1,90 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pandas as pd
+import pytest
+from mock import patch
+
+from reference_data import ReferenceData
+
+
+@pytest.fixture
+def sut():
+    scenario_options = {
+        'id_product_filter': [],
+        'region_ids': [10, 11],
+    }
+
+    with (
+        patch('sqlite3.connect'),
+        patch('pandas.read_sql_query'),
+        patch('utils.collection_utils.join_with_comma'),
+    ):
+        return ReferenceData(
+            id_scenario=1,
+            scenario_options=scenario_options,
+        )
+
+
+def test__read_energy_carrier_data(sut):
+    with patch('pandas.read_sql_query') as patched_read_sql_query:
+        sut._read_energy_carrier_data(connection='mocked_connection')
+        assert patched_read_sql_query.called
+
+
+class TestReadProductProcessMapping:
+    def test__without_product_filter(self, sut):
+        df_mock = pd.DataFrame({'id_product': [1], 'id_process': [10]})
+        with patch('utils.collection_utils.join_with_comma'), patch('pandas.read_sql_query', return_value=df_mock):
+            result = sut._read_product_process_mapping(connection='mocked_connection', id_product_filter=[])
+            assert result[1].equals(df_mock)
+
+    def test__with_product_filter(self, sut):
+        with (
+            patch('utils.collection_utils.join_with_comma'),
+            patch('pandas.read_sql_query', return_value=pd.DataFrame()),
+        ):
+            result = sut._read_product_process_mapping(connection='mocked_connection', id_product_filter=[2])
+            assert len(result) == 0
+
+
+class TestReadProcessEnergyCarrierMapping:
+    def test__without_product_filter(self, sut):
+        df_mock = pd.DataFrame({'id_product': [1], 'id_process': [10], 'id_energy_carrier': [10], 'fuel_share': [0.5]})
+        with patch('utils.collection_utils.join_with_comma'), patch('pandas.read_sql_query', return_value=df_mock):
+            result = sut._read_process_energy_carrier_mapping(connection='mocked_connection', id_product_filter=[])
+            assert result[1].equals(df_mock)
+
+    def test__with_product_filter(self, sut):
+        with (
+            patch('utils.collection_utils.join_with_comma'),
+            patch('pandas.read_sql_query', return_value=pd.DataFrame()),
+        ):
+            result = sut._read_process_energy_carrier_mapping(connection='mocked_connection', id_product_filter=[2])
+            assert len(result) == 0
+
+
+def test__read_energy_carrier_cost_mapping(sut):
+    df_mock = pd.DataFrame({'id_product': [1], 'id_process': [10], 'id_energy_carrier': [10], 'fuel_share': [0.5]})
+    with patch('utils.collection_utils.join_with_comma'), patch('pandas.read_sql_query', return_value=df_mock):
+        result = sut._read_energy_carrier_cost_mapping('mocked_connection')
+        assert result.equals(df_mock)
+
+
+def test__read_energy_carrier_emission_mapping(sut):
+    df_mock = pd.DataFrame({'id_product': [1], 'id_process': [10], 'id_energy_carrier': [10], 'fuel_share': [0.5]})
+    with patch('utils.collection_utils.join_with_comma'), patch('pandas.read_sql_query', return_value=df_mock):
+        result = sut._read_energy_carrier_emission_mapping('mocked_connection')
+        assert result.equals(df_mock)
+
+
+def test__read_scenario_region_table(sut):
+    with patch('pandas.read_sql_query', return_value=pd.DataFrame()) as patched_read_sql_query:
+        sut._read_scenario_region_table('mocked_connection', 'energy_carrier_taxes')
+        query = patched_read_sql_query.call_args.args[0]
+        assert query == (
+            'SELECT id_scenario, id_region, id_energy_carrier, taxes_2015_in_euro_per_gj, taxes_2050_in_euro_per_gj'
+            ' from energy_carrier_taxes WHERE id_scenario = ? AND id_region IN (?, ?)'
+        )
+        assert patched_read_sql_query.call_args.kwargs['params'] == [1, 10, 11]
@@ -0,0 +1,56 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pandas as pd
+import pytest
+
+from snapshot_cache import SnapshotCache
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    path = tmp_path / 'input.sqlite'
+    path.write_bytes(b'mocked_database_content')
+    return path
+
+
+@pytest.fixture
+def sut(tmp_path, database_path):
+    return SnapshotCache(str(database_path), str(tmp_path / 'cache'))
+
+
+class TestKey:
+    def test_same_input(self, sut):
+        assert sut.key(1, [5], [1, 2]) == sut.key(1, [5], [1, 2])
+
+    def test_changed_options(self, sut):
+        key = sut.key(1, [5], [1, 2])
+        assert sut.key(2, [5], [1, 2]) != key
+        assert sut.key(1, [], [1, 2]) != key
+        assert sut.key(1, [5], [1]) != key
+
+    def test_changed_database(self, sut, database_path):
+        key = sut.key(1, [5], [1, 2])
+        database_path.write_bytes(b'changed_database_content')
+        assert sut.key(1, [5], [1, 2]) != key
+
+
+def test_load_without_snapshot(sut):
+    assert sut.load('missing_key') is None
+
+
+def test_save_and_load(sut):
+    df = pd.DataFrame({'id': [1, 2], 'foo': [10.0, 20.0]}).set_index(['id'])
+    sut.save('key', {'table': df})
+
+    result = sut.load('key')
+    assert result['table'].equals(df)
+
+
+def test_save_deletes_outdated_snapshots(sut):
+    sut.save('old_key', {})
+    sut.save('new_key', {})
+
+    assert sut.load('old_key') is None
+    assert sut.load('new_key') == {}
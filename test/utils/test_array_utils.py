@@ -0,0 +1,53 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import numpy as np
+import pytest
+
+from utils import array_utils, numba_utils
+
+MASKED_ARGMIN_FUNCTIONS = [array_utils.masked_argmin, numba_utils.python_function(array_utils.masked_argmin)]
+IS_COVERING_DEMANDS_FUNCTIONS = [
+    array_utils.is_covering_demands,
+    numba_utils.python_function(array_utils.is_covering_demands),
+]
+
+
+@pytest.mark.parametrize('masked_argmin', MASKED_ARGMIN_FUNCTIONS)
+class TestMaskedArgmin:
+    def test_first_minimum_wins(self, masked_argmin):
+        costs = np.array([[3.0, 1.0, 1.0], [2.0, np.nan, 0.5]])
+        is_candidate = np.array([[True, True, True], [True, True, False]])
+        found_positions = np.full(2, -1, dtype=np.int64)
+        found_costs = np.full(2, np.nan)
+        result = masked_argmin(costs, is_candidate, found_positions, found_costs)
+        assert result.tolist() == [1, 0]
+        assert found_costs.tolist() == [1.0, 2.0]
+
+    def test_without_candidate(self, masked_argmin):
+        costs = np.array([[3.0, 1.0]])
+        is_candidate = np.array([[False, False]])
+        result = masked_argmin(costs, is_candidate, np.full(1, -1, dtype=np.int64), np.full(1, np.nan))
+        assert result.tolist() == [-1]
+
+    def test_with_start_values(self, masked_argmin):
+        costs = np.array([[1.0, 2.0, 2.0]])
+        is_candidate = np.array([[True, True, True]])
+        result = masked_argmin(costs, is_candidate, np.array([2], dtype=np.int64), np.array([2.0]))
+        assert result.tolist() == [0]
+
+
+@pytest.mark.parametrize('is_covering_demands', IS_COVERING_DEMANDS_FUNCTIONS)
+def test_is_covering_demands(is_covering_demands):
+    availabilities = np.array([10.0, 4.0])
+    demands_per_ton = np.array([1.0, 2.0])
+    production_in_tons = np.array([1.0, 2.0, 3.0])
+    result = is_covering_demands(availabilities, demands_per_ton, production_in_tons)
+    assert result.tolist() == [True, False, False]
+
+
+@pytest.mark.parametrize('is_covering_demands', IS_COVERING_DEMANDS_FUNCTIONS)
+def test_is_covering_demands_without_demands(is_covering_demands):
+    result = is_covering_demands(np.empty(0), np.empty(0), np.array([1.0, 2.0]))
+    assert result.tolist() == [True, True]
@@ -0,0 +1,89 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from mock import patch
+
+from simulation.execution_mode import ExecutionMode
+from utils import executor_utils
+
+
+class TestCreateExecutor:
+    def test_thread_pool(self):
+        with executor_utils.create_executor(ExecutionMode.THREAD_POOL, 2) as executor:
+            assert isinstance(executor, ThreadPoolExecutor)
+            assert executor.submit(abs, -1).result() == 1
+
+    def test_process_pool(self):
+        with executor_utils.create_executor(ExecutionMode.PROCESS_POOL, 1) as executor:
+            assert isinstance(executor, ProcessPoolExecutor)
+
+    def test_process_pool_with_context(self):
+        mp_context = multiprocessing.get_context('fork')
+        with executor_utils.create_executor(ExecutionMode.PROCESS_POOL, 1, mp_context) as executor:
+            assert executor._mp_context is mp_context
+
+    def test_sequential(self):
+        with pytest.raises(ValueError, match='Unsupported execution mode'):
+            executor_utils.create_executor(ExecutionMode.SEQUENTIAL)
+
+
+def _sum_of_state_items(state, positions):
+    return sum(state[position] for position in positions)
+
+
+def _random_number(_state, _shard):
+    return random.random()
+
+
+class TestMapInForkedWorkers:
+    @pytest.mark.parametrize('execution_mode', [ExecutionMode.THREAD_POOL, ExecutionMode.PROCESS_POOL])
+    def test_results(self, execution_mode):
+        result = executor_utils.map_in_forked_workers(
+            _sum_of_state_items,
+            [[0, 2], [1]],
+            [10, 20, 30],
+            execution_mode,
+        )
+        assert result == [40, 20]
+        assert executor_utils._worker_state == {}
+
+    def test_reseeding(self):
+        random.seed(1)
+        result = executor_utils.map_in_forked_workers(_random_number, [[0], [1]], None)
+        assert result[0] != result[1]
+
+
+class TestCheckForkedExecutionMode:
+    def test_process_pool_without_fork(self):
+        with (
+            patch('multiprocessing.get_all_start_methods', return_value=['spawn']),
+            pytest.raises(ValueError, match='requires forked worker processes'),
+        ):
+            executor_utils.check_forked_execution_mode(ExecutionMode.PROCESS_POOL)
+
+    def test_sequential_without_fork(self):
+        with patch('multiprocessing.get_all_start_methods', return_value=['spawn']):
+            executor_utils.check_forked_execution_mode(ExecutionMode.SEQUENTIAL)
+
+    def test_process_pool_with_fork(self):
+        executor_utils.check_forked_execution_mode(ExecutionMode.PROCESS_POOL)
+
+
+class TestBalancedShards:
+    def test_balanced_weights(self):
+        weights = {'a': 5, 'b': 1, 'c': 4, 'd': 2, 'e': 3}
+        result = executor_utils.balanced_shards(list(weights), weights.get, 2)
+        assert result == [['a', 'b', 'd'], ['c', 'e']]
+
+    def test_more_shards_than_items(self):
+        result = executor_utils.balanced_shards([1, 2], lambda _item: 1, 4)
+        assert result == [[1], [2]]
+
+    def test_without_items(self):
+        assert executor_utils.balanced_shards([], lambda _item: 1, 4) == []
@@ -0,0 +1,57 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from math import isclose
+
+import numpy as np
+import pytest
+import shapely
+from shapely.geometry import LineString, Point
+
+from utils import geo_utils, numba_utils
+
+
+@pytest.mark.parametrize(
+    'haversine_distance',
+    [geo_utils.haversine_distance, numba_utils.python_function(geo_utils.haversine_distance)],
+)
+def test_haversine_distance(haversine_distance):
+    distance = haversine_distance(0.0, 0.0, 0.0, 1.0)
+    assert isclose(distance, 111.19492664, rel_tol=1e-9)
+    assert haversine_distance(48.1, 11.6, 48.1, 11.6) == 0
+
+
+class TestClosestPointOnLine:
+    def test_projection(self):
+        coordinates = np.array([[0.0, 0.0], [2.0, 0.0], [2.0, 2.0]])
+        result = geo_utils.closest_point_on_line(1.0, 1.0, coordinates, 0, 3)
+        assert result == (1.0, 0.0)
+
+    def test_clamped_to_end_point(self):
+        coordinates = np.array([[0.0, 0.0], [2.0, 0.0]])
+        result = geo_utils.closest_point_on_line(3.0, 1.0, coordinates, 0, 2)
+        assert result == (2.0, 0.0)
+
+    def test_equals_shapely(self):
+        line = LineString([(5.1, 47.3), (7.9, 49.2), (8.4, 52.7), (11.2, 53.1)])
+        point = Point(8.9, 50.4)
+        expected = line.interpolate(line.project(point)).coords[0]
+        coordinates, _line_offsets = geo_utils.line_coordinates([line])
+        result = geo_utils.closest_point_on_line(point.x, point.y, coordinates, 0, len(coordinates))
+        assert result == pytest.approx(expected, rel=1e-12)
+
+
+def test_min_distance_to_lines_in_km():
+    lines = [LineString([(0.0, 1.0), (1.0, 1.0)]), LineString([(0.0, 0.5), (1.0, 0.5)])]
+    coordinates, line_offsets = geo_utils.line_coordinates(lines)
+    result = geo_utils.min_distance_to_lines_in_km(0.5, 0.0, coordinates, line_offsets)
+    assert result == geo_utils.haversine_distance(0.5, 0.0, 0.5, 0.5)
+
+
+def test_line_coordinates():
+    lines = [LineString([(0, 0), (1, 1), (2, 2)]), LineString([(3, 3), (4, 4)])]
+    coordinates, line_offsets = geo_utils.line_coordinates(lines)
+    assert coordinates.tolist() == shapely.get_coordinates(lines).tolist()
+    assert line_offsets.tolist() == [0, 3, 5]
+    assert line_offsets.dtype == np.int64
@@ -0,0 +1,58 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import os
+
+import numpy as np
+import pytest
+from mock import MagicMock, patch
+
+from utils import numba_utils
+
+
+def _add(a, b):
+    return a + b
+
+
+def _divide(a, b):
+    return a / b
+
+
+class TestIsNumbaEnabled:
+    @patch.dict(os.environ, {}, clear=True)
+    def test_default(self):
+        assert numba_utils.is_numba_enabled()
+
+    @patch.dict(os.environ, {numba_utils.DISABLE_NUMBA_VARIABLE: '1'})
+    def test_disabled(self):
+        assert not numba_utils.is_numba_enabled()
+
+
+class TestJit:
+    @patch('utils.numba_utils.is_numba_enabled', MagicMock(return_value=True))
+    def test_enabled(self):
+        kernel = numba_utils.jit(_add)
+        assert kernel is not _add
+        assert kernel(1.5, 2.0) == 3.5
+        assert numba_utils.python_function(kernel) is _add
+
+    @patch('utils.numba_utils.is_numba_enabled', MagicMock(return_value=False))
+    def test_disabled(self):
+        kernel = numba_utils.jit(_add)
+        assert kernel is _add
+        assert numba_utils.python_function(kernel) is _add
+
+    @patch('utils.numba_utils.is_numba_enabled', MagicMock(return_value=True))
+    def test_division_by_zero(self):
+        kernel = numba_utils.jit(_divide)
+        assert kernel(1.0, 0.0) == float('inf')
+
+    @patch.dict(os.environ, {numba_utils.DISABLE_NUMBA_VARIABLE: '1'})
+    def test_division_by_zero_disabled(self):
+        kernel = numba_utils.jit(_divide)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            assert kernel(np.float64(1.0), np.float64(0.0)) == float('inf')
+            assert np.isnan(kernel(np.float64(0.0), np.float64(0.0)))
+        with pytest.raises(ZeroDivisionError):
+            kernel(1.0, 0.0)
@@ -0,0 +1,39 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pandas as pd
+import pytest
+
+from utils import share_utils
+
+
+@pytest.fixture
+def grouped_shares():
+    share_mapping = pd.DataFrame(
+        {
+            'id_product': [1, 1, 2],
+            'id_process': [10, 10, 20],
+            'id_energy_carrier': [100, 101, 100],
+            'fuel_share': [0.25, 0.75, 1.0],
+        },
+    ).set_index(['id_product', 'id_process'])
+    return share_utils.group_shares(share_mapping, 'fuel_share')
+
+
+def test_group_shares(grouped_shares):
+    energy_carrier_ids, shares = grouped_shares[(1, 10)]
+    assert list(energy_carrier_ids) == [100, 101]
+    assert list(shares) == [0.25, 0.75]
+
+
+class TestSharesOfProcess:
+    def test_existing_process(self, grouped_shares):
+        energy_carrier_ids, shares = share_utils.shares_of_process(grouped_shares, 2, 20)
+        assert list(energy_carrier_ids) == [100]
+        assert list(shares) == [1.0]
+
+    def test_missing_process(self, grouped_shares):
+        energy_carrier_ids, shares = share_utils.shares_of_process(grouped_shares, 2, 30)
+        assert len(energy_carrier_ids) == 0
+        assert len(shares) == 0
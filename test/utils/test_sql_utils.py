@@ -0,0 +1,15 @@
+# © 2024-2026 Fraunhofer-Gesellschaft e.V., München
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from utils import sql_utils
+
+
+def test_placeholders():
+    result = sql_utils.placeholders([5, 22, 32])
+    assert result == '?, ?, ?'
+
+
+def test_select_query():
+    result = sql_utils.select_query('foo', ['id', 'baa'])
+    assert result == 'SELECT id, baa from foo'
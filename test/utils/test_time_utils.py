@@ -4,13 +4,23 @@
 
 from math import isclose
 
+import numpy as np
+import pytest
+
+from utils import numba_utils
 from utils.time_utils import (
     create_time_span,
+    exponential_decrease,
+    exponential_decrease_years,
     interpolate,
     interpolate_cost,
+    interpolate_cost_years,
+    interpolate_years,
     to_year_strings,
 )
 
+YEARS = np.arange(2015, 2051, dtype=np.int64)
+
 
 def test_create_time_span():
     time_span = create_time_span(2015, 2017)
@@ -52,3 +62,24 @@ def test_exponential_decrease():
     year = 2025
     result = interpolate_cost(year, value_2015, value_2030, value_2050)
     assert isclose(result, 29.3558735)
+
+
+@pytest.mark.parametrize('kernel', [interpolate_years, numba_utils.python_function(interpolate_years)])
+def test_interpolate_years(kernel):
+    values = kernel(YEARS, 2.3, 17.1)
+    assert values.tolist() == [interpolate(year, 2.3, 17.1) for year in YEARS.tolist()]
+
+
+@pytest.mark.parametrize('kernel', [interpolate_cost_years, numba_utils.python_function(interpolate_cost_years)])
+def test_interpolate_cost_years(kernel):
+    values = kernel(YEARS, 2.3, 10.7, 17.1)
+    assert values.tolist() == [interpolate_cost(year, 2.3, 10.7, 17.1) for year in YEARS.tolist()]
+
+
+@pytest.mark.parametrize(
+    'kernel',
+    [exponential_decrease_years, numba_utils.python_function(exponential_decrease_years)],
+)
+def test_exponential_decrease_years(kernel):
+    values = kernel(YEARS, 2.3, 10.7, 17.1)
+    assert values.tolist() == [exponential_decrease(year, 2.3, 10.7, 17.1) for year in YEARS.tolist()]
@@ -109,3 +109,45 @@ def test__check_export_column_names(sut):
     with patch('builtins.print') as patched_print:
         sut._check_export_column_names(data_frame)
         assert patched_print.called
+
+
+class TestPartialResults:
+    def test_partial_visitor(self, sut):
+        with patch('utils.file_utils.create_folder_if_not_exists'):
+            partial_visitor = sut.create_partial_visitor([1])
+        partial_visitor._export_site_df = MagicMock()
+        production_unit = MagicMock(id=3)
+        production_unit.process.id = 7
+        region_mock = MagicMock()
+        region_mock.site_df = lambda: pd.DataFrame({'id': [1]})
+        region_mock.sites = [MagicMock(id=1, production_units=[production_unit])]
+
+        partial_visitor.visit_region(region_mock, year=2020)
+
+        assert not partial_visitor._export_site_df.called
+        _site_df, unit_process_ids = partial_visitor.partial_results()[2020]
+        assert unit_process_ids == {1: [(3, 7)]}
+
+    def test_merge_partial_results(self, sut):
+        sut._export_site_df = MagicMock()
+        site_df = pd.DataFrame({'id_comp': [10, 20]}, index=[1, 2])
+
+        sut.merge_partial_results({2020: (site_df, {1: [(4, 7), (3, 8)], 2: [(5, 9)]})})
+
+        sut._export_site_df.assert_called_once_with(site_df, 2020)
+        assert list(site_df['proc_ids']) == ['[8, 7], [9]'] * 2
+
+    def test_combine_partial_results(self, sut):
+        with patch('utils.file_utils.create_folder_if_not_exists'):
+            partial_visitor = sut.create_partial_visitor([1])
+        site_df = pd.DataFrame({'id_comp': [10, 30]}, index=[1, 3])
+        other_site_df = pd.DataFrame({'id_comp': [10, 20]}, index=[1, 2])
+
+        partial_visitor.merge_partial_results({2020: (site_df, {1: [(4, 7)], 3: [(6, 8)]})})
+        partial_visitor.merge_partial_results({2020: (other_site_df, {1: [(3, 9)], 2: [(5, 9)]})})
+        partial_visitor.merge_partial_results({2020: (site_df[0:0], {})})
+
+        combined_site_df, unit_process_ids = partial_visitor.partial_results()[2020]
+        assert list(combined_site_df.index) == [1, 2, 3]
+        assert unit_process_ids == {1: [(4, 7), (3, 9)], 2: [(5, 9)], 3: [(6, 8)]}
+        assert partial_visitor._join_process_ids(combined_site_df, unit_process_ids) == '[9, 7], [9], [8]'
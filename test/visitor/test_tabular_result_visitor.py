@@ -179,3 +179,49 @@ def test__base_row(sut):
     sut._id_process = 10000
     result = sut._base_row()
     assert result == [1, 10, 100, 1000, 10000]
+
+
+class TestPartialResults:
+    def test_create_partial_visitor(self, sut):
+        result = sut.create_partial_visitor([5, 3])
+        assert isinstance(result, TabularResultVisitor)
+        assert result is not sut
+        assert result._region_positions == {5: 0, 3: 1}
+
+    def test_partial_results(self, sut):
+        partial_visitor = sut.create_partial_visitor([5, 3])
+        partial_visitor.visit_region(MagicMock(id=3), year=2020)
+        partial_visitor.visit_site(MagicMock(id=30), year=2020)
+        partial_visitor.visit_production_unit(MagicMock(id=300), year=2020)
+        partial_visitor._production_df.loc[(1, 3, 30, 300, 3000, 30000), 'Y2020'] = 1.0
+        partial_visitor.visit_region(MagicMock(id=5), year=2021)
+        partial_visitor.visit_site(MagicMock(id=50), year=2021)
+        partial_visitor.visit_production_unit(MagicMock(id=500), year=2021)
+        partial_visitor._production_df.loc[(1, 5, 50, 500, 5000, 50000), 'Y2021'] = 2.0
+        partial_visitor._production_df.loc[(1, 5, 50, 500, 5000, 50001), 'Y2021'] = 3.0
+        partial_visitor.visit_production_unit(MagicMock(id=501), year=2021)
+
+        result = partial_visitor.partial_results()
+
+        production_df, row_keys = result['_production_df']
+        assert production_df is partial_visitor._production_df
+        assert row_keys == [(2020, 1, 30, 300), (2021, 0, 50, 500), (2021, 0, 50, 500)]
+        assert result['_opex_df'][1] == []
+
+    def test_merge_partial_results(self, sut):
+        first_df = pd.DataFrame({'id_region': [1, 3], 'Y2021': [10.0, 30.0]}).set_index(['id_region'])
+        second_df = pd.DataFrame({'id_region': [2], 'Y2020': [2.0], 'Y2021': [20.0]}).set_index(['id_region'])
+
+        sut.merge_partial_results({'_production_df': (first_df, [(2020, 0), (2021, 2)])})
+        sut.merge_partial_results(
+            {
+                '_production_df': (second_df, [(2020, 1)]),
+                '_opex_df': (sut._empty_base_table(), []),
+            },
+        )
+
+        assert list(sut._production_df.columns) == ['Y2020', 'Y2021']
+        assert list(sut._production_df.index) == [1, 2, 3]
+        assert sut._production_df.loc[2, 'Y2020'] == 2.0
+        assert sut._opex_df.empty
+        assert sut.partial_results()['_production_df'][1] == [(2020, 0), (2020, 1), (2021, 2)]
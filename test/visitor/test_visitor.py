@@ -42,3 +42,18 @@ def test_visit_process(sut):
 def test_finalize(sut):
     with pytest.raises(NotImplementedError):
         sut.finalize()
+
+
+def test_create_partial_visitor(sut):
+    with pytest.raises(NotImplementedError):
+        sut.create_partial_visitor(region_ids=[])
+
+
+def test_partial_results(sut):
+    with pytest.raises(NotImplementedError):
+        sut.partial_results()
+
+
+def test_merge_partial_results(sut):
+    with pytest.raises(NotImplementedError):
+        sut.merge_partial_results(partial_results=None)